@@ -0,0 +1,56 @@
+"""
+Measures the cost of constructing objects which parse timestamps, using the
+library's RFC 3339 parser and dateutil's generic parser.
+
+Run with `python benchmarks/datetime_parsing.py`.
+"""
+
+import os
+import sys
+import timeit
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from dateutil import parser
+
+import rblxopencloud
+from rblxopencloud import datastore
+
+TIMESTAMP = "2024-01-01T12:34:56.1234567Z"
+NUMBER = 20000
+
+
+def construct_entry_info():
+    return rblxopencloud.EntryInfo("1", TIMESTAMP, TIMESTAMP, [], {})
+
+
+def construct_entry_version():
+    return rblxopencloud.EntryVersion(
+        "1", False, 1, TIMESTAMP, TIMESTAMP, None, "key", "global"
+    ).created
+
+
+def measure(function) -> float:
+    return min(timeit.repeat(function, number=NUMBER, repeat=5)) / NUMBER
+
+
+def main():
+    print(f"{'object':<15} {'dateutil':>12} {'rfc3339':>12} {'speedup':>8}")
+
+    for name, function in (
+        ("EntryInfo", construct_entry_info),
+        ("EntryVersion", construct_entry_version),
+    ):
+        with mock.patch.object(datastore, "_parse_datetime", parser.parse):
+            before = measure(function)
+        after = measure(function)
+
+        print(
+            f"{name:<15} {before * 1e6:>10.2f}us {after * 1e6:>10.2f}us \
+{before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
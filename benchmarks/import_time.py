@@ -0,0 +1,71 @@
+"""
+Measures how long a fresh interpreter takes to import the library for a few
+common uses, and how many modules each use loads. Every import is timed inside
+its own interpreter, so the interpreter's startup time isn't included and
+nothing is imported beforehand. The last row imports every submodule and
+crypto dependency, which is what importing the package used to do.
+
+Run with `python benchmarks/import_time.py`.
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+REPEAT = 10
+
+TIMER = """
+import sys, time
+modules = len(sys.modules)
+started = time.perf_counter()
+{code}
+print(time.perf_counter() - started, len(sys.modules) - modules)
+"""
+
+CASES = (
+    ("package", "import rblxopencloud"),
+    (
+        "MemoryStoreQueue",
+        "import rblxopencloud; rblxopencloud.MemoryStoreQueue",
+    ),
+    ("DataStore", "import rblxopencloud; rblxopencloud.DataStore"),
+    (
+        "async DataStore",
+        "import rblxopencloudasync; rblxopencloudasync.DataStore",
+    ),
+    ("star import", "from rblxopencloud import *"),
+    (
+        "everything",
+        "from rblxopencloud import *; import nacl.public, jwt, \
+cryptography.hazmat.primitives.serialization",
+    ),
+)
+
+
+def measure(code: str) -> tuple[float, int]:
+    timings = []
+
+    for _ in range(REPEAT):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(code=code)],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        timings.append((float(output[0]), int(output[1])))
+
+    return min(timings)
+
+
+def main():
+    print(f"{'import':<20} {'time':>10} {'modules':>8}")
+
+    for name, code in CASES:
+        seconds, modules = measure(code)
+        print(f"{name:<20} {seconds * 1e3:>8.1f}ms {modules:>8}")
+
+
+if __name__ == "__main__":
+    main()
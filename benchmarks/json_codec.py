@@ -0,0 +1,73 @@
+"""
+Measures encoding and decoding large data store values and list pages with
+the standard library codec and the orjson codec.
+
+Run with `python benchmarks/json_codec.py`. Requires orjson to be installed.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import rblxopencloud
+
+VALUE = {
+    "inventory": [
+        {"id": index, "name": f"item-{index}", "count": index % 7, "x": 0.5}
+        for index in range(20000)
+    ],
+    "settings": {"music": True, "volume": 0.8, "language": "en-us"},
+}
+KEYS_PAGE = {
+    "keys": [
+        {"scope": "global", "key": f"user-{index}"} for index in range(100)
+    ],
+    "nextPageCursor": "eyJ2ZXJzaW9uIjoxLCJjdXJzb3IiOiIxMDAifQ==",
+}
+SORTED_PAGE = {
+    "entries": [
+        {
+            "path": f"universes/0/orderedDataStores/board/scopes/global/\
+entries/{index}",
+            "id": str(index),
+            "value": index * 10,
+        }
+        for index in range(100)
+    ],
+    "nextPageToken": "AQ==",
+}
+NUMBER = 20
+
+
+def measure(function) -> float:
+    return min(timeit.repeat(function, number=NUMBER, repeat=5)) / NUMBER
+
+
+def main():
+    codecs = (rblxopencloud.JSONCodec(), rblxopencloud.OrjsonCodec())
+
+    print(f"{'payload':<22} {'json':>12} {'orjson':>12} {'speedup':>8}")
+
+    for name, payload in (
+        ("datastore value", VALUE),
+        ("list keys page", KEYS_PAGE),
+        ("sort keys page", SORTED_PAGE),
+    ):
+        encoded = codecs[0].dumps(payload).encode()
+
+        for operation, function in (
+            ("dumps", lambda codec: lambda: codec.dumps(payload)),
+            ("loads", lambda codec: lambda: codec.loads(encoded)),
+        ):
+            before, after = (measure(function(codec)) for codec in codecs)
+
+            print(
+                f"{f'{name} {operation}':<22} {before * 1e6:>10.1f}us \
+{after * 1e6:>10.1f}us {before / after:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
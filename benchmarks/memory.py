@@ -0,0 +1,75 @@
+"""
+Measures the memory used by a large listing of entries, comparing the
+library's slotted model classes against equivalent classes with an instance
+`__dict__`.
+
+Run with `python benchmarks/memory.py`.
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import rblxopencloud
+from rblxopencloud.utils import _parse_datetime
+
+TIMESTAMP = "2024-01-01T12:34:56.1234567Z"
+COUNT = 1000000
+
+
+class DictListedEntry:
+    def __init__(self, key, scope) -> None:
+        self.key = key
+        self.scope = scope
+
+
+class DictEntryInfo:
+    def __init__(self, version, created, updated, users, metadata) -> None:
+        self.version = version
+        self.created = _parse_datetime(created)
+        self.updated = _parse_datetime(updated)
+        self.users = users
+        self.metadata = metadata
+
+
+def measure(factory) -> int:
+    tracemalloc.start()
+    objects = [factory(index) for index in range(COUNT)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del objects
+    return size
+
+
+def main():
+    print(f"{'object':<15} {'__dict__':>12} {'__slots__':>12} {'saving':>8}")
+
+    for name, before, after in (
+        (
+            "ListedEntry",
+            lambda index: DictListedEntry(f"key-{index}", "global"),
+            lambda index: rblxopencloud.ListedEntry(f"key-{index}", "global"),
+        ),
+        (
+            "EntryInfo",
+            lambda index: DictEntryInfo(
+                str(index), TIMESTAMP, TIMESTAMP, [], {}
+            ),
+            lambda index: rblxopencloud.EntryInfo(
+                str(index), TIMESTAMP, TIMESTAMP, [], {}
+            ),
+        ),
+    ):
+        before, after = measure(before), measure(after)
+
+        print(
+            f"{name:<15} {before / 2**20:>10.1f}MB {after / 2**20:>10.1f}MB \
+{1 - after / before:>7.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
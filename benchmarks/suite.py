@@ -0,0 +1,324 @@
+"""
+Measures the library's hot paths in both packages against an in-process
+`rblxopencloud.Emulator`, and compares the results with the stored baselines
+in `benchmarks/baseline.json`.
+
+Run with `python benchmarks/suite.py`. Options:
+
+    --only NAME [NAME ...]  only run the named benchmarks
+    --threshold FRACTION    the slowdown reported as a regression, default 0.5
+    --save                  replace the baselines with this run's results
+
+It exits with status 1 if any benchmark regressed. Baselines depend on the
+machine they were recorded on, so save new ones before comparing elsewhere.
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import rblxopencloud
+import rblxopencloudasync
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+TIMESTAMP = "2024-01-01T12:34:56.1234567Z"
+ENTRY_PATH = "datastores/v1/universes/0/standard-datastores/datastore/\
+entries/entry"
+LISTED_KEYS = 1000
+FAN_OUT = 50
+FAN_OUT_WORKERS = 25
+FAN_OUT_LATENCY = 0.02
+REPEAT = 5
+
+BENCHMARKS = {}
+
+
+def benchmark(number: int):
+    """
+    Registers a benchmark. The decorated function receives the shared \
+    context, sets up anything it needs, and returns a callable which is \
+    timed `number` times per repeat.
+    """
+
+    def decorator(function):
+        BENCHMARKS[function.__name__] = (function, number)
+        return function
+
+    return decorator
+
+
+class Context:
+    def __init__(self) -> None:
+        self.emulator = rblxopencloud.Emulator()
+        self.client = rblxopencloud.Client(base_url=self.emulator.base_url)
+        self.experience = rblxopencloud.Experience(
+            0, "key", client=self.client
+        )
+
+        datastore = self.experience.get_datastore("bench")
+        datastore.set_entry("entry", {"coins": 10, "items": [1, 2, 3]})
+
+        self.slow_emulator = rblxopencloud.Emulator(
+            latency_seconds=FAN_OUT_LATENCY
+        )
+        self.cleanups = []
+
+    def close(self) -> None:
+        for cleanup in self.cleanups:
+            cleanup()
+
+        self.client.close()
+        self.emulator.close()
+        self.slow_emulator.close()
+
+
+@benchmark(number=300)
+def session_request(context: Context):
+    url = f"{context.emulator.base_url}{ENTRY_PATH}"
+    params = {"datastoreName": "bench", "entryKey": "entry"}
+
+    return lambda: context.client.session.get(
+        url, params=params, headers={"x-api-key": "key"}
+    ).json()
+
+
+@benchmark(number=300)
+def send_request(context: Context):
+    params = {"datastoreName": "bench", "entryKey": "entry"}
+
+    return lambda: rblxopencloud.send_request(
+        "GET",
+        ENTRY_PATH,
+        "key",
+        expected_status=[200],
+        params=params,
+        client=context.client,
+    )
+
+
+@benchmark(number=3)
+def iterate_request(context: Context):
+    datastore = context.experience.get_datastore("listing")
+
+    # the keys are added directly with the session, as the library's own
+    # requests would make the setup dominate the run time
+    for index in range(LISTED_KEYS):
+        context.client.session.post(
+            f"{context.emulator.base_url}{ENTRY_PATH}",
+            params={"datastoreName": "listing", "entryKey": f"key-{index}"},
+            headers={"x-api-key": "key", "content-type": "application/json"},
+            data=b"1",
+        )
+
+    def run():
+        count = sum(1 for _ in datastore.list_keys())
+        assert count == LISTED_KEYS, count
+
+    return run
+
+
+@benchmark(number=20000)
+def entry_info(context: Context):
+    return lambda: rblxopencloud.EntryInfo(
+        "1", TIMESTAMP, TIMESTAMP, [1], {"a": 1}
+    ).created
+
+
+@benchmark(number=20000)
+def sorted_map_entry(context: Context):
+    data = {
+        "path": "universes/0/memory-store/sorted-maps/bench/items/key",
+        "id": "key",
+        "value": {"coins": 10},
+        "etag": "1",
+        "expireTime": TIMESTAMP,
+        "numericSortKey": 5,
+    }
+
+    return lambda: rblxopencloud.SortedMapEntry(data).expires_at
+
+
+@benchmark(number=20000)
+def group_member(context: Context):
+    data = {
+        "path": "groups/1/memberships/abc",
+        "createTime": TIMESTAMP,
+        "updateTime": TIMESTAMP,
+        "user": "users/1",
+        "role": "groups/1/roles/2",
+    }
+
+    return lambda: rblxopencloud.GroupMember(data, "key").joined_at
+
+
+@benchmark(number=5000)
+def process_notification(context: Context):
+    secret = b"webhook-secret"
+    webhook = rblxopencloud.Webhook(secret)
+
+    @webhook.event
+    def on_test(notification):
+        pass
+
+    body = json.dumps(
+        {
+            "NotificationId": "00000000-0000-0000-0000-000000000000",
+            "EventType": "SampleNotification",
+            "EventTime": TIMESTAMP,
+            "EventPayload": {"UserId": 1},
+        }
+    ).encode()
+
+    # signatures are valid for 10 minutes, which outlasts the benchmark
+    timestamp = str(int(time.time()))
+    signature = base64.b64encode(
+        hmac.new(
+            secret, timestamp.encode() + b"." + body, hashlib.sha256
+        ).digest()
+    ).decode()
+    header = f"t={timestamp},v1={signature}"
+
+    def run():
+        response = webhook.process_notification(body, header)
+        assert response == ("", 204), response
+
+    return run
+
+
+@benchmark(number=200)
+def update_secret(context: Context):
+    context.experience.create_secret("bench", "value")
+
+    return lambda: context.experience.update_secret("bench", "value")
+
+
+@benchmark(number=3)
+def fan_out_sync(context: Context):
+    client = rblxopencloud.Client(
+        base_url=context.slow_emulator.base_url, pool_size=FAN_OUT_WORKERS
+    )
+    datastore = rblxopencloud.Experience(
+        0, "key", client=client
+    ).get_datastore("bench")
+    datastore.set_entry("entry", 1)
+    executor = ThreadPoolExecutor(FAN_OUT_WORKERS)
+    context.cleanups += [executor.shutdown, client.close]
+
+    return lambda: list(
+        executor.map(lambda _: datastore.get_entry("entry"), range(FAN_OUT))
+    )
+
+
+@benchmark(number=3)
+def fan_out_async(context: Context):
+    loop = asyncio.new_event_loop()
+
+    async def setup():
+        return rblxopencloudasync.Client(
+            base_url=context.slow_emulator.base_url,
+            pool_size=FAN_OUT_WORKERS,
+        )
+
+    client = loop.run_until_complete(setup())
+    datastore = rblxopencloudasync.Experience(
+        0, "key", client=client
+    ).get_datastore("bench")
+    context.cleanups += [
+        lambda: loop.run_until_complete(client.close()),
+        loop.close,
+    ]
+    loop.run_until_complete(datastore.set_entry("entry", 1))
+
+    async def fan_out():
+        await asyncio.gather(
+            *(datastore.get_entry("entry") for _ in range(FAN_OUT))
+        )
+
+    return lambda: loop.run_until_complete(fan_out())
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS)
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--save", action="store_true")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as file:
+            baseline = json.load(file)["results"]
+
+    context = Context()
+    results, regressions = {}, []
+
+    print(f"{'benchmark':<22} {'baseline':>10} {'current':>10} {'change':>8}")
+
+    try:
+        for name in args.only or BENCHMARKS:
+            function, number = BENCHMARKS[name]
+            run = function(context)
+
+            results[name] = (
+                min(timeit.repeat(run, number=number, repeat=REPEAT)) / number
+            )
+
+            line = f"{name:<22} "
+            if name in baseline:
+                change = results[name] / baseline[name] - 1
+                line += f"{format_seconds(baseline[name]):>10} "
+                line += f"{format_seconds(results[name]):>10} "
+                line += f"{change:>+8.1%}"
+
+                if change > args.threshold:
+                    regressions.append(name)
+                    line += "  REGRESSION"
+            else:
+                line += f"{'-':>10} {format_seconds(results[name]):>10}"
+
+            print(line)
+    finally:
+        context.close()
+
+    if args.save:
+        with open(BASELINE_PATH, "w") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": {**baseline, **results},
+                },
+                file,
+                indent=4,
+            )
+            file.write("\n")
+
+        print(f"saved baselines to {BASELINE_PATH}")
+    elif regressions:
+        print(
+            f"{len(regressions)} benchmark(s) regressed more than \
+{args.threshold:.0%}: {', '.join(regressions)}"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,9 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Literal
-
-import requests
+from typing import TYPE_CHECKING, Literal
 
 VERSION: str = "2.2.5"
 VERSION_INFO: Literal["alpha", "beta", "final"] = "final"
@@ -30,18 +28,145 @@ VERSION_INFO: Literal["alpha", "beta", "final"] = "final"
 user_agent: str = (
     f"rblx-open-cloud/{VERSION} (https://github.com/treeben77/rblx-open-cloud)"
 )
-http_session: requests.Session = requests.Session()
-
-del Literal, requests
-
-from .apikey import *
-from .creator import *
-from .datastore import *
-from .exceptions import *
-from .experience import *
-from .group import *
-from .http import *
-from .memorystore import *
-from .oauth2 import *
-from .user import *
-from .webhook import *
+http_session: "requests.Session"
+
+if TYPE_CHECKING:
+    import requests
+
+    from .apikey import *
+    from .backup import *
+    from .cassette import *
+    from .creator import *
+    from .datastore import *
+    from .emulator import *
+    from .exceptions import *
+    from .experience import *
+    from .group import *
+    from .http import *
+    from .memorystore import *
+    from .metrics import *
+    from .oauth2 import *
+    from .user import *
+    from .webhook import *
+
+del Literal
+
+# submodules are imported the first time one of their names is used, so
+# importing the package doesn't load every dependency up front
+_exports: dict[str, str] = {
+    "ApiKey": "apikey",
+    "DataStoreExporter": "backup",
+    "DataStoreImporter": "backup",
+    "DataStoreMirror": "backup",
+    "MirrorChange": "backup",
+    "Cassette": "cassette",
+    "AssetType": "creator",
+    "ModerationStatus": "creator",
+    "Asset": "creator",
+    "AssetVersion": "creator",
+    "Creator": "creator",
+    "CreatorStoreProduct": "creator",
+    "Money": "creator",
+    "ProductRestriction": "creator",
+    "EntryInfo": "datastore",
+    "EntryVersion": "datastore",
+    "ListedEntry": "datastore",
+    "EntryColumns": "datastore",
+    "DataStore": "datastore",
+    "SortedEntry": "datastore",
+    "OrderedDataStore": "datastore",
+    "BulkWriteResult": "datastore",
+    "EntryCache": "datastore",
+    "LRUEntryCache": "datastore",
+    "IncrementBuffer": "datastore",
+    "Emulator": "emulator",
+    "BaseException": "exceptions",
+    "Conflict": "exceptions",
+    "HttpException": "exceptions",
+    "NotFound": "exceptions",
+    "RateLimited": "exceptions",
+    "Forbidden": "exceptions",
+    "PreconditionFailed": "exceptions",
+    "InvalidFile": "exceptions",
+    "InvalidCode": "exceptions",
+    "ModeratedText": "exceptions",
+    "UnknownEventType": "exceptions",
+    "UnhandledEventType": "exceptions",
+    "UnmatchedRequest": "exceptions",
+    "Experience": "experience",
+    "ExperienceAgeRating": "experience",
+    "ExperienceSocialLink": "experience",
+    "PaymentProvider": "experience",
+    "Place": "experience",
+    "Platform": "experience",
+    "Secret": "experience",
+    "Subscription": "experience",
+    "SubscriptionExpirationReason": "experience",
+    "SubscriptionState": "experience",
+    "UserRestriction": "experience",
+    "Group": "group",
+    "GroupMember": "group",
+    "GroupRole": "group",
+    "GroupRolePermissions": "group",
+    "GroupShout": "group",
+    "GroupJoinRequest": "group",
+    "send_request": "http",
+    "iterate_request": "http",
+    "Operation": "http",
+    "Client": "http",
+    "RateLimiter": "http",
+    "JSONCodec": "http",
+    "OrjsonCodec": "http",
+    "RequestEvent": "http",
+    "RequestHook": "http",
+    "TransportResponse": "http",
+    "SortedMap": "memorystore",
+    "SortedMapEntry": "memorystore",
+    "MemoryStoreQueue": "memorystore",
+    "MetricsCollector": "metrics",
+    "Resources": "oauth2",
+    "AccessTokenInfo": "oauth2",
+    "PartialAccessToken": "oauth2",
+    "AccessToken": "oauth2",
+    "OAuth2App": "oauth2",
+    "User": "user",
+    "InventoryAssetType": "user",
+    "InventoryItemState": "user",
+    "InventoryItem": "user",
+    "InventoryAsset": "user",
+    "InventoryBadge": "user",
+    "InventoryGamePass": "user",
+    "InventoryPrivateServer": "user",
+    "UserSocialLinks": "user",
+    "UserVisibility": "user",
+    "UserExperienceFollowing": "user",
+    "Webhook": "webhook",
+    "Notification": "webhook",
+    "TestNotification": "webhook",
+    "RightToErasureRequestNotification": "webhook",
+}
+
+__all__ = tuple(_exports)
+
+
+def __getattr__(name: str):
+    import importlib
+
+    if name == "http_session":
+        import requests
+
+        value = requests.Session()
+    elif name in _exports:
+        module = importlib.import_module(f".{_exports[name]}", __name__)
+        value = getattr(module, name)
+    elif name in set(_exports.values()):
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_exports, *_exports.values()})
@@ -0,0 +1,864 @@
+# MIT License
+
+# Copyright (c) 2022-2025 treeben77
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import datetime
+from itertools import islice
+import json
+import os
+import sqlite3
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+from .datastore import (
+    BulkWriteResult,
+    DataStore,
+    EntryInfo,
+    EntryVersion,
+    _is_retryable,
+    _map_concurrently,
+)
+from .exceptions import NotFound
+
+if TYPE_CHECKING:
+    from .experience import Experience
+
+__all__ = (
+    "DataStoreExporter",
+    "DataStoreImporter",
+    "DataStoreMirror",
+    "MirrorChange",
+)
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    datastore TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    version TEXT,
+    created TEXT,
+    updated TEXT,
+    users TEXT,
+    metadata TEXT,
+    PRIMARY KEY (datastore, scope, key)
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    name TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS changes (
+    sequence INTEGER PRIMARY KEY AUTOINCREMENT,
+    datastore TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    version TEXT
+);
+"""
+
+
+def _entry_record(
+    datastore: str,
+    scope: str,
+    key: str,
+    value: Union[str, dict, list, int, float],
+    info: EntryInfo,
+) -> dict:
+    return {
+        "datastore": datastore,
+        "scope": scope,
+        "key": key,
+        "value": value,
+        "version": info.version,
+        "created": info.created.isoformat(),
+        "updated": info.updated.isoformat(),
+        "users": info.users,
+        "metadata": info.metadata,
+    }
+
+
+class _JSONLDump:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.__file = None
+
+    def checkpoint(self, name: str) -> dict:
+        try:
+            with open(f"{self.path}.{name}.json", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def save(self, records: Iterable[dict], name: str, state: dict) -> None:
+        if records:
+            if self.__file is None:
+                self.__file = open(self.path, "a", encoding="utf-8")
+
+            for record in records:
+                self.__file.write(json.dumps(record) + "\n")
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+
+        with open(f"{self.path}.{name}.tmp", "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        os.replace(f"{self.path}.{name}.tmp", f"{self.path}.{name}.json")
+
+    def clear(self) -> None:
+        self.close()
+        open(self.path, "w", encoding="utf-8").close()
+
+    def read(self) -> Iterable[dict]:
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    def close(self) -> None:
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+
+class _SQLiteDump:
+    COLUMNS = (
+        "datastore",
+        "scope",
+        "key",
+        "value",
+        "version",
+        "created",
+        "updated",
+        "users",
+        "metadata",
+    )
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.__connection = sqlite3.connect(path)
+        self.__connection.executescript(_SQLITE_SCHEMA)
+
+    def checkpoint(self, name: str) -> dict:
+        row = self.__connection.execute(
+            "SELECT state FROM checkpoints WHERE name = ?", (name,)
+        ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def __insert(self, records: Iterable[dict]) -> None:
+        self.__connection.executemany(
+            f"INSERT OR REPLACE INTO entries ({', '.join(self.COLUMNS)}) \
+VALUES ({', '.join('?' * len(self.COLUMNS))})",
+            [
+                (
+                    record["datastore"],
+                    record["scope"],
+                    record["key"],
+                    json.dumps(record["value"]),
+                    record["version"],
+                    record["created"],
+                    record["updated"],
+                    json.dumps(record["users"]),
+                    json.dumps(record["metadata"]),
+                )
+                for record in records
+            ],
+        )
+
+    def save(self, records: Iterable[dict], name: str, state: dict) -> None:
+        with self.__connection:
+            self.__insert(records)
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (name, state) \
+VALUES (?, ?)",
+                (name, json.dumps(state)),
+            )
+
+    def clear(self) -> None:
+        with self.__connection:
+            self.__connection.execute("DELETE FROM entries")
+
+    def read(self) -> Iterable[dict]:
+        for row in self.__connection.execute(
+            f"SELECT {', '.join(self.COLUMNS)} FROM entries ORDER BY rowid"
+        ):
+            record = dict(zip(self.COLUMNS, row))
+            for column in ("value", "users", "metadata"):
+                record[column] = json.loads(record[column])
+            yield record
+
+    def versions(
+        self, datastore: str, scope: Optional[str]
+    ) -> dict[tuple[str, str], tuple[str, str]]:
+        return {
+            (row[0], row[1]): (row[2], row[3])
+            for row in self.__connection.execute(
+                "SELECT scope, key, version, updated FROM entries \
+WHERE datastore = ? AND (? IS NULL OR scope = ?)",
+                (datastore, scope, scope),
+            )
+        }
+
+    def apply(
+        self,
+        datastore: str,
+        records: list[dict],
+        removed: list[tuple[str, str]],
+    ) -> None:
+        with self.__connection:
+            self.__insert(records)
+            self.__connection.executemany(
+                "DELETE FROM entries WHERE datastore = ? AND scope = ? \
+AND key = ?",
+                [(datastore, scope, key) for scope, key in removed],
+            )
+            self.__connection.executemany(
+                "INSERT INTO changes (datastore, scope, key, value, version) \
+VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        datastore,
+                        record["scope"],
+                        record["key"],
+                        json.dumps(record["value"]),
+                        record["version"],
+                    )
+                    for record in records
+                ]
+                + [
+                    (datastore, scope, key, None, None)
+                    for scope, key in removed
+                ],
+            )
+
+    def changes(
+        self, datastore: str, after: int, limit: Optional[int]
+    ) -> list[tuple]:
+        return self.__connection.execute(
+            "SELECT sequence, scope, key, value, version FROM changes \
+WHERE datastore = ? AND sequence > ? ORDER BY sequence LIMIT ?",
+            (datastore, after, -1 if limit is None else limit),
+        ).fetchall()
+
+    def prune_changes(self, datastore: str, up_to: int) -> None:
+        with self.__connection:
+            self.__connection.execute(
+                "DELETE FROM changes WHERE datastore = ? AND sequence <= ?",
+                (datastore, up_to),
+            )
+
+    def close(self) -> None:
+        self.__connection.close()
+
+
+def _open_dump(
+    path: str, format: Optional[str]
+) -> Union[_JSONLDump, _SQLiteDump]:
+    if format is None:
+        extension = os.path.splitext(path)[1].lower()
+        format = (
+            "sqlite"
+            if extension in (".db", ".sqlite", ".sqlite3")
+            else "jsonl"
+        )
+
+    if format == "jsonl":
+        return _JSONLDump(path)
+    elif format == "sqlite":
+        return _SQLiteDump(path)
+    else:
+        raise ValueError("format must be 'jsonl' or 'sqlite'.")
+
+
+class DataStoreExporter:
+    """
+    Exports every entry of an experience's data stores, in all scopes, to a \
+    JSONL or SQLite file. Keys are listed a page at a time and their values \
+    fetched concurrently, so memory use doesn't grow with the number of \
+    entries. After each page, the data store's cursor is saved as a \
+    checkpoint so an interrupted export resumes where it stopped when run \
+    again.
+
+    Each entry is written with its data store name, scope, key, value, \
+    version, created and updated times, users and metadata. JSONL exports \
+    store the checkpoint next to the file as `<path>.export.json`, while \
+    SQLite exports store it in the same database. A JSONL export may repeat \
+    the entries of the page it was interrupted during. Runs which don't \
+    resume a checkpoint replace the file's entries, so entries removed \
+    since the last export aren't kept.
+
+    Example:
+        ```py
+        exporter = rblxopencloud.DataStoreExporter(experience, "backup.db")
+        print(f"exported {exporter.run()} entries")
+        ```
+
+    Args:
+        experience: The experience to export data stores from.
+        path: The file to export to. Its entries are replaced unless an \
+        interrupted export is resumed.
+        format: Either `jsonl` or `sqlite`. If `None`, files ending in \
+        `.db`, `.sqlite` or `.sqlite3` are SQLite and all others are JSONL.
+        datastores: The names of the data stores to export. If `None`, \
+        every data store in the experience is exported.
+        concurrency: The maximum number of entries to fetch at once.
+        page_size: The number of keys to list and fetch at a time.
+
+    Attributes:
+        experience: The experience to export data stores from.
+        path: The file to export to.
+        format: The file format, or `None` to infer it from `path`.
+        datastores: The names of the data stores to export.
+        concurrency: The maximum number of entries to fetch at once.
+        page_size: The number of keys to list and fetch at a time.
+    """
+
+    def __init__(
+        self,
+        experience: "Experience",
+        path: str,
+        format: Optional[str] = None,
+        datastores: Optional[list[str]] = None,
+        concurrency: int = 10,
+        page_size: int = 100,
+    ) -> None:
+        self.experience: Experience = experience
+        self.path: str = path
+        self.format: Optional[str] = format
+        self.datastores: Optional[list[str]] = datastores
+        self.concurrency: int = concurrency
+        self.page_size: int = page_size
+
+    def __repr__(self) -> str:
+        return f'<rblxopencloud.DataStoreExporter path="{self.path}" \
+experience={repr(self.experience)}>'
+
+    def run(self, resume: bool = True) -> int:
+        """
+        Exports the data stores, resuming from the checkpoint if there is \
+        one. Any error fetching an entry, other than the key being removed \
+        since it was listed, stops the export and is raised. The checkpoint \
+        is cleared once every data store is exported, so the next run \
+        exports them all again.
+
+        Args:
+            resume: Whether to continue from the checkpoint of an \
+            interrupted run. If `False`, or there is no checkpoint, the \
+            file's entries are cleared and every data store is exported again.
+
+        Returns:
+            The number of entries exported by this run.
+        """
+
+        dump = _open_dump(self.path, self.format)
+        exported = 0
+
+        try:
+            state = dump.checkpoint("export") if resume else {}
+            if not state:
+                dump.clear()
+
+            state.setdefault("cursors", {})
+            finished = state.setdefault("finished", [])
+
+            if self.datastores is not None:
+                names = self.datastores
+            else:
+                names = [
+                    datastore.name
+                    for datastore in self.experience.list_datastores()
+                ]
+
+            for name in names:
+                if name in finished:
+                    continue
+
+                exported += self.__export_datastore(
+                    self.experience.get_datastore(name, scope=None),
+                    dump,
+                    state,
+                )
+
+            dump.save([], "export", {})
+        finally:
+            dump.close()
+
+        return exported
+
+    def __export_datastore(
+        self,
+        datastore: DataStore,
+        dump: Union[_JSONLDump, _SQLiteDump],
+        state: dict,
+    ) -> int:
+        cursor, exported = state["cursors"].get(datastore.name), 0
+
+        while True:
+            keys, cursor = datastore.list_keys_page(
+                cursor=cursor, limit=self.page_size
+            )
+
+            records = []
+            for entry, (_, result) in zip(
+                keys,
+                datastore.get_entries(
+                    [f"{entry.scope}/{entry.key}" for entry in keys],
+                    concurrency=self.concurrency,
+                ),
+            ):
+                if isinstance(result, NotFound):
+                    continue
+                elif isinstance(result, Exception):
+                    raise result
+
+                records.append(
+                    _entry_record(
+                        datastore.name, entry.scope, entry.key, *result
+                    )
+                )
+
+            if cursor:
+                state["cursors"][datastore.name] = cursor
+            else:
+                state["cursors"].pop(datastore.name, None)
+                state["finished"].append(datastore.name)
+
+            dump.save(records, "export", state)
+            exported += len(records)
+
+            if not cursor:
+                return exported
+
+
+class DataStoreImporter:
+    """
+    Restores entries from a JSONL or SQLite file written by \
+    [`DataStoreExporter`][rblxopencloud.DataStoreExporter], writing them \
+    with [`DataStore.set_entry`][rblxopencloud.DataStore.set_entry] and \
+    preserving their users and metadata. Entries are written concurrently \
+    and paced by the library's rate limiter. The number of records \
+    processed, and any later records already written, are saved as a \
+    checkpoint, so an interrupted import resumes where it stopped when run \
+    again without writing a record twice.
+
+    The `mode` decides how existing entries are treated:
+
+    | Mode               | Description |
+    | ------------------ | ----------- |
+    | `overwrite`        | Always write the exported value. |
+    | `exclusive_create` | Only write keys which don't have a value. |
+    | `match_version`    | Only write keys whose current version is the \
+        exported version. |
+
+    JSONL imports store the checkpoint next to the file as \
+    `<path>.import.json`, while SQLite imports store it in the same \
+    database.
+
+    Example:
+        ```py
+        importer = rblxopencloud.DataStoreImporter(
+            experience, "backup.db", mode="exclusive_create"
+        )
+        result = importer.run()
+        print(f"restored {len(result.succeeded)} entries")
+        ```
+
+    Args:
+        experience: The experience to restore data stores in.
+        path: The file to import from.
+        format: Either `jsonl` or `sqlite`. If `None`, files ending in \
+        `.db`, `.sqlite` or `.sqlite3` are SQLite and all others are JSONL.
+        mode: Either `overwrite`, `exclusive_create` or `match_version`.
+        concurrency: The maximum number of entries to write at once.
+        checkpoint_interval: How many records are processed between \
+        checkpoints.
+
+    Attributes:
+        experience: The experience to restore data stores in.
+        path: The file to import from.
+        format: The file format, or `None` to infer it from `path`.
+        mode: How existing entries are treated.
+        concurrency: The maximum number of entries to write at once.
+        checkpoint_interval: How many records are processed between \
+        checkpoints.
+    """
+
+    def __init__(
+        self,
+        experience: "Experience",
+        path: str,
+        format: Optional[str] = None,
+        mode: str = "overwrite",
+        concurrency: int = 10,
+        checkpoint_interval: int = 100,
+    ) -> None:
+        if mode not in ("overwrite", "exclusive_create", "match_version"):
+            raise ValueError(
+                "mode must be 'overwrite', 'exclusive_create' or \
+'match_version'."
+            )
+
+        self.experience: Experience = experience
+        self.path: str = path
+        self.format: Optional[str] = format
+        self.mode: str = mode
+        self.concurrency: int = concurrency
+        self.checkpoint_interval: int = checkpoint_interval
+        self.__datastores: dict[str, DataStore] = {}
+
+    def __repr__(self) -> str:
+        return f'<rblxopencloud.DataStoreImporter path="{self.path}" \
+mode="{self.mode}" experience={repr(self.experience)}>'
+
+    def run(self, resume: bool = True) -> BulkWriteResult:
+        """
+        Imports the file, resuming from the checkpoint if there is one. \
+        Entries are identified in the result as `datastore/scope/key`. \
+        Conflicts and errors that won't succeed if retried are recorded in \
+        the result and the import continues, but errors which may succeed \
+        if retried, such as [`RateLimited`][rblxopencloud.RateLimited], stop \
+        the import and are raised so it can be resumed later.
+
+        Args:
+            resume: Whether to skip the records processed by previous runs. \
+            If `False`, the whole file is imported again.
+
+        Returns:
+            The outcome of each entry imported by this run.
+        """
+
+        dump = _open_dump(self.path, self.format)
+        result = BulkWriteResult()
+        error = None
+
+        try:
+            state = dump.checkpoint("import") if resume else {}
+            processed = state.get("records", 0)
+
+            # records after the checkpoint which finished before a previous
+            # run stopped, as later records are written while earlier ones are
+            # still in flight
+            done = set(state.get("done", [])) if resume else set()
+
+            def records():
+                for index, record in enumerate(
+                    islice(dump.read(), processed, None), processed
+                ):
+                    if error is not None:
+                        return
+                    elif index not in done:
+                        yield index, record
+
+            def save():
+                state["records"] = processed
+                state["done"] = sorted(
+                    index for index in done if index >= processed
+                )
+                dump.save([], "import", state)
+
+            since_checkpoint = 0
+            for (index, record), outcome in _map_concurrently(
+                self.__write_record, records(), self.concurrency, True
+            ):
+                key = f"{record['datastore']}/{record['scope']}/\
+{record['key']}"
+                result._add(key, outcome)
+
+                if isinstance(outcome, Exception) and _is_retryable(outcome):
+                    # stop reading records, but wait for the ones in flight
+                    # so the checkpoint knows which of them were written
+                    error = error or outcome
+                elif error is not None:
+                    done.add(index)
+                else:
+                    processed = index + 1
+                    since_checkpoint += 1
+
+                    if since_checkpoint >= self.checkpoint_interval:
+                        since_checkpoint = 0
+                        save()
+
+            save()
+        finally:
+            dump.close()
+
+        if error is not None:
+            raise error
+
+        return result
+
+    def __write_record(self, item: tuple[int, dict]) -> EntryVersion:
+        _, record = item
+
+        datastore = self.__datastores.get(record["datastore"])
+        if datastore is None:
+            datastore = self.experience.get_datastore(
+                record["datastore"], scope=None
+            )
+            self.__datastores[record["datastore"]] = datastore
+
+        return datastore.set_entry(
+            f"{record['scope']}/{record['key']}",
+            record["value"],
+            users=record["users"],
+            metadata=record["metadata"],
+            exclusive_create=self.mode == "exclusive_create",
+            previous_version=(
+                record["version"] if self.mode == "match_version" else None
+            ),
+        )
+
+
+class MirrorChange:
+    """
+    A change to an entry found by \
+    [`DataStoreMirror.sync`][rblxopencloud.DataStoreMirror.sync].
+
+    Attributes:
+        sequence: The change's position in the change feed. Changes found \
+        later always have a greater sequence.
+        scope: The entry's scope.
+        key: The entry's key.
+        value: The entry's new value, or `None` if it was removed.
+        version: The entry's new version ID, or `None` if it was removed.
+        removed: Whether the entry was removed.
+    """
+
+    def __init__(self, sequence, scope, key, value, version) -> None:
+        self.sequence: int = sequence
+        self.scope: str = scope
+        self.key: str = key
+        self.value: Optional[Union[str, dict, list, int, float]] = value
+        self.version: Optional[str] = version
+        self.removed: bool = version is None
+
+    def __repr__(self) -> str:
+        return f'<rblxopencloud.MirrorChange sequence={self.sequence} \
+key="{self.key}" scope="{self.scope}" removed={self.removed}>'
+
+
+class DataStoreMirror:
+    """
+    Keeps a local SQLite copy of a data store up to date by only writing \
+    entries which changed since the last sync. The mirror records the \
+    version it last saw for each key, and compares it with the version read \
+    from Open Cloud. Every change found is appended to a change feed which \
+    downstream consumers can read with \
+    [`changes`][rblxopencloud.DataStoreMirror.changes].
+
+    Key listings don't include versions, so each known key is checked by \
+    listing the versions created since the mirrored one, which doesn't \
+    transfer the value. Only new and changed keys are read, but a full sync \
+    still costs one request per key plus one per page of keys listed. Pass \
+    the keys which may have changed to \
+    [`sync`][rblxopencloud.DataStoreMirror.sync] to avoid this.
+
+    The database uses the same layout as \
+    [`DataStoreExporter`][rblxopencloud.DataStoreExporter]'s SQLite exports, \
+    so a mirror can be restored with \
+    [`DataStoreImporter`][rblxopencloud.DataStoreImporter]. Several data \
+    stores can be mirrored to the same file.
+
+    Example:
+        ```py
+        with rblxopencloud.DataStoreMirror(
+            experience.get_datastore("PlayerData", scope=None), "mirror.db"
+        ) as mirror:
+            mirror.sync()
+
+            for change in mirror.changes(after=last_sequence):
+                print(change.key, change.value)
+        ```
+
+    Args:
+        datastore: The data store to mirror. If its scope is `None`, every \
+        scope is mirrored.
+        path: The SQLite file to store the mirror in.
+        concurrency: The maximum number of keys to check at once.
+
+    Attributes:
+        datastore: The data store being mirrored.
+        path: The SQLite file the mirror is stored in.
+        concurrency: The maximum number of keys to check at once.
+    """
+
+    def __init__(
+        self, datastore: DataStore, path: str, concurrency: int = 10
+    ) -> None:
+        self.datastore: DataStore = datastore
+        self.path: str = path
+        self.concurrency: int = concurrency
+        self.__dump = _SQLiteDump(path)
+
+    def __repr__(self) -> str:
+        return f'<rblxopencloud.DataStoreMirror path="{self.path}" \
+datastore={repr(self.datastore)}>'
+
+    def __enter__(self) -> "DataStoreMirror":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def sync(self, keys: Optional[Iterable[str]] = None) -> int:
+        """
+        Checks every key and stores the entries which changed since the \
+        last sync in the mirror. New keys are added, known keys are only \
+        read and updated if they have a newer version, and keys which were \
+        removed are removed from the mirror.
+
+        Args:
+            keys: The keys to check, in the `scope/key` syntax if the data \
+            store's scope is `None`. If `None`, every key in the data store \
+            is listed and checked, and keys which are no longer listed are \
+            removed. Pass the keys you know may have changed to avoid \
+            listing the whole data store.
+
+        Returns:
+            The number of changes found.
+        """
+
+        known = self.__dump.versions(self.datastore.name, self.datastore.scope)
+        listed = set()
+
+        records, removed, changes = [], [], 0
+        for _, result in _map_concurrently(
+            lambda name: self.__check(name, known),
+            self.__list_keys(listed) if keys is None else keys,
+            self.concurrency,
+            False,
+        ):
+            if isinstance(result, Exception):
+                raise result
+            elif isinstance(result, dict):
+                records.append(result)
+            elif result:
+                removed.append(result)
+
+            if len(records) + len(removed) >= 100:
+                self.__dump.apply(self.datastore.name, records, removed)
+                changes += len(records) + len(removed)
+                records, removed = [], []
+
+        if keys is None:
+            removed.extend(entry for entry in known if entry not in listed)
+
+        self.__dump.apply(self.datastore.name, records, removed)
+        return changes + len(records) + len(removed)
+
+    def changes(
+        self, after: int = 0, limit: Optional[int] = None
+    ) -> Iterable[MirrorChange]:
+        """
+        Iterates the changes found by previous syncs, oldest first.
+
+        Args:
+            after: Only iterate changes with a greater sequence than this. \
+            Store the last sequence you processed to resume from it.
+            limit: The maximum number of changes to iterate.
+        """
+
+        while limit is None or limit > 0:
+            rows = self.__dump.changes(
+                self.datastore.name,
+                after,
+                500 if limit is None else min(limit, 500),
+            )
+            if not rows:
+                break
+
+            for sequence, scope, key, value, version in rows:
+                yield MirrorChange(
+                    sequence,
+                    scope,
+                    key,
+                    json.loads(value) if value is not None else None,
+                    version,
+                )
+
+            after = rows[-1][0]
+            if limit is not None:
+                limit -= len(rows)
+
+    def prune_changes(self, up_to: int) -> None:
+        """
+        Deletes changes from the change feed once every consumer has \
+        processed them.
+
+        Args:
+            up_to: Delete changes with this sequence or lower.
+        """
+
+        self.__dump.prune_changes(self.datastore.name, up_to)
+
+    def close(self) -> None:
+        """
+        Closes the mirror's database.
+        """
+
+        self.__dump.close()
+
+    def __list_keys(self, listed: set) -> Iterable[str]:
+        for entry in self.datastore.list_keys():
+            listed.add((entry.scope, entry.key))
+
+            if self.datastore.scope:
+                yield entry.key
+            else:
+                yield f"{entry.scope}/{entry.key}"
+
+    def __check(
+        self, name: str, known: dict[tuple[str, str], tuple[str, str]]
+    ) -> Union[dict, tuple[str, str], None]:
+        if self.datastore.scope:
+            scope, key = self.datastore.scope, name
+        else:
+            scope, key = name.split("/", maxsplit=1)
+
+        current = known.get((scope, key))
+
+        # a known key's newest version is listed first, which doesn't
+        # transfer its value, so unchanged keys are never read
+        if current:
+            latest = next(
+                iter(
+                    self.datastore.list_versions(
+                        name,
+                        after=datetime.datetime.fromisoformat(current[1]),
+                        limit=1,
+                    )
+                ),
+                None,
+            )
+
+            if latest is None or latest.version == current[0]:
+                return None
+            elif latest.deleted:
+                return (scope, key)
+
+        try:
+            value, info = self.datastore.get_entry(name)
+        except NotFound:
+            return (scope, key) if current else None
+
+        if current and info.version == current[0]:
+            return None
+
+        return _entry_record(self.datastore.name, scope, key, value, info)
@@ -0,0 +1,335 @@
+# MIT License
+
+# Copyright (c) 2022-2025 treeben77
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import base64
+import gzip
+import threading
+import time
+import urllib.parse
+from collections import defaultdict, deque
+from typing import Callable, Optional
+
+from . import http
+from .exceptions import UnmatchedRequest
+from .http import (
+    TransportResponse,
+    _json_dumps,
+    _json_loads,
+    _key_fingerprint,
+)
+
+__all__ = ("Cassette",)
+
+_AUTHORIZATION_HEADERS = ("authorization", "x-api-key")
+_DROPPED_HEADERS = (
+    "connection",
+    "content-length",
+    "date",
+    "keep-alive",
+    "server",
+    "set-cookie",
+    "transfer-encoding",
+)
+_REDACTED_FIELDS = ("client_secret", "code", "refresh_token", "token")
+_REDACTED_RESPONSE_FIELDS = ("access_token", "id_token", "refresh_token")
+
+
+def _interaction_key(method: str, url: str, params: Optional[dict]) -> str:
+    url = urllib.parse.urlsplit(url)
+    query = urllib.parse.parse_qsl(url.query)
+
+    # the packages encode booleans differently, so recordings are matched
+    # the same way in both
+    for key, value in (params or {}).items():
+        if isinstance(value, bool):
+            query.append((key, str(value).lower()))
+        elif value is not None:
+            query.append((key, str(value)))
+
+    return (
+        f"{method.upper()} {url.path}?{urllib.parse.urlencode(sorted(query))}"
+    )
+
+
+def _encode_body(content: Optional[bytes], record: dict, field: str) -> None:
+    if not content:
+        return
+
+    try:
+        record[field] = content.decode()
+    except UnicodeDecodeError:
+        record[f"{field}64"] = base64.b64encode(content).decode()
+
+
+def _decode_body(record: dict, field: str) -> bytes:
+    if f"{field}64" in record:
+        return base64.b64decode(record[f"{field}64"])
+    return record.get(field, "").encode()
+
+
+def _redact_body(
+    data: Optional[bytes], headers: dict, fields: tuple = _REDACTED_FIELDS
+) -> Optional[bytes]:
+    content_type = next(
+        (
+            value
+            for header, value in headers.items()
+            if header.lower() == "content-type"
+        ),
+        "",
+    )
+
+    if not data:
+        return data
+
+    if "json" in content_type:
+        try:
+            body = _json_loads(data)
+        except ValueError:
+            return data
+
+        if not isinstance(body, dict) or not body.keys() & fields:
+            return data
+
+        return _json_dumps(
+            {
+                key: "REDACTED" if key in fields else value
+                for key, value in body.items()
+            }
+        ).encode()
+
+    if "x-www-form-urlencoded" not in content_type:
+        return data
+
+    return urllib.parse.urlencode(
+        [
+            (key, "REDACTED" if key in fields else value)
+            for key, value in urllib.parse.parse_qsl(data.decode())
+        ]
+    ).encode()
+
+
+class Cassette:
+    """
+    A transport for [`Client`][rblxopencloud.Client] which records requests \
+    and their responses to a file, and replays them later without sending \
+    anything. This reproduces real traffic, including pagination, retries \
+    and rate limits, for profiling and testing.
+
+    API keys and OAuth2 tokens are replaced with a fingerprint which can't \
+    be used to recover them. OAuth2 client secrets, codes and tokens sent \
+    in request bodies, and access, refresh and ID tokens returned in \
+    response bodies, are redacted. Each interaction is stored as a line of \
+    JSON, and the file is gzip compressed if its path ends with `.gz`.
+
+    When replaying, requests are matched on their method, path and query \
+    parameters. Repeated requests, such as retries, receive their recorded \
+    responses in the order they were recorded.
+
+    Example:
+        ```py
+        with rblxopencloud.Cassette("traffic.jsonl.gz", record=True) as tape:
+            client = rblxopencloud.Client(transport=tape)
+            experience = rblxopencloud.Experience(0, "api-key", client=client)
+            keys = list(experience.get_datastore("players").list_keys())
+
+        # later, without network access and twice as fast:
+        tape = rblxopencloud.Cassette("traffic.jsonl.gz", latency_scale=0.5)
+        client = rblxopencloud.Client(transport=tape)
+        ```
+
+    Args:
+        path: The file to record to or replay from.
+        record: Whether to send requests and record them. Otherwise the file \
+        is loaded and its responses are replayed.
+        transport: The transport used to send requests while recording. \
+        Defaults to the shared client's \
+        [`Client.request`][rblxopencloud.Client.request].
+        latency_scale: When replaying, each response arrives at the time it \
+        did while recording, counted from the first replayed request, or \
+        after its recorded latency if the request was sent late. Both are \
+        multiplied by this value, so the gaps between requests are replayed \
+        as well as their latency. `1` replays the original timing, and `0` \
+        or `None` replays without delays.
+
+    Attributes:
+        path: The file to record to or replay from.
+        record: Whether requests are sent and recorded.
+        latency_scale: The multiplier applied to recorded latencies when \
+        replaying.
+        interactions: The recorded interactions, in the order they were sent.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        record: bool = False,
+        transport: Optional[Callable[..., TransportResponse]] = None,
+        latency_scale: Optional[float] = 1,
+    ) -> None:
+        self.path: str = path
+        self.record: bool = record
+        self.latency_scale: Optional[float] = latency_scale
+        self.interactions: list[dict] = []
+
+        self.__transport: Optional[Callable[..., TransportResponse]] = (
+            transport
+        )
+        self.__lock: threading.Lock = threading.Lock()
+        self.__started: float = time.monotonic()
+        self.__replay_started: Optional[float] = None
+        self.__queues: dict[str, deque] = defaultdict(deque)
+
+        if not record:
+            self.load()
+
+    def __repr__(self) -> str:
+        return f'<rblxopencloud.Cassette path="{self.path}" \
+record={self.record} interactions={len(self.interactions)}>'
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, *_) -> None:
+        if self.record:
+            self.save()
+
+    def __open(self, mode: str):
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, f"{mode}t", encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
+
+    def load(self) -> None:
+        """
+        Loads the interactions from the file, and resets replaying to the \
+        first interaction.
+        """
+
+        with self.__open("r") as file:
+            self.interactions = [
+                _json_loads(line) for line in file if line.strip()
+            ]
+
+        with self.__lock:
+            self.__replay_started = None
+            self.__queues.clear()
+            for interaction in self.interactions:
+                self.__queues[interaction["key"]].append(interaction)
+
+    def __delay(self, interaction: dict) -> float:
+        now = time.monotonic()
+        offset = interaction["offset"] * self.latency_scale
+        latency = interaction["latency"] * self.latency_scale
+
+        with self.__lock:
+            if self.__replay_started is None:
+                self.__replay_started = now - offset
+
+            return max(latency, self.__replay_started + offset + latency - now)
+
+    def save(self) -> None:
+        """
+        Writes the recorded interactions to the file, replacing its contents.
+        """
+
+        with self.__lock:
+            lines = [_json_dumps(record) for record in self.interactions]
+
+        with self.__open("w") as file:
+            for line in lines:
+                file.write(f"{line}\n")
+
+    def __call__(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: Optional[dict] = None,
+        data: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> TransportResponse:
+        key = _interaction_key(method, url, params)
+
+        if not self.record:
+            with self.__lock:
+                queue = self.__queues.get(key)
+                if not queue:
+                    raise UnmatchedRequest(
+                        f"No recorded response left for '{key}'"
+                    )
+                interaction = queue.popleft()
+
+            if self.latency_scale:
+                time.sleep(self.__delay(interaction))
+
+            return TransportResponse(
+                interaction["status"],
+                interaction["headers"],
+                _decode_body(interaction, "body"),
+            )
+
+        sent_at = time.monotonic()
+        response = (self.__transport or http.default_client.request)(
+            method,
+            url,
+            headers,
+            params=params,
+            data=data,
+            timeout=timeout,
+            **kwargs,
+        )
+        latency = time.monotonic() - sent_at
+
+        authorization = next(
+            (
+                value
+                for header, value in headers.items()
+                if header.lower() in _AUTHORIZATION_HEADERS
+            ),
+            None,
+        )
+        interaction = {
+            "key": key,
+            "offset": round(sent_at - self.__started, 6),
+            "latency": round(latency, 6),
+            "api_key": _key_fingerprint(authorization),
+            "status": response.status,
+            "headers": {
+                header.lower(): value
+                for header, value in response.headers.items()
+                if header.lower() not in _DROPPED_HEADERS
+            },
+        }
+        _encode_body(_redact_body(data, headers), interaction, "request")
+        _encode_body(
+            _redact_body(
+                response.content, response.headers, _REDACTED_RESPONSE_FIELDS
+            ),
+            interaction,
+            "body",
+        )
+
+        with self.__lock:
+            self.interactions.append(interaction)
+
+        return response
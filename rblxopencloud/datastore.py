@@ -20,15 +20,34 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import abc
+from array import array
+import atexit
+from collections import OrderedDict, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+import copy
 import datetime
 import json
+import random
+import sys
+import threading
+import time
 import urllib.parse
-from typing import TYPE_CHECKING, Iterable, Optional, Union
-
-from dateutil import parser
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Union
 
-from .exceptions import HttpException, NotFound, PreconditionFailed
-from .http import iterate_request, send_request
+from .exceptions import (
+    HttpException,
+    NotFound,
+    PreconditionFailed,
+    RateLimited,
+)
+from .http import Client, iterate_request, send_request, _json_loads
+from .utils import _LazyAttribute, _parse_datetime
 
 if TYPE_CHECKING:
     from .experience import Experience
@@ -37,11 +56,74 @@ __all__ = (
     "EntryInfo",
     "EntryVersion",
     "ListedEntry",
+    "EntryColumns",
     "DataStore",
     "SortedEntry",
     "OrderedDataStore",
+    "BulkWriteResult",
+    "EntryCache",
+    "LRUEntryCache",
+    "IncrementBuffer",
 )
 
+# cache invalidations are counted in a fixed number of stripes so the
+# counters use constant memory, at the cost of rare unnecessary cache misses
+_CACHE_GENERATIONS = 256
+
+
+def _is_retryable(error: Exception) -> bool:
+    return isinstance(error, (RateLimited, OSError)) or (
+        isinstance(error, HttpException) and (error.status_code or 0) >= 500
+    )
+
+
+def _map_concurrently(
+    function: Callable[[Any], Any],
+    items: Iterable,
+    concurrency: int,
+    ordered: bool,
+):
+    def call(item):
+        try:
+            return item, function(item)
+        except Exception as error:
+            return item, error
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+
+    # one at a time needs no threads, which also works while the
+    # interpreter is exiting and executors refuse new work
+    if concurrency == 1:
+        for item in items:
+            yield call(item)
+        return
+
+    executor = ThreadPoolExecutor(concurrency)
+    pending = deque()
+
+    def next_result():
+        if ordered:
+            return pending.popleft().result()
+
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        future = done.pop()
+        pending.remove(future)
+        return future.result()
+
+    try:
+        for item in items:
+            pending.append(executor.submit(call, item))
+            if len(pending) >= concurrency:
+                yield next_result()
+
+        while pending:
+            yield next_result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
 
 class EntryInfo:
     """
@@ -57,10 +139,12 @@ class EntryInfo:
         metadata: the key-value pairs of metadata attached to this entry.
     """
 
+    __slots__ = ("version", "created", "updated", "users", "metadata")
+
     def __init__(self, version, created, updated, users, metadata) -> None:
         self.version: str = version
-        self.created: datetime.datetime = parser.parse(created)
-        self.updated: datetime.datetime = parser.parse(updated)
+        self.created: datetime.datetime = _parse_datetime(created)
+        self.updated: datetime.datetime = _parse_datetime(updated)
         self.users: list[int] = users
         self.metadata: dict = metadata
 
@@ -89,6 +173,19 @@ class EntryVersion:
         have the same `version` and are of the same key and scope. |
     """
 
+    __slots__ = (
+        "version",
+        "deleted",
+        "content_length",
+        "__created",
+        "__key_created",
+        "__datastore",
+        "__key",
+        "__scope",
+        "_lazy_created",
+        "_lazy_key_created",
+    )
+
     def __init__(
         self,
         version,
@@ -103,16 +200,22 @@ class EntryVersion:
         self.version: str = version
         self.deleted: bool = deleted
         self.content_length: int = content_length
-        self.created: datetime.datetime = (
-            parser.parse(created) if created else None
-        )
-        self.key_created: datetime.datetime = (
-            parser.parse(key_created) if key_created else None
-        )
+        self.__created: Optional[str] = created
+        self.__key_created: Optional[str] = key_created
         self.__datastore: DataStore = datastore
         self.__key = key
         self.__scope = scope
 
+    @_LazyAttribute
+    def created(self) -> Optional[datetime.datetime]:
+        return _parse_datetime(self.__created) if self.__created else None
+
+    @_LazyAttribute
+    def key_created(self) -> Optional[datetime.datetime]:
+        return (
+            _parse_datetime(self.__key_created) if self.__key_created else None
+        )
+
     def __eq__(self, object) -> bool:
         if not isinstance(object, EntryVersion):
             return NotImplemented
@@ -157,6 +260,8 @@ class ListedEntry:
         have the same `key` and `scope`. |
     """
 
+    __slots__ = ("key", "scope")
+
     def __init__(self, key, scope) -> None:
         self.key: str = key
         self.scope: str = scope
@@ -171,6 +276,303 @@ class ListedEntry:
 scope="{self.scope}">'
 
 
+class EntryColumns:
+    """
+    Contains listed keys as parallel columns instead of an object per key, \
+    returned by [`DataStore.list_keys_columns`\
+    ][rblxopencloud.DataStore.list_keys_columns] and \
+    [`OrderedDataStore.sort_keys_columns`\
+    ][rblxopencloud.OrderedDataStore.sort_keys_columns]. The key at index \
+    `i` has the scope `scopes[i]` and the value `values[i]`.
+
+    Attributes:
+        keys: The keys in the order they were listed.
+        scopes: The scope of each key. Scopes are interned, so a repeated \
+        scope is stored once.
+        values: The value of each key as an [`array`][array.array] of \
+        64-bit integers, or `None` for keys which aren't from an ordered data \
+        store.
+
+    **Supported Operations:**
+
+    | Operator | Description |
+    | -------- | ----------- |
+    | `len()`  | The number of keys. |
+    """
+
+    __slots__ = ("keys", "scopes", "values")
+
+    def __init__(
+        self,
+        keys: Optional[list[str]] = None,
+        scopes: Optional[list[str]] = None,
+        values: Optional[array] = None,
+    ) -> None:
+        self.keys: list[str] = keys if keys is not None else []
+        self.scopes: list[str] = scopes if scopes is not None else []
+        self.values: Optional[array] = values
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __repr__(self) -> str:
+        return f"<rblxopencloud.EntryColumns keys={len(self.keys)}>"
+
+    def extend(self, columns: "EntryColumns") -> None:
+        """
+        Appends the keys, scopes and values of another \
+        [`EntryColumns`][rblxopencloud.EntryColumns] to these columns, so \
+        `extend` can be used as a `sink`.
+
+        Args:
+            columns: The columns to append.
+        """
+
+        self.keys.extend(columns.keys)
+        self.scopes.extend(columns.scopes)
+
+        if columns.values is not None:
+            if self.values is None:
+                self.values = array("q")
+            self.values.extend(columns.values)
+
+
+class BulkWriteResult:
+    """
+    The outcome of a bulk write such as \
+    [`DataStore.set_entries`][rblxopencloud.DataStore.set_entries]. Each key \
+    is placed in exactly one of the attributes.
+
+    Attributes:
+        succeeded: The keys that were written. For \
+        [`set_entries`][rblxopencloud.DataStore.set_entries], the value is \
+        the new [`EntryVersion`][rblxopencloud.EntryVersion], otherwise it \
+        is `None`.
+        conflicts: The keys which failed with \
+        [`PreconditionFailed`][rblxopencloud.PreconditionFailed], such as \
+        when `exclusive_create` is used and the key already has a value.
+        retryable: The keys which failed with an error that may succeed if \
+        retried, such as [`RateLimited`][rblxopencloud.RateLimited], a 5xx \
+        error or a connection error.
+        failed: The keys which failed with any other error.
+    """
+
+    def __init__(self) -> None:
+        self.succeeded: dict[str, Optional[EntryVersion]] = {}
+        self.conflicts: dict[str, PreconditionFailed] = {}
+        self.retryable: dict[str, Exception] = {}
+        self.failed: dict[str, Exception] = {}
+
+    def __repr__(self) -> str:
+        return f"<rblxopencloud.BulkWriteResult succeeded={len(self.succeeded)} \
+conflicts={len(self.conflicts)} retryable={len(self.retryable)} \
+failed={len(self.failed)}>"
+
+    def _add(self, key: str, result) -> None:
+        if isinstance(result, PreconditionFailed):
+            self.conflicts[key] = result
+        elif isinstance(result, Exception) and _is_retryable(result):
+            self.retryable[key] = result
+        elif isinstance(result, Exception):
+            self.failed[key] = result
+        else:
+            self.succeeded[key] = result
+
+
+class EntryCache(abc.ABC):
+    """
+    The interface used by [`DataStore`][rblxopencloud.DataStore] to cache \
+    entries read by [`get_entry`][rblxopencloud.DataStore.get_entry]. \
+    Subclass it and implement `get`, `set` and `delete` to store entries in \
+    an external backend, or use \
+    [`LRUEntryCache`][rblxopencloud.LRUEntryCache] for an in-memory cache. \
+    Subclasses which define `__init__` must call `super().__init__()`, \
+    and can't be created until `get`, `set` and `delete` are implemented.
+
+    Cache keys are tuples of the universe ID, data store name, scope and \
+    entry key. Entries written through \
+    [`set_entry`][rblxopencloud.DataStore.set_entry], \
+    [`increment_entry`][rblxopencloud.DataStore.increment_entry] and \
+    [`remove_entry`][rblxopencloud.DataStore.remove_entry] are invalidated, \
+    and reads in flight during one of those writes aren't cached. Writes \
+    made elsewhere, such as from game servers, are only seen once the cached \
+    entry expires.
+
+    Attributes:
+        hits: The number of reads served from the cache.
+        misses: The number of reads which had to be fetched from Open Cloud.
+    """
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self.__generations: list[int] = [0] * _CACHE_GENERATIONS
+        self.__lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<rblxopencloud.{type(self).__name__} hits={self.hits} \
+misses={self.misses}>"
+
+    @abc.abstractmethod
+    def get(
+        self, key: tuple[int, str, str, str]
+    ) -> Optional[tuple[Union[str, dict, list, int, float], EntryInfo]]:
+        """
+        Returns the cached value and [`EntryInfo`][rblxopencloud.EntryInfo] \
+        for a key, or `None` if it isn't cached.
+
+        Args:
+            key: The cache key.
+        """
+
+    @abc.abstractmethod
+    def set(
+        self,
+        key: tuple[int, str, str, str],
+        value: Union[str, dict, list, int, float],
+        info: EntryInfo,
+    ) -> None:
+        """
+        Stores the value and [`EntryInfo`][rblxopencloud.EntryInfo] for a key.
+
+        Args:
+            key: The cache key.
+            value: The entry's value.
+            info: The entry's info.
+        """
+
+    @abc.abstractmethod
+    def delete(self, key: tuple[int, str, str, str]) -> None:
+        """
+        Removes a key from the cache, if it is cached.
+
+        Args:
+            key: The cache key.
+        """
+
+    def _count(self, hit: bool) -> None:
+        with self.__lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _generation(self, key: tuple[int, str, str, str]) -> int:
+        return self.__generations[hash(key) % _CACHE_GENERATIONS]
+
+    def _invalidate(self, key: tuple[int, str, str, str]) -> int:
+        with self.__lock:
+            self.__generations[hash(key) % _CACHE_GENERATIONS] += 1
+        self.delete(key)
+
+        return self._generation(key)
+
+    def _fill(
+        self,
+        key: tuple[int, str, str, str],
+        generation: int,
+        value: Union[str, dict, list, int, float],
+        info: EntryInfo,
+    ) -> None:
+        # a write which invalidated the key while it was being fetched makes
+        # the fetched value stale, including one landing during the set
+        if self._generation(key) != generation:
+            return
+
+        self.set(key, value, info)
+
+        if self._generation(key) != generation:
+            self.delete(key)
+
+
+class LRUEntryCache(EntryCache):
+    """
+    An in-memory [`EntryCache`][rblxopencloud.EntryCache] which keeps up to \
+    `max_size` entries for `ttl_seconds`, evicting the least recently used \
+    entry when full. Values and their \
+    [`EntryInfo`][rblxopencloud.EntryInfo] are copied in and out of the \
+    cache, so mutating a returned one does not change the cached one.
+
+    Example:
+        ```py
+        datastore = experience.get_datastore(
+            "PlayerData", cache=rblxopencloud.LRUEntryCache(ttl_seconds=10)
+        )
+        ```
+
+    Args:
+        max_size: The maximum number of entries to keep.
+        ttl_seconds: How many seconds an entry is served from the cache \
+        before it is fetched again.
+
+    Attributes:
+        max_size: The maximum number of entries to keep.
+        ttl_seconds: How many seconds an entry is served from the cache.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 5) -> None:
+        super().__init__()
+        self.max_size: int = max_size
+        self.ttl_seconds: float = ttl_seconds
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(
+        self, key: tuple[int, str, str, str]
+    ) -> Optional[tuple[Union[str, dict, list, int, float], EntryInfo]]:
+        with self.__lock:
+            cached = self.__entries.get(key)
+            if cached is None:
+                return None
+
+            if cached[0] <= time.monotonic():
+                del self.__entries[key]
+                return None
+
+            self.__entries.move_to_end(key)
+            return copy.deepcopy(cached[1]), copy.deepcopy(cached[2])
+
+    def set(
+        self,
+        key: tuple[int, str, str, str],
+        value: Union[str, dict, list, int, float],
+        info: EntryInfo,
+    ) -> None:
+        with self.__lock:
+            current = self.__entries.get(key)
+            if (
+                current is not None
+                and current[0] > time.monotonic()
+                and current[2].updated > info.updated
+            ):
+                return
+
+            self.__entries[key] = (
+                time.monotonic() + self.ttl_seconds,
+                copy.deepcopy(value),
+                copy.deepcopy(info),
+            )
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def delete(self, key: tuple[int, str, str, str]) -> None:
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+
+
 class DataStore:
     """
     Represents a regular data store in an experience.
@@ -180,15 +582,29 @@ class DataStore:
         scope: The datastore's scope. `scope/key` syntax is required for keys \
         when scope is `None`.
         experience: The experience this DataStore is a part of.
+        cache: The [`EntryCache`][rblxopencloud.EntryCache] used by \
+        [`get_entry`][rblxopencloud.DataStore.get_entry], or `None` to always \
+        fetch entries.
     """
 
-    def __init__(self, name, experience, api_key, created, scope):
+    def __init__(
+        self,
+        name,
+        experience,
+        api_key,
+        created,
+        scope,
+        cache=None,
+        client=None,
+    ):
         self.name: str = name
         self.__api_key: str = api_key
+        self.__client: Optional[Client] = client
         self.scope: Optional[str] = scope
         self.experience: Experience = experience
+        self.cache: Optional[EntryCache] = cache
         if created:
-            self.created = parser.parse(created)
+            self.created = _parse_datetime(created)
         else:
             self.created = None
 
@@ -221,11 +637,229 @@ scope="{self.scope}" experience={repr(self.experience)}>'
             },
             expected_status=[200],
             authorization=self.__api_key,
+            client=self.__client,
             cursor_key="cursor",
             data_key="keys",
+            max_yields=limit,
         ):
             yield ListedEntry(entry["key"], entry["scope"])
 
+    def list_keys_columns(
+        self,
+        prefix: str = "",
+        limit: Optional[int] = None,
+        sink: Optional[Callable[[EntryColumns], None]] = None,
+    ) -> Optional[EntryColumns]:
+        """
+        Lists all keys in the database and scope like \
+        [`list_keys`][rblxopencloud.DataStore.list_keys], but stores them as \
+        [`EntryColumns`][rblxopencloud.EntryColumns] instead of creating a \
+        [`ListedEntry`][rblxopencloud.ListedEntry] for every key, which uses \
+        much less memory for large listings.
+
+        Example:
+            ```py
+            columns = datastore.list_keys_columns()
+            print(len(columns), columns.keys[0])
+            ```
+
+        Args:
+            prefix: Only return keys that start with this prefix.
+            limit: Will not return more keys than this number. Set to `None` \
+            for no limit.
+            sink: Called with the [`EntryColumns`\
+            ][rblxopencloud.EntryColumns] of each page as it is fetched, \
+            instead of collecting every page.
+
+        Returns:
+            The columns of every key, or `None` if `sink` is provided.
+        """
+
+        columns = EntryColumns() if sink is None else None
+
+        for page in iterate_request(
+            "GET",
+            f"datastores/v1/universes/\
+{self.experience.id}/standard-datastores/datastore/entries",
+            params={
+                "datastoreName": self.name,
+                "scope": self.scope,
+                "AllScopes": not self.scope,
+                "prefix": prefix,
+            },
+            expected_status=[200],
+            authorization=self.__api_key,
+            client=self.__client,
+            cursor_key="cursor",
+            data_key="keys",
+            max_yields=limit,
+            yield_pages=True,
+        ):
+            page = EntryColumns(
+                [entry["key"] for entry in page],
+                [sys.intern(entry["scope"]) for entry in page],
+            )
+
+            if columns is not None:
+                columns.extend(page)
+            else:
+                sink(page)
+
+        return columns
+
+    def list_keys_page(
+        self,
+        prefix: str = "",
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> tuple[list[ListedEntry], Optional[str]]:
+        """
+        Fetches a single page of keys in the database and scope, optionally \
+        matching a prefix. Unlike \
+        [`list_keys`][rblxopencloud.DataStore.list_keys], this exposes the \
+        page cursor so listing can be resumed later.
+
+        Args:
+            prefix: Only return keys that start with this prefix.
+            cursor: The cursor returned with the previous page, or `None` \
+            for the first page.
+            limit: The maximum number of keys in the page.
+
+        Returns:
+            A tuple of the page's keys and the cursor for the next page, \
+            which is `None` if this is the last page.
+        """
+
+        _, data, _ = send_request(
+            "GET",
+            f"datastores/v1/universes/\
+{self.experience.id}/standard-datastores/datastore/entries",
+            params={
+                "datastoreName": self.name,
+                "scope": self.scope,
+                "AllScopes": not self.scope,
+                "prefix": prefix,
+                "cursor": cursor,
+                "limit": limit,
+            },
+            expected_status=[200],
+            authorization=self.__api_key,
+            client=self.__client,
+        )
+
+        return [
+            ListedEntry(entry["key"], entry["scope"])
+            for entry in data.get("keys", [])
+        ], (data.get("nextPageCursor") or None)
+
+    def list_keys_parallel(
+        self,
+        prefixes: Optional[Iterable[str]] = None,
+        alphabet: Optional[str] = None,
+        concurrency: int = 10,
+        max_depth: int = 2,
+        page_size: Optional[int] = None,
+    ) -> Iterable[ListedEntry]:
+        """
+        Iterates all keys in the database and scope by splitting the keys \
+        into prefix shards and listing the shards concurrently. Keys are \
+        yielded as soon as their page is fetched, so they're not in order.
+
+        Either `prefixes` or `alphabet` must be provided. With `alphabet`, \
+        there is a shard for each character, and a shard with more than one \
+        page of keys is split into a shard for each character appended to \
+        its prefix, up to `max_depth` times. The keys on the first page are \
+        kept, and since keys in a scope are listed in lexicographic order, \
+        the new shards only cover the keys after the last of them. \
+        `alphabet` can't be used if `DataStore.scope` is `None`, as keys are \
+        then listed in order of their scope first.
+
+        Example:
+            ```py
+            for entry in datastore.list_keys_parallel(alphabet="0123456789"):
+                print(entry.key)
+            ```
+
+        Args:
+            prefixes: The prefixes to list. They shouldn't overlap, or keys \
+            will be yielded more than once, and keys which don't start with \
+            any of them are not listed.
+            alphabet: The characters keys can contain, such as \
+            `"0123456789"` for user ID keys. Keys containing other \
+            characters may not be listed.
+            concurrency: The maximum number of pages to fetch at once.
+            max_depth: How many times a shard can be split with `alphabet`.
+            page_size: The number of keys to fetch per page.
+        """
+
+        if (prefixes is None) == (alphabet is None):
+            raise ValueError(
+                "Exactly one of prefixes or alphabet is required."
+            )
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        if alphabet is not None and not self.scope:
+            raise ValueError(
+                "alphabet requires the data store to have a scope."
+            )
+
+        # each shard lists the keys starting with its prefix which sort after
+        # the key it starts after, if it has one
+        shards = deque(
+            (prefix, None, 0, None) for prefix in prefixes or alphabet
+        )
+        executor = ThreadPoolExecutor(concurrency)
+        pending = {}
+
+        try:
+            while shards or pending:
+                while shards and len(pending) < concurrency:
+                    prefix, cursor, depth, after = shards.popleft()
+                    future = executor.submit(
+                        self.list_keys_page, prefix, cursor, page_size
+                    )
+                    pending[future] = (prefix, cursor, depth, after)
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    prefix, cursor, depth, after = pending.pop(future)
+                    keys, next_cursor = future.result()
+
+                    if (
+                        alphabet
+                        and keys
+                        and next_cursor
+                        and cursor is None
+                        and depth < max_depth
+                    ):
+                        # every key in the shard up to the last one listed is
+                        # on this page, so only the keys after it are split
+                        last = keys[-1].key
+                        for character in alphabet:
+                            child = prefix + character
+
+                            if last.startswith(child):
+                                shards.appendleft(
+                                    (child, None, depth + 1, last)
+                                )
+                            elif child > last:
+                                shards.appendleft(
+                                    (child, None, depth + 1, None)
+                                )
+                    elif next_cursor:
+                        shards.append((prefix, next_cursor, depth, after))
+
+                    if after is not None:
+                        keys = [key for key in keys if key.key > after]
+
+                    yield from keys
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def get_entry(
         self, key: str
     ) -> tuple[Union[str, dict, list, int, float], EntryInfo]:
@@ -243,11 +877,22 @@ scope="{self.scope}" experience={repr(self.experience)}>'
         except ValueError:
             raise ValueError("'scope/key' syntax expected for key.")
 
+        if self.cache is not None:
+            cache_key = (self.experience.id, self.name, scope, key)
+            cached = self.cache.get(cache_key)
+
+            self.cache._count(cached is not None)
+            if cached is not None:
+                return cached
+
+            generation = self.cache._generation(cache_key)
+
         _, data, headers = send_request(
             "GET",
             f"datastores/v1/universes/{self.experience.id}/standard-datastores\
 /datastore/entries/entry",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             params={
                 "datastoreName": self.name,
@@ -257,16 +902,16 @@ scope="{self.scope}" experience={repr(self.experience)}>'
         )
 
         if headers.get("roblox-entry-attributes"):
-            metadata = json.loads(headers["roblox-entry-attributes"])
+            metadata = _json_loads(headers["roblox-entry-attributes"])
         else:
             metadata = {}
 
         if headers.get("roblox-entry-userids"):
-            userids = json.loads(headers["roblox-entry-userids"])
+            userids = _json_loads(headers["roblox-entry-userids"])
         else:
             userids = []
 
-        return data, EntryInfo(
+        info = EntryInfo(
             headers["roblox-entry-version"],
             headers["roblox-entry-created-time"],
             headers["roblox-entry-version-created-time"],
@@ -274,6 +919,54 @@ scope="{self.scope}" experience={repr(self.experience)}>'
             metadata,
         )
 
+        if self.cache is not None:
+            self.cache._fill(cache_key, generation, data, info)
+
+        return data, info
+
+    def get_entries(
+        self, keys: Iterable[str], concurrency: int = 10, ordered: bool = True
+    ) -> Iterable[
+        tuple[
+            str,
+            Union[
+                tuple[Union[str, dict, list, int, float], EntryInfo], Exception
+            ],
+        ]
+    ]:
+        """
+        Gets the values of many keys concurrently, with up to `concurrency` \
+        requests in flight at once. A key that fails to be fetched does not \
+        stop the others.
+
+        Example:
+            ```py
+            for key, result in datastore.get_entries(["1", "2", "3"]):
+                if isinstance(result, Exception):
+                    print(f"failed to fetch {key}: {result}")
+                else:
+                    value, info = result
+            ```
+
+        Args:
+            keys: The keys to fetch. If `DataStore.scope` is `None`, these \
+            must include the scope in the `scope/key` syntax.
+            concurrency: The maximum number of keys to fetch at once.
+            ordered: Whether to yield results in the same order as `keys`. \
+            When `False`, results are yielded as soon as they're fetched.
+
+        Yields:
+            A tuple of the key and either the value and \
+            [`EntryInfo`][rblxopencloud.EntryInfo] as returned by \
+            [`get_entry`][rblxopencloud.DataStore.get_entry], or the \
+            exception raised while fetching it, such as \
+            [`NotFound`][rblxopencloud.NotFound].
+        """
+
+        yield from _map_concurrently(
+            self.get_entry, keys, concurrency, ordered
+        )
+
     def set_entry(
         self,
         key: str,
@@ -319,6 +1012,7 @@ scope="{self.scope}" experience={repr(self.experience)}>'
             f"datastores/v1/universes/{self.experience.id}/standard-datastores\
 /datastore/entries/entry",
             authorization=self.__api_key,
+            client=self.__client,
             headers={
                 "roblox-entry-userids": json.dumps(users),
                 "roblox-entry-attributes": json.dumps(metadata),
@@ -334,14 +1028,17 @@ scope="{self.scope}" experience={repr(self.experience)}>'
             expected_status=[200, 412],
         )
 
+        if self.cache is not None:
+            self.cache._invalidate((self.experience.id, self.name, scope, key))
+
         if status_code == 412:
             if headers.get("roblox-entry-attributes"):
-                metadata = json.loads(headers["roblox-entry-attributes"])
+                metadata = _json_loads(headers["roblox-entry-attributes"])
             else:
                 metadata = {}
 
             if headers.get("roblox-entry-userids"):
-                userids = json.loads(headers["roblox-entry-userids"])
+                userids = _json_loads(headers["roblox-entry-userids"])
             else:
                 userids = []
 
@@ -352,18 +1049,18 @@ scope="{self.scope}" experience={repr(self.experience)}>'
             else:
                 error = "Precondition failed."
 
-            raise PreconditionFailed(
-                data,
-                EntryInfo(
+            if headers.get("roblox-entry-version"):
+                info = EntryInfo(
                     headers["roblox-entry-version"],
                     headers["roblox-entry-created-time"],
                     headers["roblox-entry-version-created-time"],
                     userids,
                     metadata,
-                ),
-                status_code,
-                error,
-            )
+                )
+            else:
+                data, info = None, None
+
+            raise PreconditionFailed(data, info, status_code, error)
 
         return EntryVersion(
             data.get("version"),
@@ -376,6 +1073,103 @@ scope="{self.scope}" experience={repr(self.experience)}>'
             self.scope if self.scope else scope,
         )
 
+    def update_entry(
+        self,
+        key: str,
+        transform: Callable[
+            [
+                Optional[Union[str, dict, list, int, float]],
+                Optional[EntryInfo],
+            ],
+            Union[str, dict, list, int, float],
+        ],
+        max_attempts: int = 5,
+        users: Optional[list[int]] = None,
+        metadata: Optional[dict] = None,
+        retry_interval_seconds: float = 0.05,
+    ) -> tuple[Union[str, dict, list, int, float], EntryVersion]:
+        """
+        Safely updates the value of a key by reading it, passing it to \
+        `transform` and writing the result only if the key hasn't changed in \
+        the meantime. If it has, `transform` is called again with the newer \
+        value carried by \
+        [`PreconditionFailed`][rblxopencloud.PreconditionFailed] without \
+        re-reading the key, backing off between attempts.
+
+        Example:
+            ```py
+            def add_coins(value, info):
+                value = value or {"coins": 0}
+                value["coins"] += 10
+                return value
+
+            value, version = datastore.update_entry("287113233", add_coins)
+            ```
+
+        Args:
+            key: The key to update. If `DataStore.scope` is `None`, this must \
+            include the scope in the `scope/key` syntax.
+            transform: A function which is passed the current value and \
+            [`EntryInfo`][rblxopencloud.EntryInfo], both `None` if the key \
+            has no value, and returns the new value. It may be called more \
+            than once, so it should not have side effects.
+            max_attempts: The maximum number of times to attempt the write \
+            before raising \
+            [`PreconditionFailed`][rblxopencloud.PreconditionFailed].
+            users: A list of Roblox user IDs to attach to the entry. Defaults \
+            to the entry's current users.
+            metadata: A key-value pair of metadata to attach to the entry. \
+            Defaults to the entry's current metadata.
+            retry_interval_seconds: The base number of seconds to wait after \
+            a conflict. The wait is doubled after each conflict and jittered.
+
+        Returns:
+            The value that was written and its \
+            [`EntryVersion`][rblxopencloud.EntryVersion].
+        """
+
+        try:
+            value, info = self.get_entry(key)
+        except NotFound:
+            value, info = None, None
+
+        for attempt in range(max_attempts):
+            value = transform(value, info)
+
+            try:
+                version = self.set_entry(
+                    key,
+                    value,
+                    users=(
+                        users
+                        if users is not None
+                        else getattr(info, "users", None)
+                    ),
+                    metadata=(
+                        metadata
+                        if metadata is not None
+                        else getattr(info, "metadata", {})
+                    ),
+                    exclusive_create=info is None,
+                    previous_version=info.version if info else None,
+                )
+                return value, version
+            except PreconditionFailed as error:
+                if attempt + 1 >= max_attempts:
+                    raise
+
+                if error.info:
+                    value, info = error.value, error.info
+                else:
+                    try:
+                        value, info = self.get_entry(key)
+                    except NotFound:
+                        value, info = None, None
+
+            time.sleep(
+                retry_interval_seconds * 2**attempt * random.uniform(0.5, 1.5)
+            )
+
     def increment_entry(
         self,
         key: str,
@@ -410,6 +1204,7 @@ scope="{self.scope}" experience={repr(self.experience)}>'
             f"datastores/v1/universes/{self.experience.id}/standard-datastores\
 /datastore/entries/entry/increment",
             authorization=self.__api_key,
+            client=self.__client,
             headers={
                 "roblox-entry-userids": json.dumps(users),
                 "roblox-entry-attributes": json.dumps(metadata),
@@ -424,16 +1219,16 @@ scope="{self.scope}" experience={repr(self.experience)}>'
         )
 
         if headers.get("roblox-entry-attributes"):
-            metadata = json.loads(headers["roblox-entry-attributes"])
+            metadata = _json_loads(headers["roblox-entry-attributes"])
         else:
             metadata = {}
 
         if headers.get("roblox-entry-userids"):
-            userids = json.loads(headers["roblox-entry-userids"])
+            userids = _json_loads(headers["roblox-entry-userids"])
         else:
             userids = []
 
-        return data, EntryInfo(
+        info = EntryInfo(
             headers["roblox-entry-version"],
             headers["roblox-entry-created-time"],
             headers["roblox-entry-version-created-time"],
@@ -441,6 +1236,14 @@ scope="{self.scope}" experience={repr(self.experience)}>'
             metadata,
         )
 
+        if self.cache is not None:
+            cache_key = (self.experience.id, self.name, scope, key)
+            self.cache._fill(
+                cache_key, self.cache._invalidate(cache_key), data, info
+            )
+
+        return data, info
+
     def remove_entry(self, key: str) -> None:
         """
         Removes the value of a key from the datastore and scope.
@@ -462,6 +1265,7 @@ scope="{self.scope}" experience={repr(self.experience)}>'
             f"datastores/v1/universes/{self.experience.id}/standard-datastores\
 /datastore/entries/entry",
             authorization=self.__api_key,
+            client=self.__client,
             params={
                 "datastoreName": self.name,
                 "scope": scope,
@@ -470,8 +1274,90 @@ scope="{self.scope}" experience={repr(self.experience)}>'
             expected_status=[204],
         )
 
+        if self.cache is not None:
+            self.cache._invalidate((self.experience.id, self.name, scope, key))
+
         return None
 
+    def set_entries(
+        self,
+        entries: dict[str, Union[str, dict, list, int, float]],
+        users: Optional[list[int]] = None,
+        metadata: Optional[dict] = None,
+        exclusive_create: bool = False,
+        concurrency: int = 10,
+    ) -> BulkWriteResult:
+        """
+        Sets the values of many keys concurrently, with up to `concurrency` \
+        requests in flight at once. A key that fails to be written does not \
+        stop the others, instead it is reported in the result.
+
+        Example:
+            ```py
+            result = datastore.set_entries({"1": 100, "2": 200})
+            if result.retryable:
+                result = datastore.set_entries(
+                    {key: entries[key] for key in result.retryable}
+                )
+            ```
+
+        Args:
+            entries: A dictionary of keys to their new value. If \
+            `DataStore.scope` is `None`, the keys must include the scope in \
+            the `scope/key` syntax.
+            users: A list of Roblox user IDs to attach to every entry.
+            metadata: A key-value pair of metadata to attach to every entry.
+            exclusive_create: Whether to only write keys which don't already \
+            have a value. Keys that already do are reported in \
+            `BulkWriteResult.conflicts`.
+            concurrency: The maximum number of keys to write at once.
+
+        Returns:
+            The keys that succeeded, conflicted or failed.
+        """
+
+        def write_entry(key):
+            return self.set_entry(
+                key,
+                entries[key],
+                users=users,
+                metadata=metadata or {},
+                exclusive_create=exclusive_create,
+            )
+
+        result = BulkWriteResult()
+        for key, outcome in _map_concurrently(
+            write_entry, entries, concurrency, ordered=False
+        ):
+            result._add(key, outcome)
+
+        return result
+
+    def remove_entries(
+        self, keys: Iterable[str], concurrency: int = 10
+    ) -> BulkWriteResult:
+        """
+        Removes many keys concurrently, with up to `concurrency` requests in \
+        flight at once. A key that fails to be removed does not stop the \
+        others, instead it is reported in the result.
+
+        Args:
+            keys: The keys to remove. If `DataStore.scope` is `None`, these \
+            must include the scope in the `scope/key` syntax.
+            concurrency: The maximum number of keys to remove at once.
+
+        Returns:
+            The keys that succeeded or failed.
+        """
+
+        result = BulkWriteResult()
+        for key, outcome in _map_concurrently(
+            self.remove_entry, keys, concurrency, ordered=False
+        ):
+            result._add(key, outcome)
+
+        return result
+
     def list_versions(
         self,
         key: str,
@@ -505,7 +1391,7 @@ scope="{self.scope}" experience={repr(self.experience)}>'
 {self.experience.id}/standard-datastores/datastore/entries/versions",
             params={
                 "datastoreName": self.name,
-                "scope": self.scope,
+                "scope": scope,
                 "entryKey": key,
                 "sortOrder": "Descending" if descending else "Ascending",
                 "startTime": after.isoformat() if after else None,
@@ -513,8 +1399,10 @@ scope="{self.scope}" experience={repr(self.experience)}>'
             },
             expected_status=[200],
             authorization=self.__api_key,
+            client=self.__client,
             cursor_key="cursor",
-            data_key="keys",
+            data_key="versions",
+            max_yields=limit,
         ):
             yield EntryVersion(
                 entry.get("version"),
@@ -556,6 +1444,7 @@ scope="{self.scope}" experience={repr(self.experience)}>'
             f"/universes/{self.experience.id}/\
 data-stores/{self.name}/entries/{key}@{version}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200, 400],
         )
 
@@ -593,6 +1482,8 @@ class SortedEntry:
         have the same `key`, `scope` and `value`. |
     """
 
+    __slots__ = ("key", "scope", "value")
+
     def __init__(self, key: str, value: int, scope: str = "global") -> None:
         self.key: str = key
         self.scope: str = scope
@@ -622,9 +1513,10 @@ class OrderedDataStore:
         experience: The experience this ordered data store is a part of.
     """
 
-    def __init__(self, name, experience, api_key, scope):
+    def __init__(self, name, experience, api_key, scope, client=None):
         self.name: str = name
         self.__api_key = api_key
+        self.__client: Optional[Client] = client
         self.scope: str = scope
         self.experience: Experience = experience
 
@@ -654,6 +1546,63 @@ scope="{self.scope}" experience={repr(self.experience)}>'
             not possible to sort keys from all scopes.
         """
 
+        for entry in self.__iterate_sorted(descending, limit, min, max):
+            yield SortedEntry(entry["id"], entry["value"], self.scope)
+
+    def sort_keys_columns(
+        self,
+        descending: bool = True,
+        limit: Optional[int] = None,
+        min: int = None,
+        max: int = None,
+        sink: Optional[Callable[[EntryColumns], None]] = None,
+    ) -> Optional[EntryColumns]:
+        """
+        Lists keys in order based on their value like \
+        [`sort_keys`][rblxopencloud.OrderedDataStore.sort_keys], but stores \
+        them as [`EntryColumns`][rblxopencloud.EntryColumns] instead of \
+        creating a [`SortedEntry`][rblxopencloud.SortedEntry] for every key, \
+        which uses much less memory for large leaderboards.
+
+        Args:
+            descending: Wether the largest or the smallest number should be \
+            first.
+            limit: Max number of entries to loop through.
+            min: Minimum entry value to retrieve
+            max: Maximum entry value to retrieve.
+            sink: Called with the [`EntryColumns`\
+            ][rblxopencloud.EntryColumns] of each page as it is fetched, \
+            instead of collecting every page.
+
+        Returns:
+            The columns of every key, or `None` if `sink` is provided.
+
+        !!! note
+            `OrderedDataStore.scope` must not be `None` to sort keys. It is \
+            not possible to sort keys from all scopes.
+        """
+
+        columns = EntryColumns(values=array("q")) if sink is None else None
+
+        for page in self.__iterate_sorted(
+            descending, limit, min, max, yield_pages=True
+        ):
+            page = EntryColumns(
+                [entry["id"] for entry in page],
+                [self.scope] * len(page),
+                array("q", [int(entry["value"]) for entry in page]),
+            )
+
+            if columns is not None:
+                columns.extend(page)
+            else:
+                sink(page)
+
+        return columns
+
+    def __iterate_sorted(
+        self, descending, limit, min, max, yield_pages: bool = False
+    ):
         if not self.scope:
             raise ValueError(
                 "scope is required to list keys with OrderedDataStore."
@@ -669,7 +1618,7 @@ scope="{self.scope}" experience={repr(self.experience)}>'
         elif max:
             filter = f"entry <= {max}"
 
-        for entry in iterate_request(
+        return iterate_request(
             "GET",
             f"ordered-data-stores/v1/universes\
 /{self.experience.id}/orderedDataStores/{urllib.parse.quote(self.name)}/scopes\
@@ -681,11 +1630,12 @@ scope="{self.scope}" experience={repr(self.experience)}>'
             },
             expected_status=[200],
             authorization=self.__api_key,
+            client=self.__client,
             cursor_key="page_token",
             data_key="entries",
             max_yields=limit,
-        ):
-            yield SortedEntry(entry["id"], entry["value"], self.scope)
+            yield_pages=yield_pages,
+        )
 
     def get_entry(self, key: str) -> int:
         """
@@ -709,6 +1659,7 @@ scope="{self.scope}" experience={repr(self.experience)}>'
 {self.experience.id}/orderedDataStores/{urllib.parse.quote(self.name)}/scopes/\
 {urllib.parse.quote(scope)}/entries/{urllib.parse.quote(key)}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
@@ -751,6 +1702,7 @@ scope="{self.scope}" experience={repr(self.experience)}>'
 {urllib.parse.quote(self.name)}/scopes/{urllib.parse.quote(scope)}/entries/\
 {urllib.parse.quote(key)}",
                 authorization=self.__api_key,
+                client=self.__client,
                 expected_status=[200],
                 params={"allow_missing": not exclusive_update},
                 json={"value": value},
@@ -762,6 +1714,7 @@ scope="{self.scope}" experience={repr(self.experience)}>'
 /v1/universes/{self.experience.id}/orderedDataStores/\
 {urllib.parse.quote(self.name)}/scopes/{urllib.parse.quote(scope)}/entries",
                 authorization=self.__api_key,
+                client=self.__client,
                 expected_status=[200, 400, 404],
                 params={"id": key},
                 json={"value": value},
@@ -806,6 +1759,7 @@ universes/{self.experience.id}/orderedDataStores/\
 {urllib.parse.quote(self.name)}/scopes/{urllib.parse.quote(scope)}\
 /entries/{urllib.parse.quote(key)}:increment",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json={"amount": delta},
         )
@@ -834,5 +1788,229 @@ universes/{self.experience.id}/orderedDataStores/\
 {self.experience.id}/orderedDataStores/{urllib.parse.quote(self.name)}/scopes/\
 {urllib.parse.quote(scope)}/entries/{urllib.parse.quote(key)}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200, 204],
         )
+
+
+class IncrementBuffer:
+    """
+    Combines many increments of the same keys into fewer requests. Deltas \
+    are summed per key in memory and sent with `increment_entry` every \
+    `flush_interval_seconds`, as soon as `max_pending_keys` keys are \
+    pending, or when the buffer is closed. Each increment returns a future \
+    which resolves to the key's value after its flush. Keys whose pending \
+    deltas sum to 0 aren't sent, and their futures resolve to `None`. \
+    Buffers which aren't closed are flushed when the interpreter exits.
+
+    Example:
+        ```py
+        with rblxopencloud.IncrementBuffer(datastore) as buffer:
+            for _ in range(1000):
+                buffer.increment("visits", 1)
+
+            future = buffer.increment("visits", 1)
+
+        print(future.result())
+        ```
+
+    Args:
+        datastore: The [`DataStore`][rblxopencloud.DataStore] or \
+        [`OrderedDataStore`][rblxopencloud.OrderedDataStore] to increment \
+        keys in.
+        flush_interval_seconds: How often pending increments are sent.
+        max_pending_keys: The number of pending keys which triggers a flush \
+        before the interval has passed.
+        concurrency: The maximum number of keys to increment at once when \
+        flushing.
+        max_attempts: The number of flushes a key which fails with an error \
+        that may succeed if retried is sent in before its futures resolve \
+        to the exception.
+
+    Attributes:
+        datastore: The data store keys are incremented in.
+        flush_interval_seconds: How often pending increments are sent.
+        max_pending_keys: The number of pending keys which triggers a flush.
+        concurrency: The maximum number of keys to increment at once.
+        max_attempts: The number of flushes a key is sent in before failing.
+    """
+
+    def __init__(
+        self,
+        datastore: Union[DataStore, OrderedDataStore],
+        flush_interval_seconds: float = 5,
+        max_pending_keys: int = 100,
+        concurrency: int = 10,
+        max_attempts: int = 5,
+    ) -> None:
+        self.datastore: Union[DataStore, OrderedDataStore] = datastore
+        self.flush_interval_seconds: float = flush_interval_seconds
+        self.max_pending_keys: int = max_pending_keys
+        self.concurrency: int = concurrency
+        self.max_attempts: int = max_attempts
+
+        self.__pending: dict[
+            str, tuple[Union[int, float], list[Future], int]
+        ] = {}
+        self.__lock = threading.Lock()
+        self.__flush_lock = threading.Lock()
+        self.__wake = threading.Event()
+        self.__closed = False
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+        atexit.register(self.__close_at_exit)
+
+    def __repr__(self) -> str:
+        return f"<rblxopencloud.IncrementBuffer datastore={self.datastore} \
+pending={len(self.__pending)}>"
+
+    def __enter__(self) -> "IncrementBuffer":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def increment(self, key: str, delta: Union[int, float]) -> Future:
+        """
+        Adds `delta` to the key's pending increment.
+
+        Args:
+            key: The key to increment. If the data store's scope is `None`, \
+            this must include the scope in the `scope/key` syntax.
+            delta: The number to increment the value by. Use negative numbers \
+            to decrement the value.
+
+        Returns:
+            A [`Future`][concurrent.futures.Future] which resolves to the \
+            key's value once the increment is flushed, `None` if the key's \
+            pending deltas summed to 0, or the exception raised while \
+            flushing it.
+        """
+
+        future = Future()
+
+        with self.__lock:
+            if self.__closed:
+                raise ValueError("The IncrementBuffer is closed.")
+
+            total, futures, attempts = self.__pending.get(key, (0, [], 0))
+            futures.append(future)
+            self.__pending[key] = (total + delta, futures, attempts)
+
+            if len(self.__pending) >= self.max_pending_keys:
+                self.__wake.set()
+
+        return future
+
+    def flush(self) -> None:
+        """
+        Sends all pending increments now, returning once they're resolved. \
+        Increments which fail with an error that may succeed if retried, \
+        such as a rate limit or a 5xx error, stay in the buffer for the \
+        next flush and their futures stay pending, until they've been sent \
+        in `max_attempts` flushes.
+        """
+
+        self.__flush(True, self.concurrency)
+
+    def close(self) -> None:
+        """
+        Flushes pending increments and stops the background flushing. \
+        Increments can't be added after the buffer is closed, and the \
+        futures of increments which fail during this last flush resolve to \
+        the exception.
+        """
+
+        self.__close(self.concurrency)
+
+    def __close(self, concurrency: int) -> None:
+        with self.__lock:
+            self.__closed = True
+
+        atexit.unregister(self.__close_at_exit)
+        self.__wake.set()
+        self.__thread.join()
+        self.__flush(False, concurrency)
+
+    def __close_at_exit(self) -> None:
+        # executors refuse new work once the interpreter is exiting
+        self.__close(1)
+
+    def __requeue(
+        self,
+        key: str,
+        total: Union[int, float],
+        futures: list[Future],
+        attempts: int,
+    ) -> None:
+        with self.__lock:
+            pending_total, pending_futures, _ = self.__pending.get(
+                key, (0, [], 0)
+            )
+            self.__pending[key] = (
+                total + pending_total,
+                futures + pending_futures,
+                attempts,
+            )
+
+    def __flush(self, requeue: bool, concurrency: int) -> None:
+        with self.__flush_lock:
+            with self.__lock:
+                pending, self.__pending = self.__pending, {}
+
+            # deltas which cancel out don't change the value
+            for key in [
+                key for key, (total, _, _) in pending.items() if not total
+            ]:
+                for future in pending.pop(key)[1]:
+                    if not future.done():
+                        future.set_result(None)
+
+            try:
+                for key, result in _map_concurrently(
+                    lambda key: self.datastore.increment_entry(
+                        key, pending[key][0]
+                    ),
+                    list(pending),
+                    concurrency,
+                    False,
+                ):
+                    total, futures, attempts = pending.pop(key)
+
+                    if (
+                        requeue
+                        and isinstance(result, Exception)
+                        and _is_retryable(result)
+                        and attempts + 1 < self.max_attempts
+                    ):
+                        self.__requeue(key, total, futures, attempts + 1)
+                        continue
+
+                    for future in futures:
+                        if future.done():
+                            continue
+                        elif isinstance(result, Exception):
+                            future.set_exception(result)
+                        elif isinstance(result, tuple):
+                            future.set_result(result[0])
+                        else:
+                            future.set_result(result)
+            finally:
+                # keys an interrupted flush didn't resolve aren't lost
+                for key, (total, futures, attempts) in pending.items():
+                    self.__requeue(key, total, futures, attempts)
+
+    def __run(self) -> None:
+        while True:
+            self.__wake.wait(self.flush_interval_seconds)
+            self.__wake.clear()
+
+            if self.__closed:
+                return
+
+            try:
+                self.flush()
+            except RuntimeError:
+                # the interpreter is exiting, so the increments are left for
+                # the flush made when the buffer is closed at exit
+                return
@@ -0,0 +1,1010 @@
+# MIT License
+
+# Copyright (c) 2022-2025 treeben77
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import base64
+import datetime
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+
+from .http import _route_template
+
+__all__ = ("Emulator",)
+
+_NOT_FOUND = {"error": "NOT_FOUND", "message": "The resource was not found."}
+
+
+def _timestamp(seconds: float) -> str:
+    return datetime.datetime.fromtimestamp(
+        seconds, datetime.timezone.utc
+    ).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _parse_timestamp(timestamp: str) -> float:
+    return datetime.datetime.fromisoformat(
+        timestamp.replace("Z", "+00:00")
+    ).timestamp()
+
+
+def _page(items: list, params: dict, cursor: str, size: str, default: int):
+    start = int(params.get(cursor) or 0)
+    end = start + int(params.get(size) or default)
+
+    return items[start:end], str(end) if end < len(items) else ""
+
+
+class _Version:
+    __slots__ = ("id", "value", "users", "attributes", "size", "created")
+
+    def __init__(self, id, value, users, attributes, size, created) -> None:
+        self.id: str = id
+        self.value: Any = value
+        self.users: list[int] = users
+        self.attributes: dict = attributes
+        self.size: int = size
+        self.created: float = created
+
+    @property
+    def deleted(self) -> bool:
+        return self.size is None
+
+
+class Emulator:
+    """
+    A local imitation of the Open Cloud APIs served over loopback HTTP, for \
+    testing and benchmarking without a real experience or network access. \
+    It keeps everything in memory and implements standard and ordered data \
+    stores, memory store sorted maps and queues, messaging, secrets, and \
+    memory store flush operations. Any API key is accepted.
+
+    Latency, server errors and rate limits can be injected to reproduce \
+    production conditions. Rate limits are enforced per API key and route, \
+    and responses include the `x-ratelimit-*` headers Roblox sends, so the \
+    [`RateLimiter`][rblxopencloud.RateLimiter] paces requests as it would in \
+    production.
+
+    Example:
+        ```py
+        with rblxopencloud.Emulator(latency_seconds=0.05) as emulator:
+            client = rblxopencloud.Client(base_url=emulator.base_url)
+            experience = rblxopencloud.Experience(0, "key", client=client)
+
+            datastore = experience.get_datastore("players")
+            datastore.set_entry("1", {"coins": 10})
+        ```
+
+    Args:
+        latency_seconds: The number of seconds to wait before every response.
+        error_rate: The fraction of requests, between 0 and 1, which fail \
+        with a `503` status.
+        rate_limit: The number of requests per second each API key can make \
+        to each route before receiving a `429` status. Defaults to no limit.
+        seed: The seed used to choose which requests fail, so runs can be \
+        reproduced.
+        port: The loopback port to listen on. Defaults to a free port.
+
+    Attributes:
+        base_url: The URL to pass as the `base_url` of a \
+        [`Client`][rblxopencloud.Client]. It works with both \
+        `rblxopencloud` and `rblxopencloudasync` clients.
+        latency_seconds: The number of seconds to wait before every response.
+        error_rate: The fraction of requests which fail with a `503` status.
+        rate_limit: The number of requests per second allowed for each API \
+        key and route, or `None` for no limit.
+        messages: Every message published with \
+        [`Experience.publish_message`\
+        ][rblxopencloud.Experience.publish_message] as tuples of the \
+        universe ID, topic and message.
+        requests: The number of requests received, including rejected ones.
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = 0,
+        error_rate: float = 0,
+        rate_limit: Optional[int] = None,
+        seed: Optional[int] = None,
+        port: int = 0,
+    ) -> None:
+        self.latency_seconds: float = latency_seconds
+        self.error_rate: float = error_rate
+        self.rate_limit: Optional[int] = rate_limit
+        self.messages: list[tuple[int, str, str]] = []
+        self.requests: int = 0
+
+        self.__random: random.Random = random.Random(seed)
+        self.__lock: threading.Lock = threading.Lock()
+        self.__windows: dict[tuple[str, str], list] = {}
+        self.__public_key: str = base64.b64encode(os.urandom(32)).decode()
+        self.reset()
+
+        self.__routes: list[tuple[re.Pattern, Callable]] = [
+            (re.compile(pattern), handler)
+            for pattern, handler in (
+                (
+                    r"datastores/v1/universes/(\d+)/standard-datastores",
+                    self.__list_datastores,
+                ),
+                (
+                    r"datastores/v1/universes/(\d+)/standard-datastores"
+                    r"/datastore/entries",
+                    self.__list_keys,
+                ),
+                (
+                    r"datastores/v1/universes/(\d+)/standard-datastores"
+                    r"/datastore/entries/entry",
+                    self.__entry,
+                ),
+                (
+                    r"datastores/v1/universes/(\d+)/standard-datastores"
+                    r"/datastore/entries/entry/increment",
+                    self.__increment_entry,
+                ),
+                (
+                    r"datastores/v1/universes/(\d+)/standard-datastores"
+                    r"/datastore/entries/versions",
+                    self.__list_versions,
+                ),
+                (
+                    r"cloud/v2/universes/(\d+)/data-stores/([^/]+)"
+                    r"/entries/(.+)@([^@]+)",
+                    self.__get_version,
+                ),
+                (
+                    r"cloud/v2/universes/(\d+)/data-stores:snapshot",
+                    self.__snapshot,
+                ),
+                (
+                    r"ordered-data-stores/v1/universes/(\d+)/orderedDataStores"
+                    r"/([^/]+)/scopes/([^/]+)/entries",
+                    self.__ordered_entries,
+                ),
+                (
+                    r"ordered-data-stores/v1/universes/(\d+)/orderedDataStores"
+                    r"/([^/]+)/scopes/([^/]+)/entries/([^/]+):increment",
+                    self.__increment_ordered_entry,
+                ),
+                (
+                    r"ordered-data-stores/v1/universes/(\d+)/orderedDataStores"
+                    r"/([^/]+)/scopes/([^/]+)/entries/([^/:]+)",
+                    self.__ordered_entry,
+                ),
+                (
+                    r"cloud/v2/universes/(\d+)/memory-store/sorted-maps"
+                    r"/([^/]+)/items",
+                    self.__sorted_map_items,
+                ),
+                (
+                    r"cloud/v2/universes/(\d+)/memory-store/sorted-maps"
+                    r"/([^/]+)/items/([^/]+)",
+                    self.__sorted_map_item,
+                ),
+                (
+                    r"cloud/v2/universes/(\d+)/memory-store/queues"
+                    r"/([^/]+)/items:(add|read|discard)",
+                    self.__queue,
+                ),
+                (
+                    r"cloud/v2/universes/(\d+)/memory-store:flush",
+                    self.__flush,
+                ),
+                (
+                    r"cloud/v2/universes/(\d+)/memory-store/operations"
+                    r"/([^/]+)",
+                    self.__operation,
+                ),
+                (
+                    r"messaging-service/v1/universes/(\d+)/topics/([^/]+)",
+                    self.__publish_message,
+                ),
+                (
+                    r"cloud/v2/universes/(\d+)/secrets/public-key",
+                    self.__secrets_public_key,
+                ),
+                (r"cloud/v2/universes/(\d+)/secrets", self.__secrets),
+                (r"cloud/v2/universes/(\d+)/secrets/([^/]+)", self.__secret),
+            )
+        ]
+
+        emulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # every response has a content length, so connections can be
+            # kept alive like they are with Roblox. headers and bodies are
+            # written separately, which nagle's algorithm would delay
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                url = urllib.parse.urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+
+                status, headers, body = emulator._handle(
+                    self.command,
+                    url.path.lstrip("/"),
+                    dict(urllib.parse.parse_qsl(url.query)),
+                    self.headers,
+                    self.rfile.read(length) if length else b"",
+                )
+
+                content = b""
+                if status != 204 and body is not None:
+                    content = json.dumps(body).encode()
+
+                self.send_response(status)
+                if content:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                for header, value in headers.items():
+                    self.send_header(header, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_POST = do_PATCH = do_DELETE = do_GET
+
+        self.__server: ThreadingHTTPServer = ThreadingHTTPServer(
+            ("127.0.0.1", port), Handler
+        )
+        self.__server.daemon_threads = True
+        self.base_url: str = f"http://127.0.0.1:{self.__server.server_port}/"
+
+        threading.Thread(
+            target=self.__server.serve_forever, daemon=True
+        ).start()
+
+    def __repr__(self) -> str:
+        return f'<rblxopencloud.Emulator base_url="{self.base_url}">'
+
+    def __enter__(self) -> "Emulator":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops the server. Requests sent afterwards fail to connect.
+        """
+
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def reset(self) -> None:
+        """
+        Removes every data store, memory store, secret and message, and \
+        resets the rate limits.
+        """
+
+        with self.__lock:
+            self.__datastores: dict[tuple[int, str], float] = {}
+            self.__entries: dict[tuple[int, str, str, str], list] = {}
+            self.__ordered: dict[tuple[int, str, str], dict[str, int]] = {}
+            self.__sorted_maps: dict[tuple[int, str], dict[str, dict]] = {}
+            self.__queues: dict[tuple[int, str], list[dict]] = {}
+            self.__operations: set[tuple[int, str]] = set()
+            self.__stored_secrets: dict[tuple[int, str], dict] = {}
+            self.__windows.clear()
+            self.__versions: int = 0
+            self.__snapshot_time: Optional[float] = None
+            self.messages.clear()
+            self.requests = 0
+
+    def _handle(
+        self, method: str, path: str, params: dict, headers, body: bytes
+    ) -> tuple[int, dict, Any]:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+
+        with self.__lock:
+            self.requests += 1
+            limit_headers = {}
+
+            if self.rate_limit:
+                window = self.__windows.setdefault(
+                    (
+                        headers.get("x-api-key")
+                        or headers.get("authorization")
+                        or "",
+                        f"{method} {_route_template(path)}",
+                    ),
+                    [0, 0],
+                )
+
+                now = time.time()
+                if now - window[0] >= 1:
+                    window[:] = [now, 0]
+                window[1] += 1
+
+                reset = max(1, math.ceil(window[0] + 1 - now))
+                limit_headers = {
+                    "x-ratelimit-limit": f"{self.rate_limit}, \
+{self.rate_limit};w=1",
+                    "x-ratelimit-remaining": str(
+                        max(self.rate_limit - window[1], 0)
+                    ),
+                    "x-ratelimit-reset": str(reset),
+                }
+
+                if window[1] > self.rate_limit:
+                    return (
+                        429,
+                        {**limit_headers, "Retry-After": str(reset)},
+                        {
+                            "error": "RESOURCE_EXHAUSTED",
+                            "message": "Too many requests.",
+                        },
+                    )
+
+            if self.error_rate and self.__random.random() < self.error_rate:
+                return 503, limit_headers, {"error": "UNAVAILABLE"}
+
+            for pattern, handler in self.__routes:
+                match = pattern.fullmatch(path)
+                if match:
+                    break
+            else:
+                return 404, limit_headers, _NOT_FOUND
+
+            # malformed bodies and parameters are rejected like Roblox does,
+            # rather than dropping the connection
+            try:
+                data = json.loads(body) if body.strip() else None
+                status, response_headers, response = handler(
+                    method, match.groups(), params, headers, data, body
+                )
+            except (AttributeError, KeyError, TypeError, ValueError):
+                return 400, limit_headers, {"error": "INVALID_ARGUMENT"}
+
+        return status, {**limit_headers, **response_headers}, response
+
+    # standard data stores
+
+    def __entry_headers(self, key: tuple, versions: list) -> dict:
+        version = versions[-1]
+
+        return {
+            "roblox-entry-version": version.id,
+            "roblox-entry-created-time": _timestamp(versions[0].created),
+            "roblox-entry-version-created-time": _timestamp(version.created),
+            "roblox-entry-attributes": json.dumps(version.attributes),
+            "roblox-entry-userids": json.dumps(version.users),
+            "content-md5": base64.b64encode(
+                hashlib.md5(json.dumps(version.value).encode()).digest()
+            ).decode(),
+        }
+
+    def __version_info(self, versions: list, version: _Version) -> dict:
+        return {
+            "version": version.id,
+            "deleted": version.deleted,
+            "contentLength": version.size or 0,
+            "createdTime": _timestamp(version.created),
+            "objectCreatedTime": _timestamp(versions[0].created),
+        }
+
+    def __add_version(
+        self, key: tuple, value, users, attributes, size
+    ) -> _Version:
+        self.__versions += 1
+        self.__datastores.setdefault(key[:2], time.time())
+
+        version = _Version(
+            f"08DC{self.__versions:012X}",
+            value,
+            users,
+            attributes,
+            size,
+            time.time(),
+        )
+        self.__entries.setdefault(key, []).append(version)
+        return version
+
+    def __current(self, key: tuple) -> Optional[list]:
+        versions = self.__entries.get(key)
+        if not versions or versions[-1].deleted:
+            return None
+        return versions
+
+    def __entry_key(self, groups, params) -> tuple:
+        return (
+            int(groups[0]),
+            params.get("datastoreName", ""),
+            params.get("scope", "global"),
+            params.get("entryKey", ""),
+        )
+
+    def __list_datastores(self, method, groups, params, headers, data, body):
+        universe_id = int(groups[0])
+        datastores = [
+            {"name": name, "createdTime": _timestamp(created)}
+            for (universe, name), created in sorted(self.__datastores.items())
+            if universe == universe_id
+            and name.startswith(params.get("prefix", ""))
+        ]
+
+        page, cursor = _page(datastores, params, "cursor", "limit", 50)
+        return 200, {}, {"datastores": page, "nextPageCursor": cursor}
+
+    def __list_keys(self, method, groups, params, headers, data, body):
+        universe_id, name = int(groups[0]), params.get("datastoreName")
+        all_scopes = params.get("AllScopes", "").lower() == "true"
+
+        keys = [
+            {"scope": scope, "key": key}
+            for (universe, datastore, scope, key) in sorted(self.__entries)
+            if universe == universe_id
+            and datastore == name
+            and (all_scopes or scope == params.get("scope", "global"))
+            and key.startswith(params.get("prefix", ""))
+            and self.__current((universe, datastore, scope, key))
+        ]
+
+        page, cursor = _page(keys, params, "cursor", "limit", 50)
+        return 200, {}, {"keys": page, "nextPageCursor": cursor}
+
+    def __entry(self, method, groups, params, headers, data, body):
+        key = self.__entry_key(groups, params)
+        versions = self.__current(key)
+
+        if method == "GET":
+            if not versions:
+                return 404, {}, _NOT_FOUND
+            return 200, self.__entry_headers(key, versions), versions[-1].value
+
+        if method == "DELETE":
+            if not versions:
+                return 404, {}, _NOT_FOUND
+            self.__add_version(key, None, [], {}, None)
+            return 204, {}, None
+
+        if method != "POST":
+            return 405, {}, None
+
+        if (
+            params.get("exclusiveCreate", "").lower() == "true" and versions
+        ) or (
+            params.get("matchVersion")
+            and (not versions or versions[-1].id != params["matchVersion"])
+        ):
+            if not versions:
+                return 412, {}, {"error": "PRECONDITION_FAILED"}
+            return (
+                412,
+                self.__entry_headers(key, versions),
+                versions[-1].value,
+            )
+
+        version = self.__add_version(
+            key,
+            data,
+            json.loads(headers.get("roblox-entry-userids") or "[]"),
+            json.loads(headers.get("roblox-entry-attributes") or "{}"),
+            len(body),
+        )
+        return 200, {}, self.__version_info(self.__entries[key], version)
+
+    def __increment_entry(self, method, groups, params, headers, data, body):
+        key = self.__entry_key(groups, params)
+        versions = self.__current(key)
+
+        value = versions[-1].value if versions else 0
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return 400, {}, {"error": "INVALID_ARGUMENT"}
+
+        value += json.loads(params.get("incrementBy") or "0")
+        self.__add_version(
+            key,
+            value,
+            json.loads(headers.get("roblox-entry-userids") or "[]"),
+            json.loads(headers.get("roblox-entry-attributes") or "{}"),
+            len(json.dumps(value)),
+        )
+
+        return 200, self.__entry_headers(key, self.__entries[key]), value
+
+    def __list_versions(self, method, groups, params, headers, data, body):
+        key = self.__entry_key(groups, params)
+        versions = self.__entries.get(key, [])
+
+        after = params.get("startTime")
+        before = params.get("endTime")
+        listed = [
+            self.__version_info(versions, version)
+            for version in versions
+            if (not after or version.created >= _parse_timestamp(after))
+            and (not before or version.created <= _parse_timestamp(before))
+        ]
+        if params.get("sortOrder") == "Descending":
+            listed.reverse()
+
+        page, cursor = _page(listed, params, "cursor", "limit", 50)
+        return 200, {}, {"versions": page, "nextPageCursor": cursor}
+
+    def __get_version(self, method, groups, params, headers, data, body):
+        universe_id, name, key, version_id = groups
+        versions = self.__entries.get(
+            (int(universe_id), name, "global", key), []
+        )
+
+        if version_id.startswith("latest:"):
+            at = _parse_timestamp(version_id.split(":", 1)[1])
+            matches = [
+                version for version in versions if version.created <= at
+            ][-1:]
+        else:
+            matches = [
+                version for version in versions if version.id == version_id
+            ]
+
+        if not matches or matches[0].deleted:
+            return 400, {}, {"message": "Invalid version id."}
+
+        version = matches[0]
+        return (
+            200,
+            {},
+            {
+                "value": version.value,
+                "revisionId": version.id,
+                "createTime": _timestamp(versions[0].created),
+                "revisionCreateTime": _timestamp(version.created),
+                "users": [f"users/{user}" for user in version.users],
+                "attributes": version.attributes,
+            },
+        )
+
+    def __snapshot(self, method, groups, params, headers, data, body):
+        now = time.time()
+        taken = self.__snapshot_time is None or int(
+            self.__snapshot_time // 86400
+        ) != int(now // 86400)
+
+        if taken:
+            self.__snapshot_time = now
+
+        return (
+            200,
+            {},
+            {
+                "newSnapshotTaken": taken,
+                "latestSnapshotTime": _timestamp(self.__snapshot_time),
+            },
+        )
+
+    # ordered data stores
+
+    def __ordered_entry_data(self, groups, key: str, value: int) -> dict:
+        return {
+            "path": f"universes/{groups[0]}/orderedDataStores/{groups[1]}\
+/scopes/{groups[2]}/entries/{key}",
+            "id": key,
+            "value": value,
+        }
+
+    def __ordered_store(self, groups) -> dict[str, int]:
+        return self.__ordered.setdefault(
+            (
+                int(groups[0]),
+                urllib.parse.unquote(groups[1]),
+                urllib.parse.unquote(groups[2]),
+            ),
+            {},
+        )
+
+    def __ordered_entries(self, method, groups, params, headers, data, body):
+        entries = self.__ordered_store(groups)
+
+        if method == "POST":
+            key = params.get("id", "")
+            if key in entries:
+                return 400, {}, {"message": "Entry already exists."}
+
+            entries[key] = int(data["value"])
+            return (
+                200,
+                {},
+                self.__ordered_entry_data(groups, key, entries[key]),
+            )
+
+        if method != "GET":
+            return 405, {}, None
+
+        bounds = re.findall(
+            r"entry\s*(>=|<=)\s*(-?\d+)", params.get("filter", "")
+        )
+        listed = sorted(
+            (
+                (value, key)
+                for key, value in entries.items()
+                if all(
+                    (
+                        value >= int(bound)
+                        if operator == ">="
+                        else value <= int(bound)
+                    )
+                    for operator, bound in bounds
+                )
+            ),
+            reverse=params.get("order_by") == "desc",
+        )
+
+        page, cursor = _page(
+            [
+                self.__ordered_entry_data(groups, key, value)
+                for value, key in listed
+            ],
+            params,
+            "page_token",
+            "max_page_size",
+            10,
+        )
+        return 200, {}, {"entries": page, "nextPageToken": cursor}
+
+    def __ordered_entry(self, method, groups, params, headers, data, body):
+        entries = self.__ordered_store(groups)
+        key = urllib.parse.unquote(groups[3])
+
+        if method == "PATCH":
+            if key not in entries and (
+                params.get("allow_missing", "").lower() != "true"
+            ):
+                return 404, {}, {"code": "NOT_FOUND", **_NOT_FOUND}
+
+            entries[key] = int(data["value"])
+
+        elif key not in entries:
+            return 404, {}, {"code": "NOT_FOUND", **_NOT_FOUND}
+
+        elif method == "DELETE":
+            del entries[key]
+            return 204, {}, None
+
+        elif method != "GET":
+            return 405, {}, None
+
+        return 200, {}, self.__ordered_entry_data(groups, key, entries[key])
+
+    def __increment_ordered_entry(
+        self, method, groups, params, headers, data, body
+    ):
+        entries = self.__ordered_store(groups)
+        key = urllib.parse.unquote(groups[3])
+
+        entries[key] = entries.get(key, 0) + int(data["amount"])
+        return 200, {}, self.__ordered_entry_data(groups, key, entries[key])
+
+    # memory stores
+
+    def __sorted_map(self, groups) -> dict[str, dict]:
+        items = self.__sorted_maps.setdefault(
+            (int(groups[0]), urllib.parse.unquote_plus(groups[1])), {}
+        )
+
+        now = time.time()
+        for key in [key for key, item in items.items() if item["_ttl"] < now]:
+            del items[key]
+
+        return items
+
+    def __sorted_map_response(self, item: dict) -> dict:
+        return {key: value for key, value in item.items() if key != "_ttl"}
+
+    def __write_sorted_map_item(self, groups, items, key, data) -> dict:
+        self.__versions += 1
+
+        ttl = float(str(data.get("Ttl", "0s")).rstrip("s"))
+        item = {
+            "path": f"universes/{groups[0]}/memory-store/sorted-maps\
+/{groups[1]}/items/{key}",
+            "id": key,
+            "value": data.get("Value"),
+            "etag": str(self.__versions),
+            "expireTime": _timestamp(time.time() + ttl),
+            "_ttl": time.time() + ttl,
+        }
+
+        for sort_key in ("numericSortKey", "stringSortKey"):
+            if data.get(sort_key) is not None:
+                item[sort_key] = data[sort_key]
+
+        items[key] = item
+        return self.__sorted_map_response(item)
+
+    def __sorted_map_items(self, method, groups, params, headers, data, body):
+        items = self.__sorted_map(groups)
+
+        if method == "POST":
+            key = data.get("Id") or data.get("id")
+            if key in items:
+                return 409, {}, {"error": "ALREADY_EXISTS"}
+
+            return (
+                200,
+                {},
+                self.__write_sorted_map_item(groups, items, key, data),
+            )
+
+        if method != "GET":
+            return 405, {}, None
+
+        def order(item):
+            if "numericSortKey" in item:
+                return (1, item["numericSortKey"], "", item["id"])
+            if "stringSortKey" in item:
+                return (2, 0, item["stringSortKey"], item["id"])
+            return (0, 0, "", item["id"])
+
+        listed = sorted(
+            items.values(), key=order, reverse=params.get("orderBy") == "desc"
+        )
+
+        for field, operator, bound in re.findall(
+            r'(id|sortKey)\s*([<>])\s*("[^"]*"|-?[\d.]+)',
+            params.get("filter", ""),
+        ):
+            if field == "id":
+                bound, position = bound.strip('"'), 3
+            elif bound.startswith('"'):
+                bound, position = (2, 0, bound.strip('"')), slice(3)
+            else:
+                bound, position = (1, float(bound), ""), slice(3)
+
+            listed = [
+                item
+                for item in listed
+                if (order(item)[position] > bound) == (operator == ">")
+                and order(item)[position] != bound
+            ]
+
+        page, cursor = _page(
+            [self.__sorted_map_response(item) for item in listed],
+            params,
+            "pageToken",
+            "maxPageSize",
+            1,
+        )
+        return 200, {}, {"items": page, "nextPageToken": cursor}
+
+    def __sorted_map_item(self, method, groups, params, headers, data, body):
+        items = self.__sorted_map(groups)
+        key = urllib.parse.unquote_plus(groups[2])
+
+        if method == "PATCH":
+            if key not in items and (
+                params.get("allowMissing", "").lower() != "true"
+            ):
+                return 404, {}, _NOT_FOUND
+
+            return (
+                200,
+                {},
+                self.__write_sorted_map_item(groups, items, key, data),
+            )
+
+        if key not in items:
+            return 404, {}, _NOT_FOUND
+
+        if method == "DELETE":
+            if params.get("etag") and params["etag"] != items[key]["etag"]:
+                return 409, {}, {"error": "ABORTED"}
+
+            del items[key]
+            return 204, {}, None
+
+        if method != "GET":
+            return 405, {}, None
+
+        return 200, {}, self.__sorted_map_response(items[key])
+
+    def __queue(self, method, groups, params, headers, data, body):
+        items = self.__queues.setdefault(
+            (int(groups[0]), urllib.parse.unquote_plus(groups[1])), []
+        )
+
+        now = time.time()
+        items[:] = [item for item in items if item["expires"] >= now]
+
+        if groups[2] == "add":
+            ttl = float(str(data.get("Ttl", "30s")).rstrip("s"))
+            items.append(
+                {
+                    "data": data.get("Data"),
+                    "priority": data.get("Priority", 0),
+                    "expires": now + ttl,
+                    "invisible_until": 0,
+                    "read_id": None,
+                }
+            )
+            # higher priorities leave first, otherwise the oldest item does
+            items.sort(key=lambda item: -item["priority"])
+
+            return (
+                200,
+                {},
+                {
+                    "path": f"universes/{groups[0]}/memory-store/queues\
+/{groups[1]}/items/{len(items)}",
+                    "data": data.get("Data"),
+                    "priority": data.get("Priority", 0),
+                    "expireTime": _timestamp(now + ttl),
+                },
+            )
+
+        if groups[2] == "discard":
+            items[:] = [
+                item
+                for item in items
+                if item["read_id"] is None
+                or item["read_id"] != params.get("readId")
+            ]
+            return 200, {}, {}
+
+        visible = [item for item in items if item["invisible_until"] <= now]
+        count = int(params.get("count") or 1)
+
+        if not visible or (
+            params.get("allOrNothing", "").lower() == "true"
+            and len(visible) < count
+        ):
+            return 204, {}, None
+
+        self.__versions += 1
+        read_id = f"{self.__versions:016x}"
+
+        for item in visible[:count]:
+            item["read_id"] = read_id
+            item["invisible_until"] = now + float(
+                params.get("invisibilityTimeoutSeconds") or 30
+            )
+
+        return (
+            200,
+            {},
+            {
+                "id": read_id,
+                "data": [item["data"] for item in visible[:count]],
+            },
+        )
+
+    def __flush(self, method, groups, params, headers, data, body):
+        universe_id = int(groups[0])
+
+        for store in (self.__sorted_maps, self.__queues):
+            for key in [key for key in store if key[0] == universe_id]:
+                del store[key]
+
+        self.__versions += 1
+        operation_id = f"{self.__versions:016x}"
+        self.__operations.add((universe_id, operation_id))
+
+        return (
+            200,
+            {},
+            {
+                "path": f"universes/{universe_id}/memory-store/operations\
+/{operation_id}",
+                "done": True,
+            },
+        )
+
+    def __operation(self, method, groups, params, headers, data, body):
+        if (int(groups[0]), groups[1]) not in self.__operations:
+            return 404, {}, _NOT_FOUND
+
+        return (
+            200,
+            {},
+            {
+                "path": f"universes/{groups[0]}/memory-store/operations\
+/{groups[1]}",
+                "done": True,
+                "response": {},
+            },
+        )
+
+    def __publish_message(self, method, groups, params, headers, data, body):
+        if method != "POST":
+            return 405, {}, None
+
+        self.messages.append(
+            (
+                int(groups[0]),
+                urllib.parse.unquote(groups[1]),
+                (data or {}).get("message"),
+            )
+        )
+        return 200, {}, {}
+
+    # secrets
+
+    def __secrets_public_key(
+        self, method, groups, params, headers, data, body
+    ):
+        # any 32 bytes are a valid curve25519 public key, so sealing works
+        # even though nothing here can decrypt the secrets
+        return 200, {}, {"secret": self.__public_key, "key_id": "1"}
+
+    def __secrets(self, method, groups, params, headers, data, body):
+        universe_id = int(groups[0])
+
+        if method == "GET":
+            secrets = [
+                {
+                    key: value
+                    for key, value in secret.items()
+                    if key != "secret"
+                }
+                for (universe, _), secret in sorted(
+                    self.__stored_secrets.items()
+                )
+                if universe == universe_id
+            ]
+
+            page, cursor = _page(secrets, params, "cursor", "limit", 500)
+            return 200, {}, {"secrets": page, "nextPageCursor": cursor}
+
+        if method != "POST":
+            return 405, {}, None
+
+        if (universe_id, data.get("id")) in self.__stored_secrets:
+            return 409, {}, {"error": "ALREADY_EXISTS"}
+
+        return 200, {}, self.__write_secret(universe_id, data["id"], data)
+
+    def __secret(self, method, groups, params, headers, data, body):
+        key = (int(groups[0]), urllib.parse.unquote(groups[1]))
+
+        if key not in self.__stored_secrets:
+            return 404, {}, _NOT_FOUND
+
+        if method == "DELETE":
+            del self.__stored_secrets[key]
+            return 200, {}, {}
+
+        if method != "PATCH":
+            return 405, {}, None
+
+        return 200, {}, self.__write_secret(*key, data)
+
+    def __write_secret(self, universe_id: int, id: str, data: dict) -> dict:
+        now = _timestamp(time.time())
+        secret = self.__stored_secrets.setdefault(
+            (universe_id, id), {"id": id, "create_time": now}
+        )
+
+        secret.update(
+            domain=data.get("domain") or "*",
+            update_time=now,
+            secret=data.get("secret"),
+        )
+        return {key: value for key, value in secret.items() if key != "secret"}
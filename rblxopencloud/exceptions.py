@@ -39,6 +39,7 @@ __all__ = (
     "ModeratedText",
     "UnknownEventType",
     "UnhandledEventType",
+    "UnmatchedRequest",
 )
 
 
@@ -147,11 +148,25 @@ class NotFound(HttpException):
 
 class RateLimited(HttpException):
     """
-    Roblox blocked the request for exceeding the endpoint's rate limit. The \
-    library does not currently support any rate limiting handling but this \
-    exception can be used to implement automatic retrying. 
+    Roblox blocked the request for exceeding the endpoint's rate limit. By \
+    default, [`send_request`][rblxopencloud.send_request] waits for the \
+    delay advertised by Roblox and retries the request a few times before \
+    this exception is raised.
+
+    Attributes:
+        retry_after: The number of seconds Roblox asked to wait before \
+        retrying, if it was provided.
     """
 
+    def __init__(
+        self,
+        status: int = None,
+        body: Union[dict, str] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        self.retry_after: Optional[float] = retry_after
+        super().__init__(status, body)
+
 
 class Forbidden(HttpException):
     """
@@ -215,3 +230,10 @@ class UnknownEventType(BaseException):
 
 class UnhandledEventType(BaseException):
     pass
+
+
+class UnmatchedRequest(BaseException):
+    """
+    Raised by a replaying [`Cassette`][rblxopencloud.Cassette] when a \
+    request has no recorded response left to replay.
+    """
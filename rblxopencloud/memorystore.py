@@ -25,10 +25,9 @@ import json
 import urllib.parse
 from typing import TYPE_CHECKING, Iterable, Optional, Union
 
-from dateutil import parser
-
 from .exceptions import HttpException, NotFound, PreconditionFailed
-from .http import iterate_request, send_request
+from .http import Client, iterate_request, send_request
+from .utils import _LazyAttribute, _parse_datetime
 
 if TYPE_CHECKING:
     from .experience import Experience
@@ -49,6 +48,15 @@ class SortedMapEntry:
         expires_at: The timestamp the entry will expire at.
     """
 
+    __slots__ = (
+        "key",
+        "sort_key",
+        "value",
+        "etag",
+        "__expire_time",
+        "_lazy_expires_at",
+    )
+
     def __init__(self, data) -> None:
         self.key: str = data["id"]
         self.sort_key: Optional[Union[int, float, str]] = data.get(
@@ -56,7 +64,11 @@ class SortedMapEntry:
         ) or data.get("stringSortKey")
         self.value: int = data["value"]
         self.etag: str = data["etag"]
-        self.expires_at: datetime.datetime = parser.parse(data["expireTime"])
+        self.__expire_time: Optional[str] = data.get("expireTime")
+
+    @_LazyAttribute
+    def expires_at(self) -> datetime.datetime:
+        return _parse_datetime(self.__expire_time)
 
     def __repr__(self) -> str:
         return f'<rblxopencloud.SortedMapEntry \
@@ -72,9 +84,10 @@ class SortedMap:
         experience (Experience): The experience the sorted map is a part of.
     """
 
-    def __init__(self, name, experience, api_key):
+    def __init__(self, name, experience, api_key, client=None):
         self.name: str = name
         self.__api_key: str = api_key
+        self.__client: Optional[Client] = client
         self.experience: Experience = experience
 
     def __repr__(self) -> str:
@@ -139,6 +152,7 @@ class SortedMap:
             f"/universes/{self.experience.id}/memory-store/\
 sorted-maps/{urllib.parse.quote_plus(self.name)}/items",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             params={
                 "orderBy": "desc" if descending else None,
@@ -168,6 +182,7 @@ sorted-maps/{urllib.parse.quote_plus(self.name)}/items",
 sorted-maps/{urllib.parse.quote_plus(self.name)}/items/\
 {urllib.parse.quote_plus(key)}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
@@ -210,6 +225,7 @@ sorted-maps/{urllib.parse.quote_plus(self.name)}/items/\
 sorted-maps/{urllib.parse.quote_plus(self.name)}/items/\
 {urllib.parse.quote_plus(key)}",
                 authorization=self.__api_key,
+                client=self.__client,
                 expected_status=[200, 404, 409],
                 params={"allowMissing": str(not exclusive_update).lower()},
                 json={
@@ -229,6 +245,7 @@ sorted-maps/{urllib.parse.quote_plus(self.name)}/items/\
                 f"/universes/{self.experience.id}/memory-store\
 /sorted-maps/{urllib.parse.quote_plus(self.name)}/items",
                 authorization=self.__api_key,
+                client=self.__client,
                 expected_status=[200, 409],
                 json={
                     "Id": key,
@@ -276,6 +293,7 @@ sorted-maps/{urllib.parse.quote_plus(self.name)}/items/\
 sorted-maps/{urllib.parse.quote_plus(self.name)}/items/\
 {urllib.parse.quote_plus(key)}",
             authorization=self.__api_key,
+            client=self.__client,
             params={"etag": etag},
         )
 
@@ -289,9 +307,10 @@ class MemoryStoreQueue:
         experience: The experience the queue belongs to.
     """
 
-    def __init__(self, name, experience, api_key):
+    def __init__(self, name, experience, api_key, client=None):
         self.name: str = name
         self.__api_key: str = api_key
+        self.__client: Optional[Client] = client
         self.experience: Experience = experience
 
     def __repr__(self) -> str:
@@ -320,6 +339,7 @@ class MemoryStoreQueue:
             f"/universes/{self.experience.id}/memory-store/\
 queues/{urllib.parse.quote_plus(self.name)}/items:add",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json={
                 "Data": value,
@@ -356,6 +376,7 @@ queues/{urllib.parse.quote_plus(self.name)}/items:add",
             f"/universes/{self.experience.id}/memory-store/\
 queues/{urllib.parse.quote_plus(self.name)}/items:read",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200, 204],
             params={
                 "count": count,
@@ -384,6 +405,7 @@ queues/{urllib.parse.quote_plus(self.name)}/items:read",
             f"/universes/{self.experience.id}/memory-store/\
 queues/{urllib.parse.quote_plus(self.name)}/items:discard",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             params={"readId": read_id},
             json={},
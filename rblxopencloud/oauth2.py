@@ -29,19 +29,10 @@ import time
 from typing import Optional, Union
 from urllib import parse
 
-import jwt
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives.asymmetric import ec
-from cryptography.hazmat.primitives.serialization import (
-    Encoding,
-    PublicFormat,
-    load_der_public_key,
-)
-
 from .exceptions import BaseException, HttpException, InvalidCode
 from .experience import Experience
 from .group import Group
-from .http import send_request
+from .http import Client, send_request
 from .user import User
 
 __all__ = (
@@ -146,9 +137,14 @@ class PartialAccessToken:
             "oauth/v1/userinfo",
             authorization=f"Bearer {self.token}",
             expected_status=[200],
+            client=self.app.client,
         )
 
-        user = User(data.get("id") or data.get("sub"), f"Bearer {self.token}")
+        user = User(
+            data.get("id") or data.get("sub"),
+            f"Bearer {self.token}",
+            client=self.app.client,
+        )
         user.username = data.get("preferred_username")
         user.display_name = data.get("nickname")
         user.headshot_uri = data.get("picture")
@@ -172,6 +168,7 @@ class PartialAccessToken:
             "POST",
             "oauth/v1/token/resources",
             expected_status=[200],
+            client=self.app.client,
             data={
                 "token": self.token,
                 "client_id": self.app.id,
@@ -183,26 +180,27 @@ class PartialAccessToken:
         accounts = []
 
         api_key = f"Bearer {self.token}"
+        client = self.app.client
 
         for resource in data["resource_infos"]:
             owner = resource["owner"]
             if resource["resources"].get("universe"):
                 for experience_id in resource["resources"]["universe"]["ids"]:
-                    experience = Experience(experience_id, api_key)
+                    experience = Experience(experience_id, api_key, client)
                     if owner["type"] == "User":
-                        experience.owner = User(owner["id"], api_key)
+                        experience.owner = User(owner["id"], api_key, client)
                     elif owner["type"] == "Group":
-                        experience.owner = Group(owner["id"], api_key)
+                        experience.owner = Group(owner["id"], api_key, client)
                     experiences.append(experience)
 
             if resource["resources"].get("creator"):
                 for creator_id in resource["resources"]["creator"]["ids"]:
                     if creator_id == "U":
-                        accounts.append(User(owner["id"], api_key))
+                        accounts.append(User(owner["id"], api_key, client))
                     elif creator_id.startswith("U"):
-                        accounts.append(User(creator_id[1:], api_key))
+                        accounts.append(User(creator_id[1:], api_key, client))
                     elif creator_id.startswith("G"):
-                        accounts.append(Group(creator_id[1:], api_key))
+                        accounts.append(Group(creator_id[1:], api_key, client))
 
         return Resources(experiences=experiences, accounts=accounts)
 
@@ -219,6 +217,7 @@ class PartialAccessToken:
             "POST",
             "oauth/v1/token/introspect",
             expected_status=[200],
+            client=self.app.client,
             data={
                 "token": self.token,
                 "client_id": self.app.id,
@@ -266,6 +265,7 @@ class AccessToken(PartialAccessToken):
             self.user: Optional[User] = User(
                 id_token.get("id") or id_token.get("sub"),
                 f"Bearer {self.token}",
+                client=app.client,
             )
             self.user.username = id_token.get("preferred_username")
             self.user.display_name = id_token.get("nickname")
@@ -308,6 +308,10 @@ class OAuth2App:
         objects.
         openid_certs_cache_seconds (int): The number of seconds to cache the \
         OpenID certs. You can ignore this if you don't know what it does.
+        client (Optional[Client]): The [`Client`][rblxopencloud.Client] to \
+        send the app's requests with, including requests made by the users, \
+        groups and experiences its access tokens return. Defaults to the \
+        shared client.
 
     Attributes:
         if (int): The app's client ID.
@@ -315,6 +319,8 @@ class OAuth2App:
         redirect_uri (str): The redirect URI being used for authorization.
         openid_certs_cache_seconds (int): The number of seconds to cache the \
         OpenID certs.
+        client (Optional[Client]): The [`Client`][rblxopencloud.Client] the \
+        app's requests are sent with, or `None` for the shared client.
     """
 
     def __init__(
@@ -323,10 +329,12 @@ class OAuth2App:
         secret: str,
         redirect_uri: str,
         openid_certs_cache_seconds: int = 3600,
+        client: Optional[Client] = None,
     ):
         self.id: int = id
         self.redirect_uri: str = redirect_uri
         self.__secret: str = secret
+        self.client: Optional[Client] = client
 
         self.openid_certs_cache_seconds: int = openid_certs_cache_seconds
         self.__openid_certs_cache = None
@@ -337,7 +345,17 @@ class OAuth2App:
 redirect_uri="{self.redirect_uri}")'
 
     def __refresh_openid_certs_cache(self):
-        certs_status, certs, _ = send_request("GET", "oauth/v1/certs")
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives.asymmetric import ec
+        from cryptography.hazmat.primitives.serialization import (
+            Encoding,
+            PublicFormat,
+            load_der_public_key,
+        )
+
+        certs_status, certs, _ = send_request(
+            "GET", "oauth/v1/certs", client=self.client
+        )
         self.__openid_certs_cache = []
         self.__openid_certs_cache_updated = time.time()
 
@@ -479,6 +497,7 @@ redirect_uri="{self.redirect_uri}")'
             "POST",
             "oauth/v1/token",
             expected_status=[200, 401],
+            client=self.client,
             data={
                 "client_id": self.id,
                 "client_secret": self.__secret,
@@ -496,6 +515,8 @@ redirect_uri="{self.redirect_uri}")'
 
         id_token = None
         if data.get("id_token"):
+            import jwt
+
             if (
                 not self.__openid_certs_cache
                 or time.time() - self.__openid_certs_cache_updated
@@ -537,6 +558,7 @@ redirect_uri="{self.redirect_uri}")'
             "POST",
             "oauth/v1/token",
             expected_status=[200],
+            client=self.client,
             data={
                 "client_id": self.id,
                 "client_secret": self.__secret,
@@ -560,6 +582,7 @@ redirect_uri="{self.redirect_uri}")'
             "POST",
             "oauth/v1/token/revoke",
             expected_status=[200],
+            client=self.client,
             data={
                 "client_id": self.id,
                 "client_secret": self.__secret,
@@ -23,10 +23,10 @@
 from .creator import Asset, AssetType, CreatorStoreProduct
 from .experience import Experience
 from .group import Group
-from .http import send_request
+from .http import Client, send_request
 from .user import User
 
-from typing import Union
+from typing import Optional, Union
 
 __all__ = ("ApiKey",)
 
@@ -40,13 +40,18 @@ class ApiKey:
     Args:
         api_key: Your API key created from \
         [Creator Dashboard](https://create.roblox.com/credentials).
+        client: The [`Client`][rblxopencloud.Client] to send requests using \
+        this API key with. Defaults to the shared client.
     """
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, client: Optional[Client] = None) -> None:
         self.__api_key = api_key
 
+        # requests and objects created from this one are sent with the client
+        self.__client: Optional[Client] = client
+
     def get_experience(self, id: int, fetch_info: bool = False) -> Experience:
-        obj = Experience(id, self.__api_key)
+        obj = Experience(id, self.__api_key, self.__client)
 
         if fetch_info:
             obj.fetch_info()
@@ -54,7 +59,7 @@ class ApiKey:
         return obj
 
     def get_group(self, id: int, fetch_info: bool = False) -> Group:
-        obj = Group(id, self.__api_key)
+        obj = Group(id, self.__api_key, self.__client)
 
         if fetch_info:
             obj.fetch_info()
@@ -62,7 +67,7 @@ class ApiKey:
         return obj
 
     def get_user(self, id: int, fetch_info: bool = False) -> User:
-        obj = User(id, self.__api_key)
+        obj = User(id, self.__api_key, self.__client)
 
         if fetch_info:
             obj.fetch_info()
@@ -84,10 +89,11 @@ class ApiKey:
             "GET",
             f"assets/v1/assets/{asset_id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
-        return Asset(data, self, self.__api_key)
+        return Asset(data, self, self.__api_key, self.__client)
 
     async def fetch_creator_store_product(
         self, asset_type: Union[AssetType, str], product_id: int
@@ -118,7 +124,8 @@ class ApiKey:
             "/creator-store-products/CreatorMarketplaceAsset"
             f"-{asset_type}-{product_id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
-        return CreatorStoreProduct(data, self.__api_key)
+        return CreatorStoreProduct(data, self.__api_key, self.__client)
@@ -21,16 +21,14 @@
 # SOFTWARE.
 
 import io
-import json
 from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional, Union
 
 import urllib3
-from dateutil import parser
-
 from .exceptions import HttpException, InvalidFile, ModeratedText
-from .http import Operation, iterate_request, send_request
+from .http import Operation, iterate_request, send_request, _json_dumps
+from .utils import _parse_datetime
 
 if TYPE_CHECKING:
     from .group import Group
@@ -137,11 +135,12 @@ class Asset:
         created. *Will be `None` if the asset type does not support updating.*
     """
 
-    def __init__(self, data: dict, creator, api_key) -> None:
+    def __init__(self, data: dict, creator, api_key, client=None) -> None:
         self.id: int = data.get("assetId")
         self.name: str = data.get("displayName")
         self.description: str = data.get("description")
         self.__api_key = api_key
+        self.__client = client
 
         from .group import Group
         from .user import User
@@ -151,11 +150,12 @@ class Asset:
             .get("creator", {})
             .get("userId")
         ):
-            data_creator = User(creatorid, self.__api_key)
+            data_creator = User(creatorid, self.__api_key, self.__client)
         else:
             data_creator = Group(
                 data.get("creationContext", {}).get("creator", {})["groupId"],
                 self.__api_key,
+                self.__client,
             )
 
         if (
@@ -177,7 +177,7 @@ class Asset:
 
         self.revision_id: Optional[int] = data.get("revisionId")
         self.revision_time: Optional[datetime] = (
-            parser.parse(data["revisionCreateTime"])
+            _parse_datetime(data["revisionCreateTime"])
             if data.get("revisionCreateTime")
             else None
         )
@@ -211,6 +211,8 @@ class AssetVersion:
         moderation_status: The moderation status of this version.
     """
 
+    __slots__ = ("version_number", "asset_id", "creator", "moderation_status")
+
     def __init__(self, data, creator) -> None:
         self.version_number: int = data["path"].split("/")[3]
         self.asset_id: int = data["path"].split("/")[1]
@@ -280,6 +282,8 @@ class Money:
         [`float`][float]. Also supports `>=`. |
     """
 
+    __slots__ = ("currency", "quantity")
+
     def __init__(self, currency: str, quantity: float) -> None:
         self.currency: str = currency
         self.quantity: float = quantity
@@ -380,7 +384,7 @@ class CreatorStoreProduct:
         locale-specific considerations.
     """
 
-    def __init__(self, data: dict, api_key) -> None:
+    def __init__(self, data: dict, api_key, client=None) -> None:
 
         self._data: dict = data
 
@@ -402,10 +406,10 @@ class CreatorStoreProduct:
         from .user import User
 
         if creatorid := data.get("userSeller"):
-            self.creator: Union[User, Group] = User(creatorid, api_key)
+            self.creator: Union[User, Group] = User(creatorid, api_key, client)
         else:
             self.creator: Union[User, Group] = User(
-                data["groupSeller"], api_key
+                data["groupSeller"], api_key, client
             )
 
         self.purchasable: bool = data.get("purchasable")
@@ -465,9 +469,10 @@ class Creator:
         id (int): The ID of the creator.
     """
 
-    def __init__(self, id, api_key, type) -> None:
+    def __init__(self, id, api_key, type, client=None) -> None:
         self.id: int = id
         self.__api_key = api_key
+        self.__client = client
         self.__creator_type = type
 
     def __repr__(self) -> str:
@@ -486,7 +491,9 @@ class Creator:
 
         from .apikey import ApiKey
 
-        return await ApiKey(self.__api_key).fetch_asset(asset_id)
+        return await ApiKey(self.__api_key, self.__client).fetch_asset(
+            asset_id
+        )
 
     async def upload_asset(
         self,
@@ -555,7 +562,7 @@ class Creator:
 
         body, contentType = urllib3.encode_multipart_formdata(
             {
-                "request": json.dumps(payload),
+                "request": _json_dumps(payload),
                 "fileContent": (
                     file.name,
                     file.read(),
@@ -568,6 +575,7 @@ class Creator:
             "POST",
             "assets/v1/assets",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200, 400],
             headers={"content-type": contentType},
             data=body,
@@ -589,8 +597,10 @@ class Creator:
             f"assets/v1/{data['path']}",
             self.__api_key,
             Asset,
+            self_client=self.__client,
             creator=self,
             api_key=self.__api_key,
+            client=self.__client,
         )
 
     async def update_asset(
@@ -638,7 +648,7 @@ class Creator:
         if file:
             body, contentType = urllib3.encode_multipart_formdata(
                 {
-                    "request": json.dumps(payload),
+                    "request": _json_dumps(payload),
                     "fileContent": (
                         file.name,
                         file.read(),
@@ -648,13 +658,14 @@ class Creator:
             )
         else:
             body, contentType = urllib3.encode_multipart_formdata(
-                {"request": json.dumps(payload)}
+                {"request": _json_dumps(payload)}
             )
 
         status, data, _ = await send_request(
             "PATCH",
             f"assets/v1/assets/{asset_id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200, 400],
             headers={"content-type": contentType},
             data=body,
@@ -675,8 +686,10 @@ class Creator:
             f"assets/v1/{data['path']}",
             self.__api_key,
             Asset,
+            self_client=self.__client,
             creator=self,
             api_key=self.__api_key,
+            client=self.__client,
         )
 
     async def list_asset_versions(
@@ -701,6 +714,7 @@ class Creator:
                 "maxPageSize": limit if limit and limit <= 50 else 50,
             },
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             data_key="assetVersions",
             cursor_key="pageToken",
@@ -725,6 +739,7 @@ class Creator:
             "GET",
             f"assets/v1/assets/{asset_id}/versions/{version_number}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
@@ -748,6 +763,7 @@ class Creator:
             "POST",
             f"assets/v1/assets/{asset_id}/versions:rollback",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json={
                 "assetVersion": f"assets/{asset_id}/versions/{version_number}"
@@ -778,6 +794,6 @@ class Creator:
 
         from .apikey import ApiKey
 
-        return await ApiKey(self.__api_key).fetch_creator_store_product(
-            asset_type, product_id
-        )
+        return await ApiKey(
+            self.__api_key, self.__client
+        ).fetch_creator_store_product(asset_type, product_id)
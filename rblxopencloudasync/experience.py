@@ -24,17 +24,18 @@ from base64 import b64encode
 from datetime import datetime
 from enum import Enum
 import io
-from nacl import encoding, public
-from typing import Any, AsyncGenerator, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional, Union
 import urllib.parse
 
-from dateutil import parser
-
-from .datastore import DataStore, OrderedDataStore
+from .datastore import DataStore, EntryCache, OrderedDataStore
 from .group import Group
-from .http import Operation, iterate_request, send_request
+from .http import Client, Operation, iterate_request, send_request
 from .memorystore import MemoryStoreQueue, SortedMap
 from .user import User
+from .utils import _LazyAttribute, _parse_datetime
+
+if TYPE_CHECKING:
+    from nacl import public
 
 __all__ = (
     "Experience",
@@ -75,12 +76,12 @@ eference/engine/classes/HttpService#GetSecret).
         self.id: str = data["id"]
         self.domain: str = data.get("domain")
         self.created_at: Optional[datetime] = (
-            parser.parse(data["create_time"])
+            _parse_datetime(data["create_time"])
             if data.get("create_time")
             else None
         )
         self.updated_at: Optional[datetime] = (
-            parser.parse(data["update_time"])
+            _parse_datetime(data["update_time"])
             if data.get("update_time")
             else None
         )
@@ -272,13 +273,15 @@ class Subscription:
             data["state"], SubscriptionState.Unknown
         )
 
-        self.created_at: datetime = parser.parse(data["createTime"])
-        self.updated_at: datetime = parser.parse(data["updateTime"])
-        self.last_billed_at: datetime = parser.parse(data["lastBillingTime"])
+        self.created_at: datetime = _parse_datetime(data["createTime"])
+        self.updated_at: datetime = _parse_datetime(data["updateTime"])
+        self.last_billed_at: datetime = _parse_datetime(
+            data["lastBillingTime"]
+        )
         self.period_end_at: datetime = (
-            parser.parse(data["expireTime"])
+            _parse_datetime(data["expireTime"])
             if data.get("expireTime")
-            else parser.parse(data["nextRenewTime"])
+            else _parse_datetime(data["nextRenewTime"])
         )
 
         self.payment_provider: PaymentProvider = PAYMENT_PROVIDER_STRINGS.get(
@@ -390,35 +393,25 @@ class UserRestriction:
         game script.
     """
 
-    def __init__(self, data, api_key, place=None) -> None:
-        self._data: Optional[dict] = data
-        if data.get("path"):
-            if "places" not in data["path"].split("/"):
-                self.place: Optional[Place] = None
-            elif place:
-                self.place: Optional[Place] = place
-            else:
-                self.place: Optional[Place] = Place(
-                    int(data["path"].split("/")[3]), None, api_key, None
-                )
-        elif data.get("place"):
-            self.place: Optional[Place] = Place(
-                int(data["place"].split("/")[-1]), None, api_key, None
-            )
-
-        self.user: User = User(int(data["user"].split("/")[1]), api_key)
-
-        if data.get("path"):
-            restriction_info = data["gameJoinRestriction"]
-            self.issuer_user_id: Optional[int] = None
-        else:
-            restriction_info = data
+    def __init__(self, data, api_key, place=None, client=None) -> None:
+        self.__api_key: str = api_key
+        self.__client: Optional[Client] = client
+        self.__place: Optional[Place] = place
+
+        # keep only what the lazy attributes decode, not the whole response
+        self.__path: Optional[str] = data.get("path")
+        self.__place_path: Optional[str] = data.get("place")
+        self.__user_path: str = data["user"]
+        self.__issuer_path: Optional[str] = (
+            None
+            if self.__path
+            else (data.get("moderator") or {}).get("robloxUser")
+        )
 
-            self.issuer_user_id: Optional[int] = (
-                int(restriction_info["moderator"]["robloxUser"].split("/")[-1])
-                if restriction_info["moderator"].get("robloxUser")
-                else None
-            )
+        restriction_info = (
+            data["gameJoinRestriction"] if data.get("path") else data
+        )
+        self.__start_time: Optional[str] = restriction_info.get("startTime")
 
         self.active: bool = restriction_info["active"]
 
@@ -435,12 +428,53 @@ class UserRestriction:
             if not (type(duration) == str and duration.endswith("s"))
             else int(duration[0:-1])
         )
-        self.start_timestamp: Optional[datetime] = (
-            parser.parse(restriction_info["startTime"])
-            if restriction_info.get("startTime")
+
+    @_LazyAttribute
+    def place(self) -> Optional["Place"]:
+        if self.__path:
+            if "places" not in self.__path.split("/"):
+                return None
+
+            return self.__place or Place(
+                int(self.__path.split("/")[3]),
+                None,
+                self.__api_key,
+                None,
+                self.__client,
+            )
+        elif self.__place_path:
+            return Place(
+                int(self.__place_path.split("/")[-1]),
+                None,
+                self.__api_key,
+                None,
+                self.__client,
+            )
+
+        return None
+
+    @_LazyAttribute
+    def user(self) -> User:
+        return User(
+            int(self.__user_path.split("/")[1]),
+            self.__api_key,
+            self.__client,
+        )
+
+    @_LazyAttribute
+    def issuer_user_id(self) -> Optional[int]:
+        return (
+            int(self.__issuer_path.split("/")[-1])
+            if self.__issuer_path
             else None
         )
 
+    @_LazyAttribute
+    def start_timestamp(self) -> Optional[datetime]:
+        return (
+            _parse_datetime(self.__start_time) if self.__start_time else None
+        )
+
     def __repr__(self) -> str:
         return f"<rblxopencloud.UserRestriction active={self.active} \
 user={repr(self.user)}>"
@@ -460,21 +494,22 @@ class Place:
         server_size: The number of players the can be in a single server.
     """
 
-    def __init__(self, id, data, api_key, experience) -> None:
+    def __init__(self, id, data, api_key, experience, client=None) -> None:
         self._data: dict = data
         self.id: int = id
         self.experience: Experience = experience
         self.name: Optional[str] = data["displayName"] if data else None
         self.description: Optional[str] = data["description"] if data else None
         self.created_at: Optional[datetime] = (
-            parser.parse(data["createTime"]) if data else None
+            _parse_datetime(data["createTime"]) if data else None
         )
         self.updated_at: Optional[datetime] = (
-            parser.parse(data["updateTime"]) if data else None
+            _parse_datetime(data["updateTime"]) if data else None
         )
 
         self.server_size: Optional[str] = data["serverSize"] if data else None
         self.__api_key = api_key
+        self.__client: Optional[Client] = client
 
     def __repr__(self) -> str:
         return f"<rblxopencloud.Place id={self.id} \
@@ -484,8 +519,8 @@ experience={repr(self.experience)}>"
         self._data = data
         self.name = data["displayName"]
         self.description = data["description"]
-        self.created_at = parser.parse(data["createTime"])
-        self.updated_at = parser.parse(data["updateTime"])
+        self.created_at = _parse_datetime(data["createTime"])
+        self.updated_at = _parse_datetime(data["updateTime"])
         self.server_size = data["serverSize"]
 
         return self
@@ -502,6 +537,7 @@ experience={repr(self.experience)}>"
             "GET",
             f"/universes/{self.experience.id}/places/{self.id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
@@ -541,6 +577,7 @@ experience={repr(self.experience)}>"
             "PATCH",
             f"/universes/{self.experience.id}/places/{self.id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json=payload,
             params={"updateMask": ",".join(field_mask)},
@@ -567,6 +604,7 @@ experience={repr(self.experience)}>"
             f"universes/v1/{self.experience.id}/places/{self.id}\
 /versions",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             headers={"content-type": "application/octet-stream"},
             params={"versionType": "Published" if publish else "Saved"},
@@ -592,10 +630,11 @@ experience={repr(self.experience)}>"
             f"/universes/{self.experience.id}/places/{self.id}\
 /user-restrictions/{user_id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
-        return UserRestriction(data, self.__api_key)
+        return UserRestriction(data, self.__api_key, client=self.__client)
 
     async def ban_user(
         self,
@@ -626,6 +665,7 @@ experience={repr(self.experience)}>"
             f"/universes/{self.experience.id}/places/{self.id}\
 /user-restrictions/{user_id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json={
                 "gameJoinRestriction": {
@@ -640,7 +680,7 @@ experience={repr(self.experience)}>"
             },
         )
 
-        return UserRestriction(data, self.__api_key)
+        return UserRestriction(data, self.__api_key, client=self.__client)
 
     async def unban_user(self, user_id: int) -> UserRestriction:
         """
@@ -658,11 +698,12 @@ experience={repr(self.experience)}>"
             f"/universes/{self.experience.id}/places/{self.id}\
 /user-restrictions/{user_id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json={"gameJoinRestriction": {"active": False}},
         )
 
-        return UserRestriction(data, self.__api_key)
+        return UserRestriction(data, self.__api_key, client=self.__client)
 
 
 class Experience:
@@ -674,6 +715,8 @@ class Experience:
         api_key: The API key created on the \
         [Creator Dashboard](https://create.roblox.com/credentials) with \
         access to the experience.
+        client: The [`Client`][rblxopencloud.Client] to send requests using \
+        this API key with. Defaults to the shared client.
     
     Attributes:
         id (int): The experience/universe ID
@@ -713,12 +756,15 @@ class Experience:
         social link, if there is one. 
     """
 
-    def __init__(self, id: int, api_key: str):
+    def __init__(self, id: int, api_key: str, client: Optional[Client] = None):
         self._data: Optional[dict] = None
         self.id: int = id
         self.__api_key: str = api_key
         self.__cached_secrets_public_key: Optional[public.PublicKey] = None
 
+        # requests and objects created from this one are sent with the client
+        self.__client: Optional[Client] = client
+
         self.name: Optional[str] = None
         self.description: Optional[str] = None
         self.created_at: Optional[datetime] = None
@@ -751,21 +797,27 @@ class Experience:
         self.description = data["description"]
 
         self.created_at = (
-            parser.parse(data["createTime"])
+            _parse_datetime(data["createTime"])
             if data.get("createTime")
             else None
         )
         self.updated_at = (
-            parser.parse(data["updateTime"])
+            _parse_datetime(data["updateTime"])
             if data.get("updateTime")
             else None
         )
 
         if data.get("user"):
-            self.owner = User(int(data["user"].split("/")[1]), self.__api_key)
+            self.owner = User(
+                int(data["user"].split("/")[1]),
+                self.__api_key,
+                self.__client,
+            )
         elif data.get("group"):
             self.owner = Group(
-                int(data["group"].split("/")[1]), self.__api_key
+                int(data["group"].split("/")[1]),
+                self.__api_key,
+                self.__client,
             )
         else:
             self.owner = None
@@ -862,6 +914,7 @@ class Experience:
             f"/universes/{self.id}",
             expected_status=[200],
             authorization=self.__api_key,
+            client=self.__client,
         )
 
         return self.__update_params(data)
@@ -972,6 +1025,7 @@ class Experience:
             "PATCH",
             f"/universes/{self.id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             params={"updateMask": ",".join(field_mask)},
             json=payload,
@@ -992,10 +1046,13 @@ class Experience:
             `id` and `experience`.
         """
 
-        return Place(place_id, None, self.__api_key, self)
+        return Place(place_id, None, self.__api_key, self, self.__client)
 
     def get_datastore(
-        self, name: str, scope: Optional[str] = "global"
+        self,
+        name: str,
+        scope: Optional[str] = "global",
+        cache: Optional[EntryCache] = None,
     ) -> DataStore:
         """
         Creates a [`DataStore`][rblxopencloud.DataStore] with the provided \
@@ -1004,12 +1061,16 @@ class Experience:
         Args:
             name: The data store name.
             scope: The data store scope. Use `None` for `scope/key` syntax.
+            cache: An [`EntryCache`][rblxopencloud.EntryCache] to serve \
+            [`get_entry`][rblxopencloud.DataStore.get_entry] reads from.
 
         Returns:
             The created data store object with `DataStore.created` as `None`.
         """
 
-        return DataStore(name, self, self.__api_key, None, scope)
+        return DataStore(
+            name, self, self.__api_key, None, scope, cache, self.__client
+        )
 
     def get_ordered_datastore(
         self, name: str, scope: Optional[str] = "global"
@@ -1026,7 +1087,9 @@ class Experience:
             The created data store object.
         """
 
-        return OrderedDataStore(name, self, self.__api_key, scope)
+        return OrderedDataStore(
+            name, self, self.__api_key, scope, self.__client
+        )
 
     async def list_datastores(
         self,
@@ -1052,6 +1115,7 @@ class Experience:
             "GET",
             f"datastores/v1/universes/{self.id}/standard-datastores",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             params={"prefix": prefix},
             max_yields=limit,
@@ -1064,6 +1128,7 @@ class Experience:
                 self.__api_key,
                 entry["createdTime"],
                 scope,
+                client=self.__client,
             )
 
     async def snapshot_datastores(self) -> tuple[bool, datetime]:
@@ -1084,11 +1149,12 @@ class Experience:
             "POST",
             f"/universes/{self.id}/data-stores:snapshot",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json={},
         )
 
-        return data["newSnapshotTaken"], parser.parse(
+        return data["newSnapshotTaken"], _parse_datetime(
             data["latestSnapshotTime"]
         )
 
@@ -1105,7 +1171,7 @@ class Experience:
             The sorted map with the provided name.
         """
 
-        return SortedMap(name, self, self.__api_key)
+        return SortedMap(name, self, self.__api_key, self.__client)
 
     def get_memory_store_queue(self, name: str) -> MemoryStoreQueue:
         """
@@ -1120,7 +1186,7 @@ class Experience:
             The memory store queue with the provided name.
         """
 
-        return MemoryStoreQueue(name, self, self.__api_key)
+        return MemoryStoreQueue(name, self, self.__api_key, self.__client)
 
     async def publish_message(self, topic: str, data: str) -> None:
         """
@@ -1144,6 +1210,7 @@ classes/MessagingService).
             "POST",
             f"messaging-service/v1/universes/{self.id}/topics/{topic}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json={"message": data},
         )
@@ -1182,6 +1249,7 @@ classes/MessagingService).
             "POST",
             f"/users/{user_id}/notifications",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json={
                 "source": {"universe": f"universes/{self.id}"},
@@ -1212,6 +1280,7 @@ classes/MessagingService).
             "POST",
             f"/universes/{self.id}:restartServers",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json={},
         )
@@ -1229,6 +1298,7 @@ classes/MessagingService).
             "POST",
             f"/universes/{self.id}/memory-store:flush",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
@@ -1238,6 +1308,7 @@ classes/MessagingService).
             f"/universes/{self.id}/memory-store/operations/{op_id}",
             self.__api_key,
             True,
+            self_client=self.__client,
         )
 
     async def fetch_subscription(
@@ -1263,6 +1334,7 @@ classes/MessagingService).
 {product_id}/subscriptions/{user_id}",
             params={"view": "FULL"},
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
@@ -1300,6 +1372,7 @@ classes/MessagingService).
             "GET",
             f"/universes/{self.id}/user-restrictions:listLogs",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             params={
                 "maxPageSize": str(limit if limit and limit <= 100 else 100),
@@ -1309,7 +1382,7 @@ classes/MessagingService).
             data_key="logs",
             cursor_key="pageToken",
         ):
-            yield UserRestriction(entry, self.__api_key)
+            yield UserRestriction(entry, self.__api_key, client=self.__client)
 
     async def fetch_user_restriction(self, user_id: int) -> UserRestriction:
         """
@@ -1327,10 +1400,11 @@ classes/MessagingService).
             "GET",
             f"/universes/{self.id}/user-restrictions/{user_id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
-        return UserRestriction(data, self.__api_key)
+        return UserRestriction(data, self.__api_key, client=self.__client)
 
     async def ban_user(
         self,
@@ -1361,6 +1435,7 @@ classes/MessagingService).
             "PATCH",
             f"/universes/{self.id}/user-restrictions/{user_id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json={
                 "gameJoinRestriction": {
@@ -1375,7 +1450,7 @@ classes/MessagingService).
             },
         )
 
-        return UserRestriction(data, self.__api_key)
+        return UserRestriction(data, self.__api_key, client=self.__client)
 
     async def unban_user(self, user_id: int) -> UserRestriction:
         """
@@ -1393,11 +1468,12 @@ classes/MessagingService).
             "PATCH",
             f"/universes/{self.id}/user-restrictions/{user_id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json={"gameJoinRestriction": {"active": False}},
         )
 
-        return UserRestriction(data, self.__api_key)
+        return UserRestriction(data, self.__api_key, client=self.__client)
 
     async def list_secrets(
         self, limit: int = None
@@ -1407,6 +1483,7 @@ classes/MessagingService).
             "GET",
             f"/universes/{self.id}/secrets",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             params={
                 "maxPageSize": limit if limit and limit <= 500 else 500,
@@ -1459,6 +1536,7 @@ classes/MessagingService).
             "GET",
             f"/universes/{self.id}/secrets/public-key",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
@@ -1498,6 +1576,8 @@ classes/MessagingService).
             secret = secret.encode("utf-8")
 
         if not key_id:
+            from nacl import encoding, public
+
             if not self.__cached_secrets_public_key:
                 key_id, public_key = await self.fetch_secrets_public_key()
             else:
@@ -1517,6 +1597,7 @@ classes/MessagingService).
                 "key_id": key_id,
             },
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200, 201],
         )
 
@@ -1553,6 +1634,8 @@ classes/MessagingService).
             secret = secret.encode("utf-8")
 
         if not key_id:
+            from nacl import encoding, public
+
             if not self.__cached_secrets_public_key:
                 key_id, public_key = await self.fetch_secrets_public_key()
             else:
@@ -1571,6 +1654,7 @@ classes/MessagingService).
                 "key_id": key_id,
             },
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200, 201],
         )
 
@@ -1588,6 +1672,7 @@ classes/MessagingService).
             "DELETE",
             f"/universes/{self.id}/secrets/{id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
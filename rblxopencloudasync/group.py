@@ -24,11 +24,10 @@ from base64 import urlsafe_b64encode
 import datetime
 from typing import Any, AsyncGenerator, Optional
 
-from dateutil import parser
-
 from .creator import Creator
-from .http import iterate_request, send_request
+from .http import Client, iterate_request, send_request
 from .user import User
+from .utils import _LazyAttribute, _parse_datetime
 
 __all__ = (
     "Group",
@@ -53,17 +52,19 @@ class GroupShout:
         shout was posted in this group.
     """
 
-    def __init__(self, shout, api_key=None) -> None:
+    def __init__(self, shout, api_key=None, client=None) -> None:
         self._data: dict = shout
         self.content: str = shout["content"]
-        self.user: User = User(int(shout["poster"].split("/")[1]), api_key)
+        self.user: User = User(
+            int(shout["poster"].split("/")[1]), api_key, client
+        )
         self.created_at: datetime.datetime = (
-            parser.parse(shout["updateTime"])
+            _parse_datetime(shout["updateTime"])
             if shout.get("updateTime")
             else None
         )
         self.first_created_at: datetime.datetime = (
-            parser.parse(shout["createTime"])
+            _parse_datetime(shout["createTime"])
             if shout.get("createTime")
             else None
         )
@@ -142,6 +143,16 @@ class GroupRole:
         guest rank.
     """
 
+    __slots__ = (
+        "_data",
+        "id",
+        "name",
+        "rank",
+        "description",
+        "member_count",
+        "permissions",
+    )
+
     def __init__(self, role) -> None:
         self._data: dict = role
         self.id: int = int(role["id"])
@@ -173,18 +184,33 @@ class GroupMember(User):
         the group (Such as rank change).
     """
 
-    def __init__(self, member, api_key, group=None) -> None:
-        self._data: dict = member
+    def __init__(self, member, api_key, group=None, client=None) -> None:
         self.id: int = int(member["user"].split("/")[1])
         self.role_id: int = int(member["role"].split("/")[-1])
-        self.group: Group = (
-            group
-            if group
-            else Group(int(member["role"].split("/")[1]), api_key)
+        self.__role_path: str = member["role"]
+        self.__create_time: str = member["createTime"]
+        self.__update_time: str = member["updateTime"]
+        self.__api_key: str = api_key
+        self.__client: Optional[Client] = client
+        if group:
+            self.group: Group = group
+        super().__init__(self.id, api_key, client)
+
+    @_LazyAttribute
+    def group(self) -> "Group":
+        return Group(
+            int(self.__role_path.split("/")[1]),
+            self.__api_key,
+            self.__client,
         )
-        self.joined_at: datetime.datetime = parser.parse(member["createTime"])
-        self.updated_at: datetime.datetime = parser.parse(member["updateTime"])
-        super().__init__(self.id, api_key)
+
+    @_LazyAttribute
+    def joined_at(self) -> datetime.datetime:
+        return _parse_datetime(self.__create_time)
+
+    @_LazyAttribute
+    def updated_at(self) -> datetime.datetime:
+        return _parse_datetime(self.__update_time)
 
     def __repr__(self) -> str:
         return f"<rblxopencloud.GroupMember id={self.id} group={self.group}>"
@@ -244,15 +270,15 @@ class GroupJoinRequest(User):
         [`User.list_inventory`][rblxopencloud.User.list_inventory].
     """
 
-    def __init__(self, member, api_key, group=None) -> None:
+    def __init__(self, member, api_key, group=None, client=None) -> None:
         self._data: dict = member
         self.id: int = int(member["user"].split("/")[1])
         self.group: Group = group
-        self.requested_at: datetime.datetime = parser.parse(
+        self.requested_at: datetime.datetime = _parse_datetime(
             member["createTime"]
         )
 
-        super().__init__(self.id, api_key)
+        super().__init__(self.id, api_key, client)
 
     def __repr__(self) -> str:
         return f"<rblxopencloud.GroupJoinRequest id={self.id} \
@@ -284,6 +310,8 @@ class Group(Creator):
         api_key: Your API key created from \
         [Creator Dashboard](https://create.roblox.com/credentials) with \
         access to this group.
+        client: The [`Client`][rblxopencloud.Client] to send requests using \
+        this API key with. Defaults to the shared client.
     
     Attributes:
         id (int): The group's ID.
@@ -301,11 +329,16 @@ class Group(Creator):
         verified (Optional[bool]): Wether the group has a verified badge.
     """
 
-    def __init__(self, id: int, api_key: str) -> None:
+    def __init__(
+        self, id: int, api_key: str, client: Optional[Client] = None
+    ) -> None:
         self._data: Optional[dict] = None
         self.id: int = id
         self.__api_key = api_key
 
+        # requests and objects created from this one are sent with the client
+        self.__client: Optional[Client] = client
+
         self.name: Optional[str] = None
         self.description: Optional[str] = None
         self.created_at: Optional[datetime.datetime] = None
@@ -333,6 +366,7 @@ class Group(Creator):
             "GET",
             f"/groups/{self.id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
@@ -340,17 +374,21 @@ class Group(Creator):
         self.name = data["displayName"]
         self.description = data["description"]
         self.created_at = (
-            parser.parse(data["createTime"])
+            _parse_datetime(data["createTime"])
             if data.get("createTime")
             else None
         )
         self.updated_at = (
-            parser.parse(data["updateTime"])
+            _parse_datetime(data["updateTime"])
             if data.get("updateTime")
             else None
         )
         self.owner = (
-            User(int(data["owner"].split("/")[1]), self.__api_key)
+            User(
+                int(data["owner"].split("/")[1]),
+                self.__api_key,
+                self.__client,
+            )
             if data.get("owner")
             else None
         )
@@ -381,11 +419,14 @@ class Group(Creator):
             params={"limit": 1, "filter": f"user == 'users/{user_id}'"},
             expected_status=[200],
             authorization=self.__api_key,
+            client=self.__client,
         )
 
         if not data["groupMemberships"]:
             return None
-        return GroupMember(data["groupMemberships"][0], self.__api_key, self)
+        return GroupMember(
+            data["groupMemberships"][0], self.__api_key, self, self.__client
+        )
 
     async def update_member(
         self, user_id: int, role_id: int = None
@@ -423,9 +464,10 @@ class Group(Creator):
             },
             expected_status=[200],
             authorization=self.__api_key,
+            client=self.__client,
         )
 
-        return GroupMember(data, self.__api_key, self)
+        return GroupMember(data, self.__api_key, self, self.__client)
 
     async def fetch_role(
         self, role_id: int, skip_cache: bool = False
@@ -475,6 +517,7 @@ class Group(Creator):
             "GET",
             f"/groups/{self.id}/memberships",
             authorization=self.__api_key,
+            client=self.__client,
             params={
                 "maxPageSize": limit if limit and limit <= 99 else 99,
                 "filter": filter,
@@ -484,7 +527,7 @@ class Group(Creator):
             max_yields=limit,
             expected_status=[200],
         ):
-            yield GroupMember(entry, self.__api_key, self)
+            yield GroupMember(entry, self.__api_key, self, self.__client)
 
     async def list_roles(
         self, limit: int = None
@@ -504,6 +547,7 @@ class Group(Creator):
             "GET",
             f"/groups/{self.id}/roles",
             authorization=self.__api_key,
+            client=self.__client,
             params={"maxPageSize": limit if limit and limit <= 20 else 20},
             data_key="groupRoles",
             cursor_key="pageToken",
@@ -535,6 +579,7 @@ class Group(Creator):
             "GET",
             f"/groups/{self.id}/join-requests",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             params={
                 "maxPageSize": limit if limit and limit <= 100 else 100,
@@ -544,7 +589,7 @@ class Group(Creator):
             cursor_key="nextPageToken",
             max_yields=limit,
         ):
-            yield GroupJoinRequest(entry, self.__api_key)
+            yield GroupJoinRequest(entry, self.__api_key, client=self.__client)
 
     async def fetch_shout(self) -> GroupShout:
         """
@@ -561,10 +606,11 @@ class Group(Creator):
             "GET",
             f"/groups/{self.id}/shout",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
-        return GroupShout(data, self.__api_key)
+        return GroupShout(data, self.__api_key, self.__client)
 
     async def accept_join_request(self, user_id: int):
         """
@@ -579,6 +625,7 @@ class Group(Creator):
             "POST",
             f"/groups/{self.id}/join-requests/{user_id}:accept",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json={},
         )
@@ -596,6 +643,7 @@ class Group(Creator):
             "POST",
             f"/groups/{self.id}/join-requests/{user_id}:decline",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json={},
         )
@@ -20,10 +20,35 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
 import time
-from typing import Callable, Generic, Optional, TypeVar, Union
+import urllib.parse
+import weakref
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from . import VERSION_INFO, http_session, user_agent
 from .exceptions import (
@@ -34,11 +59,834 @@ from .exceptions import (
     RateLimited,
 )
 
-__all__ = ("send_request", "iterate_request", "Operation")
+__all__ = (
+    "send_request",
+    "iterate_request",
+    "Operation",
+    "Client",
+    "RateLimiter",
+    "JSONCodec",
+    "OrjsonCodec",
+    "RequestEvent",
+    "RequestHook",
+    "TransportResponse",
+)
+
+_logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
+def _key_fingerprint(authorization: Optional[str]) -> str:
+    if not authorization:
+        return ""
+
+    return hashlib.sha256(authorization.encode()).hexdigest()[:16]
+
+
+def _endpoint_family(method: str, path: str) -> str:
+    return f"{method.upper()} {'/'.join(path.split('?')[0].split('/')[:5])}"
+
+
+# path segments which aren't followed by an ID, and IDs which are constant
+_ROUTE_SINGLETONS = ("memory-store",)
+_ROUTE_CONSTANTS = ("datastore", "entry")
+
+
+def _route_template(path: str) -> str:
+    segments = path.split("?")[0].split("/")
+
+    # after the version segment, paths alternate between collections and
+    # their IDs, such as `universes/{id}/places/{id}`
+    for index, segment in enumerate(segments):
+        if re.fullmatch(r"v\d+(?:alpha|beta)?\d*", segment):
+            break
+    else:
+        return "/".join(
+            "{id}" if segment.isdigit() else segment for segment in segments
+        )
+
+    is_id = False
+    for index in range(index + 1, len(segments)):
+        id, colon, verb = segments[index].partition(":")
+
+        if is_id and id not in _ROUTE_CONSTANTS:
+            segments[index] = "{id}" + colon + verb
+
+        is_id = not is_id and id not in _ROUTE_SINGLETONS
+
+    return "/".join(segments)
+
+
+def _copy_exception(error: BaseException) -> BaseException:
+    # HttpException's constructor takes the response rather than its args,
+    # so the copy is built without calling __init__
+    try:
+        fresh = type(error).__new__(type(error), *error.args)
+    except Exception:
+        return error
+
+    fresh.__dict__.update(error.__dict__)
+    fresh.__cause__ = error.__cause__
+    fresh.__context__ = error.__context__
+    fresh.__suppress_context__ = error.__suppress_context__
+    return fresh.with_traceback(error.__traceback__)
+
+
+def _parse_retry_after(headers) -> Optional[float]:
+    for header in ("retry-after", "x-ratelimit-reset"):
+        try:
+            return max(float(headers[header]), 0)
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    return None
+
+
+class JSONCodec:
+    """
+    Encodes and decodes JSON for request and response bodies, and decodes \
+    the attributes and user IDs headers of data store entries. Those headers \
+    are always encoded with the standard library so they stay ASCII. This \
+    codec uses the standard library's [`json`][json] module, and is used by \
+    default when [`orjson`](https://pypi.org/project/orjson/) isn't installed.
+
+    A different implementation can be used by subclassing this class and \
+    assigning an instance to `rblxopencloud.http.json_codec`.
+
+    Example:
+        ```py
+        class UltraJSONCodec(rblxopencloud.JSONCodec):
+            def dumps(self, obj):
+                return ujson.dumps(obj)
+
+            def loads(self, data):
+                return ujson.loads(data)
+
+        rblxopencloud.http.json_codec = UltraJSONCodec()
+        ```
+    """
+
+    def __repr__(self) -> str:
+        return f"<rblxopencloud.{type(self).__name__}>"
+
+    def dumps(self, obj: Any) -> str:
+        """
+        Encodes a python object as JSON.
+
+        Args:
+            obj: Any json compatible python object.
+
+        Returns:
+            The JSON string.
+        """
+
+        return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Decodes JSON into a python object.
+
+        Args:
+            data: The JSON string or UTF-8 bytes.
+
+        Returns:
+            The decoded python object.
+        """
+
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    A [`JSONCodec`][rblxopencloud.JSONCodec] which uses \
+    [`orjson`](https://pypi.org/project/orjson/), and is used by default \
+    when it is installed. Objects orjson can't handle, such as integers \
+    larger than 64 bits or dictionaries with non-string keys, fall back to \
+    the standard library.
+    """
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    return json_codec.dumps(obj)
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    return json_codec.loads(data)
+
+
+class RequestEvent:
+    """
+    Describes a single attempt of a request sent by \
+    [`send_request`][rblxopencloud.send_request], and is passed to each \
+    [`RequestHook`][rblxopencloud.RequestHook]. A request which is retried \
+    has a new event for each attempt.
+
+    Attributes:
+        method: The HTTP method such as `GET`.
+        route: The path with IDs and names replaced with `{id}`, such as \
+        `cloud/v2/universes/{id}/places/{id}`, for grouping requests to \
+        the same endpoint.
+        path: The path of the request, excluding the starting `/`.
+        api_key: A fingerprint of the API key or OAuth2 token the request \
+        was sent with, which can't be used to recover it. It is an empty \
+        string for unauthenticated requests.
+        attempt: The number of times the request was sent before this \
+        attempt, starting at 0.
+        request_bytes: The size of the request body.
+        status: The response's status code, or `None` before the response \
+        is received.
+        latency_seconds: The number of seconds between sending the request \
+        and receiving the whole response, or `None` before the response is \
+        received.
+        response_bytes: The size of the response body, or `None` before \
+        the response is received.
+        delay_seconds: For retries and rate limits, the number of seconds \
+        until the request is sent again, otherwise `None`.
+    """
+
+    __slots__ = (
+        "method",
+        "route",
+        "path",
+        "api_key",
+        "attempt",
+        "request_bytes",
+        "status",
+        "latency_seconds",
+        "response_bytes",
+        "delay_seconds",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        api_key: str,
+        attempt: int,
+        request_bytes: int,
+    ) -> None:
+        self.method: str = method
+        self.route: str = _route_template(path)
+        self.path: str = path
+        self.api_key: str = api_key
+        self.attempt: int = attempt
+        self.request_bytes: int = request_bytes
+        self.status: Optional[int] = None
+        self.latency_seconds: Optional[float] = None
+        self.response_bytes: Optional[int] = None
+        self.delay_seconds: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f'<rblxopencloud.RequestEvent method="{self.method}" \
+route="{self.route}" status={self.status} attempt={self.attempt}>'
+
+
+class RequestHook:
+    """
+    Receives a [`RequestEvent`][rblxopencloud.RequestEvent] at each stage of \
+    every request sent with a [`Client`][rblxopencloud.Client], such as for \
+    logging or metrics. Subclass it, override the stages you need, and add \
+    an instance to the client's `hooks`. Hooks are called synchronously \
+    from the event loop, so they should return quickly. Exceptions raised \
+    by a hook are logged to the `rblxopencloudasync.http` logger and don't \
+    affect the request.
+
+    Example:
+        ```py
+        class SlowRequestLogger(rblxopencloud.RequestHook):
+            def post_response(self, event):
+                if event.latency_seconds > 1:
+                    print(f"{event.method} {event.route} was slow")
+
+        rblxopencloud.http.default_client.hooks.append(SlowRequestLogger())
+        ```
+    """
+
+    def __repr__(self) -> str:
+        return f"<rblxopencloud.{type(self).__name__}>"
+
+    def pre_request(self, event: RequestEvent) -> None:
+        """
+        Called before each attempt is sent, after waiting for the rate \
+        limiter.
+
+        Args:
+            event: The attempt, without a response.
+        """
+
+    def post_response(self, event: RequestEvent) -> None:
+        """
+        Called after each attempt's response is received, including \
+        responses which are retried or raise an exception.
+
+        Args:
+            event: The attempt with its response.
+        """
+
+    def retry(self, event: RequestEvent) -> None:
+        """
+        Called when an attempt failed with a 5xx status and will be retried \
+        after `event.delay_seconds`.
+
+        Args:
+            event: The failed attempt.
+        """
+
+    def rate_limited(self, event: RequestEvent) -> None:
+        """
+        Called when an attempt failed with a `429` status. `delay_seconds` \
+        is the delay advertised by Roblox, or `None` if it didn't provide \
+        one.
+
+        Args:
+            event: The rate limited attempt.
+        """
+
+
+def _call_hooks(hooks: list[RequestHook], stage: str, event) -> None:
+    for hook in hooks:
+        try:
+            getattr(hook, stage)(event)
+        except Exception:
+            # a broken hook must not fail the request it is observing
+            _logger.exception("%r raised an exception in %s", hook, stage)
+
+
+class _TokenBucket:
+    def __init__(self) -> None:
+        self.capacity: Optional[int] = None
+        self.rate: Optional[float] = None
+        self.tokens: float = 0
+        self.updated: float = time.monotonic()
+        self.blocked_until: float = 0
+
+    def __refill(self, now: float) -> None:
+        if self.rate:
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        delay = max(self.blocked_until - now, 0)
+
+        if self.rate:
+            self.__refill(now)
+            self.tokens -= 1
+
+            if self.tokens < 0:
+                delay = max(delay, -self.tokens / self.rate)
+
+        return delay
+
+    def learn(
+        self,
+        now: float,
+        capacity: Optional[int],
+        window: Optional[float],
+        remaining: Optional[int],
+        reset: Optional[float],
+    ) -> None:
+        if capacity and window:
+            if self.rate is None:
+                self.tokens = capacity
+
+            self.__refill(now)
+            self.capacity, self.rate = capacity, capacity / window
+
+        if self.rate and remaining is not None:
+            self.tokens = min(self.tokens, remaining)
+
+        if remaining == 0 and reset:
+            self.blocked_until = max(self.blocked_until, now + reset)
+
+    def penalize(self, now: float, retry_after: float) -> None:
+        self.blocked_until = max(self.blocked_until, now + retry_after)
+
+        if self.rate:
+            self.__refill(now)
+            self.tokens = min(self.tokens, 0)
+
+
+class RateLimiter:
+    """
+    Paces requests so they stay within the rate limits Roblox advertises in \
+    the `x-ratelimit-limit`, `x-ratelimit-remaining` and `x-ratelimit-reset` \
+    response headers. Limits are learned and tracked separately for every \
+    API key (or OAuth2 token) and endpoint family, using a token bucket for \
+    each.
+
+    Until an endpoint family has responded with rate limit headers, requests \
+    to it are not delayed. After a `429` response, requests to the family are \
+    held back until the `Retry-After` delay has passed.
+
+    The library uses a shared instance in `rblxopencloudasync.http.rate_limiter` \
+    for all requests. Set it to `None` to disable pacing entirely.
+
+    Example:
+        ```py
+        rblxopencloudasync.http.rate_limiter = None
+        ```
+    """
+
+    def __init__(self) -> None:
+        self.__buckets: dict[tuple[str, str], _TokenBucket] = {}
+        self.__lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<rblxopencloud.RateLimiter buckets={len(self.__buckets)}>"
+
+    def __get_bucket(
+        self, authorization: Optional[str], method: str, path: str
+    ) -> _TokenBucket:
+        key = (_key_fingerprint(authorization), _endpoint_family(method, path))
+
+        bucket = self.__buckets.get(key)
+        if not bucket:
+            bucket = self.__buckets[key] = _TokenBucket()
+
+        return bucket
+
+    def reserve(
+        self, authorization: Optional[str], method: str, path: str
+    ) -> float:
+        """
+        Reserves a slot for a request and returns how long the caller should \
+        wait before sending it.
+
+        Args:
+            authorization: The API key or OAuth2 token the request will use.
+            method: The HTTP method of the request.
+            path: The HTTP path of the request, as given to \
+            [`send_request`][rblxopencloud.send_request].
+
+        Returns:
+            The number of seconds to wait before sending the request.
+        """
+
+        with self.__lock:
+            return self.__get_bucket(authorization, method, path).reserve(
+                time.monotonic()
+            )
+
+    def update(
+        self, authorization: Optional[str], method: str, path: str, headers
+    ) -> None:
+        """
+        Learns the current limits of an endpoint family from a response's \
+        rate limit headers. Responses without those headers are ignored.
+
+        Args:
+            authorization: The API key or OAuth2 token the request used.
+            method: The HTTP method of the request.
+            path: The HTTP path of the request.
+            headers: The response headers.
+        """
+
+        if not headers.get("x-ratelimit-limit") and not headers.get(
+            "x-ratelimit-remaining"
+        ):
+            return
+
+        capacity, window = None, None
+        for policy in headers.get("x-ratelimit-limit", "").split(","):
+            match = re.match(r"\s*(\d+)(?:.*;\s*w=(\d+(?:\.\d+)?))?", policy)
+            if not match:
+                continue
+
+            policy_capacity = int(match.group(1))
+            policy_window = float(match.group(2)) if match.group(2) else None
+
+            if not policy_window:
+                if capacity is None:
+                    capacity = policy_capacity
+                continue
+
+            if (
+                window is None
+                or policy_capacity / policy_window < capacity / window
+            ):
+                capacity, window = policy_capacity, policy_window
+
+        try:
+            remaining = int(headers.get("x-ratelimit-remaining"))
+        except (TypeError, ValueError):
+            remaining = None
+
+        try:
+            reset = float(headers.get("x-ratelimit-reset"))
+        except (TypeError, ValueError):
+            reset = None
+
+        with self.__lock:
+            self.__get_bucket(authorization, method, path).learn(
+                time.monotonic(), capacity, window or reset, remaining, reset
+            )
+
+    def penalize(
+        self,
+        authorization: Optional[str],
+        method: str,
+        path: str,
+        retry_after: float,
+    ) -> None:
+        """
+        Holds back an endpoint family after Roblox rejected a request with \
+        HTTP status `429`.
+
+        Args:
+            authorization: The API key or OAuth2 token the request used.
+            method: The HTTP method of the request.
+            path: The HTTP path of the request.
+            retry_after: The number of seconds until requests may resume.
+        """
+
+        with self.__lock:
+            self.__get_bucket(authorization, method, path).penalize(
+                time.monotonic(), retry_after
+            )
+
+
+rate_limiter: Optional[RateLimiter] = RateLimiter()
+base_url: str = "https://apis.roblox.com/"
+json_codec: JSONCodec = OrjsonCodec() if orjson else JSONCodec()
+
+
+class TransportResponse:
+    """
+    A response returned by a transport, which is the callable a \
+    [`Client`][rblxopencloud.Client] uses to send requests. Custom \
+    transports return it so that [`send_request`][rblxopencloud.send_request] \
+    can handle responses the same way no matter how they were received.
+
+    Args:
+        status: The HTTP status code.
+        headers: The response headers.
+        content: The raw response body.
+
+    Attributes:
+        status: The HTTP status code.
+        headers: The response headers. Lookups are case-insensitive.
+        content: The raw response body.
+    """
+
+    __slots__ = ("status", "headers", "content")
+
+    def __init__(
+        self, status: int, headers: Mapping[str, str], content: bytes = b""
+    ) -> None:
+        self.status: int = status
+        self.headers: Mapping[str, str] = (
+            headers
+            if isinstance(headers, (CIMultiDict, CIMultiDictProxy))
+            else CIMultiDict(headers)
+        )
+        self.content: bytes = content
+
+    def __repr__(self) -> str:
+        return f"<rblxopencloud.TransportResponse status={self.status} \
+content_length={len(self.content)}>"
+
+    @property
+    def text(self) -> str:
+        """
+        The response body decoded as UTF-8.
+        """
+
+        return self.content.decode(errors="replace")
+
+
+class Client:
+    """
+    Owns the HTTP session, connection pool and default settings used to send \
+    requests. By default, every request uses a shared client with aiohttp's \
+    default pool of 100 connections; creating a client allows the pool to \
+    be sized to the number of workers, or isolated for each API key.
+
+    A client is used by passing it to \
+    [`ApiKey`][rblxopencloud.ApiKey], [`Experience`][rblxopencloud.Experience], \
+    [`Group`][rblxopencloud.Group], [`User`][rblxopencloud.User], \
+    [`Webhook`][rblxopencloud.Webhook] or \
+    [`OAuth2App`][rblxopencloud.OAuth2App]. Every object created from them, \
+    such as data stores and the users and experiences of an OAuth2 token, \
+    sends its requests with the same client.
+
+    Example:
+        ```py
+        async with rblxopencloudasync.Client(pool_size=32) as client:
+            experience = rblxopencloudasync.Experience(
+                00000000, "api-key", client=client
+            )
+        ```
+
+    Args:
+        pool_size: The maximum number of concurrent connections.
+        per_host_limit: The maximum number of concurrent connections to a \
+        single host. Defaults to no limit other than `pool_size`.
+        keep_alive: Whether connections are reused between requests.
+        dns_cache_seconds: The number of seconds to cache DNS lookups for. \
+        Set to `None` to disable caching.
+        timeout: The default number of seconds until a request times out.
+        base_url: The URL requests are sent to, defaults to \
+        `https://apis.roblox.com/`.
+        rate_limiter: The rate limiter used to pace requests. Defaults to the \
+        shared `rblxopencloudasync.http.rate_limiter`.
+        prefetch_pages: The default number of pages \
+        [`iterate_request`][rblxopencloud.iterate_request] fetches ahead of \
+        the consumer when listing, such as with \
+        [`DataStore.list_keys`][rblxopencloud.DataStore.list_keys]. Set to 0 \
+        to only fetch the next page once the current one is consumed.
+        hooks: The [`RequestHook`][rblxopencloud.RequestHook]s called for \
+        every request sent with this client.
+        transport: A callable used to send requests instead of the session, \
+        such as to route them through a proxy, a recorder, or an in-memory \
+        fake. It is called with the `method`, the full `url`, `headers`, \
+        `params`, `data` as bytes or `None`, `timeout` and any other keyword \
+        arguments given to [`send_request`][rblxopencloud.send_request], and \
+        must return an awaitable [`TransportResponse`\
+        ][rblxopencloud.TransportResponse]. It can call \
+        [`Client.request`][rblxopencloud.Client.request] to send a request \
+        normally.
+        coalesce_requests: Whether identical `GET` requests sent while one \
+        is already in flight wait for its response instead of being sent \
+        again. Requests are identical when they have the same API key, \
+        path, parameters, headers and `expected_status`. This reduces quota \
+        use when many workers fetch the same resource at once, such as \
+        with [`DataStore.get_entry`][rblxopencloud.DataStore.get_entry].
+        session: An existing `aiohttp.ClientSession` to use. The pool options \
+        are ignored when provided.
+
+    Attributes:
+        timeout: The default number of seconds until a request times out.
+        base_url: The URL requests are sent to, or `None` for the default.
+        rate_limiter: The rate limiter used to pace requests, or `None` for \
+        the shared rate limiter.
+        prefetch_pages: The default number of pages to fetch ahead when \
+        listing.
+        hooks: The [`RequestHook`][rblxopencloud.RequestHook]s called for \
+        every request sent with this client. Hooks can be added or removed \
+        at any time.
+        transport: The callable used to send requests, or `None` to send \
+        them with the session.
+        coalesce_requests: Whether identical in-flight `GET` requests share \
+        a single response.
+
+    Note:
+        The session is created when the first request is sent, as aiohttp \
+        sessions must be created inside the event loop they are used with.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 100,
+        per_host_limit: Optional[int] = None,
+        keep_alive: bool = True,
+        dns_cache_seconds: Optional[float] = 10,
+        timeout: Optional[float] = 15,
+        base_url: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        prefetch_pages: int = 0,
+        hooks: Optional[list[RequestHook]] = None,
+        transport: Optional[
+            Callable[..., Awaitable[TransportResponse]]
+        ] = None,
+        coalesce_requests: bool = False,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
+        self.timeout: Optional[float] = timeout
+        self.base_url: Optional[str] = base_url
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.prefetch_pages: int = prefetch_pages
+        self.hooks: list[RequestHook] = list(hooks or [])
+        self.transport: Optional[
+            Callable[..., Awaitable[TransportResponse]]
+        ] = transport
+        self.coalesce_requests: bool = coalesce_requests
+        self.__in_flight: dict[tuple, asyncio.Task] = {}
+
+        self.__pool_size: int = pool_size
+        self.__per_host_limit: Optional[int] = per_host_limit
+        self.__keep_alive: bool = keep_alive
+        self.__dns_cache_seconds: Optional[float] = dns_cache_seconds
+        self.__session: Optional[aiohttp.ClientSession] = session
+
+    def __repr__(self) -> str:
+        return f"<rblxopencloud.Client base_url={self.base_url}>"
+
+    async def __aenter__(self) -> "Client":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        The `aiohttp.ClientSession` used to send requests. It is created on \
+        first access, which must be inside a running event loop.
+        """
+
+        if not self.__session or self.__session.closed:
+            self.__session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.__pool_size,
+                    limit_per_host=self.__per_host_limit or 0,
+                    force_close=not self.__keep_alive,
+                    use_dns_cache=bool(self.__dns_cache_seconds),
+                    ttl_dns_cache=self.__dns_cache_seconds,
+                )
+            )
+
+        return self.__session
+
+    def bind(self, api_key: str) -> None:
+        """
+        Binds an API key so requests sent with it which aren't given a \
+        client, such as direct calls to \
+        [`send_request`][rblxopencloud.send_request], use this client. \
+        Objects created with a client don't need their key bound. A key can \
+        only be bound to one client, binding it again replaces the previous \
+        client. Bindings are released when the client is closed or garbage \
+        collected.
+
+        Args:
+            api_key: The API key to bind.
+
+        Raises:
+            ValueError: An OAuth2 token was given. Tokens are short lived, so \
+            they are never bound; pass the client to the object instead.
+        """
+
+        if api_key.startswith("Bearer "):
+            raise ValueError("OAuth2 tokens can't be bound to a client.")
+
+        _bound_clients[api_key] = self
+
+    def unbind(self, api_key: str) -> None:
+        """
+        Unbinds an API key from this client, so requests using it which \
+        aren't given a client are sent with the shared client again.
+
+        Args:
+            api_key: The API key to unbind.
+        """
+
+        if _bound_clients.get(api_key) is self:
+            del _bound_clients[api_key]
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: Optional[dict] = None,
+        data: Optional[bytes] = None,
+        timeout: Union[float, aiohttp.ClientTimeout, None] = None,
+        **kwargs,
+    ) -> TransportResponse:
+        """
+        Sends a request with the session and reads the whole response. This \
+        is the transport used when `transport` is `None`.
+
+        Args:
+            method: The HTTP method such as `GET`.
+            url: The full URL to send the request to.
+            headers: The request headers.
+            params: The query parameters.
+            data: The request body.
+            timeout: The number of seconds until the request times out.
+            **kwargs: Passed to `aiohttp.ClientSession.request`.
+
+        Returns:
+            The status, headers and body of the response.
+        """
+
+        if isinstance(timeout, (int, float)):
+            timeout = aiohttp.ClientTimeout(total=timeout)
+
+        async with self.session.request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            data=data,
+            timeout=timeout,
+            **kwargs,
+        ) as response:
+            return TransportResponse(
+                response.status, response.headers, await response.read()
+            )
+
+    async def _coalesce(
+        self, key: tuple, send: Callable[[], Awaitable]
+    ) -> tuple:
+        task = self.__in_flight.get(key)
+        leader = task is None
+
+        if leader:
+            task = self.__in_flight[key] = asyncio.ensure_future(send())
+
+            def forget(_):
+                if self.__in_flight.get(key) is task:
+                    del self.__in_flight[key]
+
+            task.add_done_callback(forget)
+
+        # shielded so one waiter being cancelled doesn't cancel the request
+        # for every other waiter
+        try:
+            status, body, headers = await asyncio.shield(task)
+        except Exception as error:
+            if leader:
+                raise
+            failure = _copy_exception(error)
+        else:
+            if leader:
+                return status, body, headers
+
+            # every waiter gets its own copy, as bodies and headers are
+            # mutable
+            return status, copy.deepcopy(body), headers.copy()
+
+        # and its own exception, as raising one adds to its traceback
+        raise failure
+
+    async def close(self) -> None:
+        """
+        Closes the session and all open connections, and unbinds every API \
+        key bound to the client. A new session is created \
+        if the client is used again.
+        """
+
+        for api_key, client in list(_bound_clients.items()):
+            if client is self:
+                self.unbind(api_key)
+
+        if self.__session:
+            await self.__session.close()
+            self.__session = None
+
+
+# values are weak so a client which is no longer used releases its keys
+_bound_clients: weakref.WeakValueDictionary[str, Client] = (
+    weakref.WeakValueDictionary()
+)
+default_client: Client = Client(session=http_session)
+
+
 async def send_request(
     method: str,
     path: str,
@@ -47,6 +895,9 @@ async def send_request(
     retry_max_attempts: int = 2,
     retry_interval_seconds: float = 1,
     retry_interval_exponent: float = 2,
+    rate_limit_max_attempts: int = 3,
+    retry_deadline_seconds: Optional[float] = None,
+    client: Optional[Client] = None,
     **kwargs,
 ) -> tuple[int, Union[str, int, float, dict, list, None], dict]:
     """
@@ -79,9 +930,19 @@ async def send_request(
         retry_max_attempts: The number of retries to complete on an 5xx \
         error. Set to 0 for no retries, defaults to 2.
         retry_interval_seconds: The number of seconds between each retry on a \
-        5xx error. Set to 0 for no delay interval.
+        5xx error. Set to 0 for no delay interval. Each delay is randomly \
+        jittered by up to 50% so concurrent retries don't happen in lockstep.
         retry_interval_exponent: The second interval exponenet to apply to \
         `retry_interval_seconds` between each attempt.
+        rate_limit_max_attempts: The number of retries to complete on a `429` \
+        error, after waiting for the delay advertised by Roblox. Set to 0 to \
+        raise [`RateLimited`][rblxopencloud.RateLimited] immediately.
+        retry_deadline_seconds: The maximum total number of seconds to spend \
+        on the request including retries. A retry which would exceed it is \
+        not attempted and the error is raised instead. Defaults to no deadline.
+        client: The [`Client`][rblxopencloud.Client] to send the request \
+        with. Defaults to the client bound to `authorization`, or the shared \
+        client if there isn't one.
 
     Other parameters:
         params (dict[str, Union[str, int, float, bool]]): A dictionary of \
@@ -89,11 +950,12 @@ async def send_request(
         headers (dict[str, str]): A dictionary of headers to include in the \
         request. `user-agent` and `authorization`/`x-api-key` are overwritten.
         json (Union[dict, list, str, int, float, bool]): Any json compatible \
-        python object to be sent in the request.
+        python object to be sent in the request. It is encoded with \
+        `rblxopencloud.http.json_codec`.
         data (Union[bytes], dict): The data to send with the request. *Can \
         not be used with `json` parameter.*
         timeout (float): The number of seconds until the request times out. \
-        Defaults to 15 seconds. Set to `None` for no timeout (not recommended).
+        Defaults to the client's timeout, which is 15 seconds unless changed.
     
     Returns:
         A tuple with the first value being the status code, the second value \
@@ -108,21 +970,85 @@ async def send_request(
         NotFound: HTTP status `401` returned when `expected_status` is not \
         `None` and `401` is not in the list.
         RateLimited: HTTP status `429` returned when `expected_status` is not \
-        `None` and `429` is not in the list.
+        `None`, `429` is not in the list and `rate_limit_max_attempts` \
+        retries have been exhausted.
     
     Note:
         The `send_request` function may function slightly differently between \
         the `rblxopencloud` and `rblxopencloudasync` modules.
+
+    Note:
+        Requests are paced by `rblxopencloudasync.http.rate_limiter` to stay \
+        within the rate limits Roblox advertises. See \
+        [`RateLimiter`][rblxopencloud.RateLimiter] for more information.
     """
 
-    global http_session
-    if not http_session:
-        http_session = aiohttp.ClientSession()
+    if not client:
+        client = _bound_clients.get(authorization, default_client)
 
-    headers = {"user-agent": user_agent, **kwargs.get("headers", {})}
+    arguments = (
+        method,
+        path,
+        authorization,
+        expected_status,
+        retry_max_attempts,
+        retry_interval_seconds,
+        retry_interval_exponent,
+        rate_limit_max_attempts,
+        retry_deadline_seconds,
+        client,
+    )
+
+    if (
+        client.coalesce_requests
+        and method.upper() == "GET"
+        and kwargs.get("data") is None
+        and kwargs.get("json") is None
+    ):
+        return await client._coalesce(
+            _coalescing_key(authorization, path, expected_status, kwargs),
+            lambda: _send_request(*arguments, **kwargs),
+        )
+
+    return await _send_request(*arguments, **kwargs)
 
-    if kwargs.get("headers"):
-        del kwargs["headers"]
+
+def _coalescing_key(
+    authorization: Optional[str],
+    path: str,
+    expected_status: Optional[list[int]],
+    kwargs: dict,
+) -> tuple:
+    return (
+        authorization,
+        path,
+        tuple(
+            sorted(
+                (key, str(value))
+                for key, value in (kwargs.get("params") or {}).items()
+                if value is not None
+            )
+        ),
+        tuple(sorted((kwargs.get("headers") or {}).items())),
+        tuple(expected_status or ()),
+    )
+
+
+async def _send_request(
+    method: str,
+    path: str,
+    authorization: Optional[str],
+    expected_status: Optional[list[int]],
+    retry_max_attempts: int,
+    retry_interval_seconds: float,
+    retry_interval_exponent: float,
+    rate_limit_max_attempts: int,
+    retry_deadline_seconds: Optional[float],
+    client: Client,
+    **kwargs,
+) -> tuple[int, Union[str, int, float, dict, list, None], dict]:
+    extra_headers = kwargs.pop("headers", None) or {}
+    headers = {"user-agent": user_agent, **extra_headers}
 
     if authorization:
         headers[
@@ -136,6 +1062,19 @@ async def send_request(
     if path.startswith("/"):
         path = f"cloud/v2{path}"
 
+    if kwargs.get("json") is not None:
+        kwargs["data"] = json_codec.dumps(kwargs.pop("json")).encode()
+        if not any(header.lower() == "content-type" for header in headers):
+            headers["content-type"] = "application/json"
+    else:
+        kwargs.pop("json", None)
+
+    # dictionaries are form encoded here so every transport receives bytes
+    if isinstance(kwargs.get("data"), dict):
+        kwargs["data"] = urllib.parse.urlencode(kwargs["data"]).encode()
+        if not any(header.lower() == "content-type" for header in headers):
+            headers["content-type"] = "application/x-www-form-urlencoded"
+
     if kwargs.get("params"):
         for k, v in kwargs["params"].copy().items():
             if v is None:
@@ -143,25 +1082,68 @@ async def send_request(
             if type(v) == bool:
                 kwargs["params"][k] = str(v).lower()
 
+    limiter = client.rate_limiter or rate_limiter
+
     if not kwargs.get("timeout"):
-        kwargs["timeout"] = 15
+        kwargs["timeout"] = client.timeout
 
-    response = await http_session.request(
-        method,
-        f"https://apis.roblox.com/{path}",
-        headers=headers,
-        **kwargs,
+    deadline = (
+        time.monotonic() + retry_deadline_seconds
+        if retry_deadline_seconds is not None
+        else None
     )
 
-    if "application/json" in response.headers.get("Content-Type", ""):
-        body = await response.json()
-    else:
-        body = await response.text()
+    attempt, data = 0, kwargs.get("data")
+    request_bytes = len(data) if isinstance(data, (bytes, str)) else 0
+    transport = client.transport or client.request
+
+    while True:
+        if limiter:
+            delay = limiter.reserve(authorization, method, path)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        event = None
+        if client.hooks:
+            event = RequestEvent(
+                method,
+                path,
+                _key_fingerprint(authorization),
+                attempt,
+                request_bytes,
+            )
+            _call_hooks(client.hooks, "pre_request", event)
+            started = time.perf_counter()
+        attempt += 1
+
+        response = await transport(
+            method,
+            f"{client.base_url or base_url}{path}",
+            headers=headers,
+            **kwargs,
+        )
+
+        if limiter:
+            limiter.update(authorization, method, path, response.headers)
 
-    if VERSION_INFO == "alpha":
-        print(f"[DEBUG] {method} /{path} - {response.status}\n{body}")
+        content = response.content
+        if "application/json" in response.headers.get("Content-Type", ""):
+            body = json_codec.loads(content) if content.strip() else None
+        else:
+            body = response.text
+
+        if event:
+            event.status = response.status
+            event.latency_seconds = time.perf_counter() - started
+            event.response_bytes = len(content)
+            _call_hooks(client.hooks, "post_response", event)
+
+        if VERSION_INFO == "alpha":
+            print(f"[DEBUG] {method} /{path} - {response.status}\n{body}")
+
+        if not expected_status or response.status in expected_status:
+            return response.status, body, response.headers
 
-    if expected_status and response.status not in expected_status:
         if response.status in [400, 401]:
             raise HttpException(response.status, body)
         elif response.status == 403:
@@ -169,43 +1151,61 @@ async def send_request(
         elif response.status == 404:
             raise NotFound(response.status, body)
         elif response.status == 429:
-            raise RateLimited(response.status, body)
+            retry_after = _parse_retry_after(response.headers)
+
+            if event:
+                event.delay_seconds = retry_after
+                _call_hooks(client.hooks, "rate_limited", event)
+
+            if rate_limit_max_attempts > 0 and (
+                deadline is None
+                or time.monotonic() + (retry_after or 1) <= deadline
+            ):
+                rate_limit_max_attempts -= 1
+
+                if limiter:
+                    limiter.penalize(
+                        authorization, method, path, retry_after or 1
+                    )
+                else:
+                    await asyncio.sleep(retry_after or 1)
+                continue
+
+            raise RateLimited(response.status, body, retry_after)
         elif response.status >= 500:
-            if retry_max_attempts > 0:
-                time.sleep(retry_interval_seconds)
-
-                return await send_request(
-                    method,
-                    path,
-                    authorization,
-                    expected_status,
-                    retry_max_attempts - 1,
-                    retry_interval_seconds * retry_interval_exponent,
-                    retry_interval_exponent,
-                    **kwargs,
-                )
+            delay = retry_interval_seconds * random.uniform(0.5, 1.5)
+
+            if retry_max_attempts > 0 and (
+                deadline is None or time.monotonic() + delay <= deadline
+            ):
+                retry_max_attempts -= 1
+                retry_interval_seconds *= retry_interval_exponent
+
+                if event:
+                    event.delay_seconds = delay
+                    _call_hooks(client.hooks, "retry", event)
+
+                await asyncio.sleep(delay)
+                continue
 
             raise HttpException(response.status, body)
-        elif response.status_code == 409:
+        elif response.status == 409:
             raise Conflict(response.status, body)
-        elif response.status not in expected_status:
+        else:
             raise HttpException(response.status, body)
 
-    return response.status, body, response.headers
-
 
-async def iterate_request(
-    *args,
+async def _iterate_pages(
+    args: tuple,
+    kwargs: dict,
     data_key: str,
     cursor_key: str,
-    max_yields: int = None,
-    post_request_hook: Callable = None,
-    **kwargs,
+    max_yields: Optional[int],
+    post_request_hook: Optional[Callable],
 ):
+    next_cursor, fetched = "", 0
 
-    next_cursor, yields = "", 0
-
-    while max_yields is None or yields < max_yields:
+    while max_yields is None or fetched < max_yields:
 
         if not kwargs.get("params"):
             kwargs["params"] = {}
@@ -218,12 +1218,8 @@ async def iterate_request(
         if not data.get(data_key) or len(data[data_key]) == 0:
             break
 
-        for entry in data[data_key]:
-            yield entry
-
-            yields += 1
-            if max_yields is not None and yields >= max_yields:
-                break
+        yield data[data_key]
+        fetched += len(data[data_key])
 
         data_cursor = data.get("nextPageCursor", data.get("nextPageToken"))
         if next_cursor == data_cursor or not data_cursor:
@@ -232,6 +1228,90 @@ async def iterate_request(
         next_cursor = data_cursor
 
 
+async def _prefetch_pages(pages, buffer_size: int):
+    buffer = asyncio.Queue(buffer_size)
+
+    async def produce():
+        try:
+            async for page in pages:
+                await buffer.put((page, None))
+            await buffer.put((None, None))
+        except Exception as error:
+            await buffer.put((None, error))
+
+    producer = asyncio.create_task(produce())
+
+    try:
+        while True:
+            page, error = await buffer.get()
+
+            if error:
+                raise error
+            if page is None:
+                break
+
+            yield page
+    finally:
+        producer.cancel()
+
+
+async def iterate_request(
+    *args,
+    data_key: str,
+    cursor_key: str,
+    max_yields: int = None,
+    post_request_hook: Callable = None,
+    prefetch_pages: Optional[int] = None,
+    yield_pages: bool = False,
+    **kwargs,
+):
+    """
+    Sends paginated requests with [`send_request`\
+    ][rblxopencloud.send_request] and yields every entry in `data_key` of \
+    each page, following the cursor until the last page. If `yield_pages` is \
+    `True`, it yields each page's list of entries instead.
+
+    When `prefetch_pages` is above 0, pages are fetched by a background task \
+    which stays up to that many pages ahead of the consumer, so network \
+    latency overlaps with processing entries. It defaults to the \
+    `prefetch_pages` of the [`Client`][rblxopencloud.Client] used for the \
+    request.
+    """
+
+    if prefetch_pages is None:
+        authorization = kwargs.get(
+            "authorization", args[2] if len(args) > 2 else None
+        )
+        client = kwargs.get("client") or _bound_clients.get(
+            authorization, default_client
+        )
+        prefetch_pages = client.prefetch_pages
+
+    pages = _iterate_pages(
+        args, kwargs, data_key, cursor_key, max_yields, post_request_hook
+    )
+    if prefetch_pages > 0:
+        pages = _prefetch_pages(pages, prefetch_pages)
+
+    yields = 0
+    try:
+        async for page in pages:
+            if max_yields is not None:
+                page = page[: max_yields - yields]
+
+            if yield_pages:
+                yield page
+            else:
+                for entry in page:
+                    yield entry
+
+            yields += len(page)
+            if max_yields is not None and yields >= max_yields:
+                return
+    finally:
+        await pages.aclose()
+
+
 class Operation(Generic[T]):
     """
     Represents a request to the Roblox API which takes time to complete such \
@@ -249,10 +1329,12 @@ class Operation(Generic[T]):
         self_api_key: str,
         return_type: T,
         cached_response: dict = None,
+        self_client: Optional[Client] = None,
         **return_meta,
     ) -> None:
         self.__path: str = path
         self.__api_key: str = self_api_key
+        self.__client: Optional[Client] = self_client
         self.__return_type: T = return_type
         self.__return_meta: dict = return_meta
         self.__cached_response: dict = cached_response
@@ -274,7 +1356,11 @@ class Operation(Generic[T]):
         """
 
         _, body, _ = await send_request(
-            "GET", self.__path, self.__api_key, expected_status=[200]
+            "GET",
+            self.__path,
+            self.__api_key,
+            expected_status=[200],
+            client=self.__client,
         )
         if not body.get("done"):
             return None
@@ -323,8 +1409,6 @@ class Operation(Generic[T]):
             else:
                 return self.__return_type
 
-        import time
-
         start_time = time.time()
         while True:
             result = await self.fetch_status()
@@ -335,5 +1419,5 @@ class Operation(Generic[T]):
                 raise TimeoutError("Timeout exceeded")
 
             if interval_seconds > 0:
-                time.sleep(interval_seconds)
+                await asyncio.sleep(interval_seconds)
             interval_seconds *= interval_exponent
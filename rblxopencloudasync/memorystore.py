@@ -25,10 +25,9 @@ import json
 import urllib.parse
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional, Union
 
-from dateutil import parser
-
 from .exceptions import HttpException, NotFound, PreconditionFailed
-from .http import iterate_request, send_request
+from .http import Client, iterate_request, send_request
+from .utils import _LazyAttribute, _parse_datetime
 
 if TYPE_CHECKING:
     from .experience import Experience
@@ -49,15 +48,27 @@ class SortedMapEntry:
         expires_at: The timestamp the entry will expire at.
     """
 
+    __slots__ = (
+        "_expire_time",
+        "key",
+        "sort_key",
+        "value",
+        "etag",
+        "_lazy_expires_at",
+    )
+
     def __init__(self, data) -> None:
-        self._data: dict = data
         self.key: str = data["id"]
         self.sort_key: Optional[Union[int, float, str]] = data.get(
             "numericSortKey"
         ) or data.get("stringSortKey")
         self.value: int = data["value"]
         self.etag: str = data["etag"]
-        self.expires_at: datetime.datetime = parser.parse(data["expireTime"])
+        self._expire_time: Optional[str] = data.get("expireTime")
+
+    @_LazyAttribute
+    def expires_at(self) -> datetime.datetime:
+        return _parse_datetime(self._expire_time)
 
     def __repr__(self) -> str:
         return f'<rblxopencloud.SortedMapEntry \
@@ -73,9 +84,10 @@ class SortedMap:
         experience (Experience): The experience the sorted map is a part of.
     """
 
-    def __init__(self, name, experience, api_key):
+    def __init__(self, name, experience, api_key, client=None):
         self.name: str = name
         self.__api_key: str = api_key
+        self.__client: Optional[Client] = client
         self.experience: Experience = experience
 
     def __repr__(self) -> str:
@@ -140,6 +152,7 @@ class SortedMap:
             f"/universes/{self.experience.id}/memory-store/\
 sorted-maps/{urllib.parse.quote_plus(self.name)}/items",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             params={
                 "orderBy": "desc" if descending else None,
@@ -169,6 +182,7 @@ sorted-maps/{urllib.parse.quote_plus(self.name)}/items",
 sorted-maps/{urllib.parse.quote_plus(self.name)}/items/\
 {urllib.parse.quote_plus(key)}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
@@ -211,6 +225,7 @@ sorted-maps/{urllib.parse.quote_plus(self.name)}/items/\
 sorted-maps/{urllib.parse.quote_plus(self.name)}/items/\
 {urllib.parse.quote_plus(key)}",
                 authorization=self.__api_key,
+                client=self.__client,
                 expected_status=[200, 404, 409],
                 params={"allowMissing": str(not exclusive_update).lower()},
                 json={
@@ -230,6 +245,7 @@ sorted-maps/{urllib.parse.quote_plus(self.name)}/items/\
                 f"/universes/{self.experience.id}/memory-store\
 /sorted-maps/{urllib.parse.quote_plus(self.name)}/items",
                 authorization=self.__api_key,
+                client=self.__client,
                 expected_status=[200, 409],
                 params={"id": urllib.parse.quote_plus(key)},
                 json={
@@ -278,6 +294,7 @@ sorted-maps/{urllib.parse.quote_plus(self.name)}/items/\
 sorted-maps/{urllib.parse.quote_plus(self.name)}/items/\
 {urllib.parse.quote_plus(key)}",
             authorization=self.__api_key,
+            client=self.__client,
             params={"etag": etag},
         )
 
@@ -291,9 +308,10 @@ class MemoryStoreQueue:
         experience: The experience the queue belongs to.
     """
 
-    def __init__(self, name, experience, api_key):
+    def __init__(self, name, experience, api_key, client=None):
         self.name: str = name
         self.__api_key: str = api_key
+        self.__client: Optional[Client] = client
         self.experience: Experience = experience
 
     def __repr__(self) -> str:
@@ -322,6 +340,7 @@ class MemoryStoreQueue:
             f"/universes/{self.experience.id}/memory-store/\
 queues/{urllib.parse.quote_plus(self.name)}/items:add",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             json={
                 "Data": value,
@@ -358,6 +377,7 @@ queues/{urllib.parse.quote_plus(self.name)}/items:add",
             f"/universes/{self.experience.id}/memory-store/\
 queues/{urllib.parse.quote_plus(self.name)}/items:read",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200, 204],
             params={
                 "count": count,
@@ -386,6 +406,7 @@ queues/{urllib.parse.quote_plus(self.name)}/items:read",
             f"/universes/{self.experience.id}/memory-store/\
 queues/{urllib.parse.quote_plus(self.name)}/items:discard",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
             params={"readId": read_id},
             json={},
@@ -0,0 +1,218 @@
+# MIT License
+
+# Copyright (c) 2022-2025 treeben77
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import bisect
+import threading
+from collections import defaultdict
+from typing import Iterable
+
+from .http import RequestEvent, RequestHook
+
+__all__ = ("MetricsCollector",)
+
+
+def _labels(names: Iterable[str], values: Iterable) -> str:
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value)
+            .replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n"),
+        )
+        for name, value in zip(names, values)
+    )
+
+
+class MetricsCollector(RequestHook):
+    """
+    A [`RequestHook`][rblxopencloud.RequestHook] which counts requests, \
+    retries, rate limits and bytes, and records a latency histogram for each \
+    route. The metrics can be rendered in the Prometheus text format to be \
+    served to a Prometheus scraper.
+
+    Example:
+        ```py
+        metrics = rblxopencloud.MetricsCollector()
+        rblxopencloud.http.default_client.hooks.append(metrics)
+
+        ...
+
+        print(metrics.render_prometheus())
+        ```
+
+    Args:
+        latency_buckets: The upper bounds in seconds of the latency \
+        histogram's buckets.
+        namespace: The prefix of every metric's name.
+
+    Attributes:
+        latency_buckets: The upper bounds in seconds of the latency \
+        histogram's buckets.
+        namespace: The prefix of every metric's name.
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Iterable[float] = (
+            0.05,
+            0.1,
+            0.25,
+            0.5,
+            1,
+            2.5,
+            5,
+            10,
+        ),
+        namespace: str = "rblxopencloud",
+    ) -> None:
+        self.latency_buckets: tuple[float, ...] = tuple(
+            sorted(latency_buckets)
+        )
+        self.namespace: str = namespace
+        self.__lock: threading.Lock = threading.Lock()
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f"<rblxopencloud.MetricsCollector \
+routes={len(self.__latency_counts)}>"
+
+    def reset(self) -> None:
+        """
+        Clears every metric recorded so far.
+        """
+
+        with self.__lock:
+            self.__requests: dict[tuple, int] = defaultdict(int)
+            self.__retries: dict[tuple, int] = defaultdict(int)
+            self.__rate_limits: dict[tuple, int] = defaultdict(int)
+            self.__request_bytes: dict[tuple, int] = defaultdict(int)
+            self.__response_bytes: dict[tuple, int] = defaultdict(int)
+            self.__latency_counts: dict[tuple, list[int]] = {}
+            self.__latency_sums: dict[tuple, float] = defaultdict(float)
+
+    def post_response(self, event: RequestEvent) -> None:
+        route = (event.method, event.route)
+
+        with self.__lock:
+            self.__requests[(*route, str(event.status), event.api_key)] += 1
+            self.__request_bytes[route] += event.request_bytes
+            self.__response_bytes[route] += event.response_bytes
+
+            counts = self.__latency_counts.get(route)
+            if counts is None:
+                counts = self.__latency_counts[route] = [0] * (
+                    len(self.latency_buckets) + 1
+                )
+            bucket = bisect.bisect_left(
+                self.latency_buckets, event.latency_seconds
+            )
+            counts[bucket] += 1
+            self.__latency_sums[route] += event.latency_seconds
+
+    def retry(self, event: RequestEvent) -> None:
+        with self.__lock:
+            self.__retries[(event.method, event.route)] += 1
+
+    def rate_limited(self, event: RequestEvent) -> None:
+        with self.__lock:
+            key = (event.method, event.route, event.api_key)
+            self.__rate_limits[key] += 1
+
+    def render_prometheus(self) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format. \
+        Requests are labelled with their `method` and `route`, and requests \
+        and rate limits are also labelled with their `status` and the \
+        fingerprint of their `api_key`.
+
+        Returns:
+            The metrics as a string ending in a new line.
+        """
+
+        name = self.namespace
+        lines = []
+
+        def counter(metric, help, values, label_names):
+            lines.append(f"# HELP {name}_{metric} {help}")
+            lines.append(f"# TYPE {name}_{metric} counter")
+            for labels, value in sorted(values.items()):
+                labels = _labels(label_names, labels)
+                lines.append(f"{name}_{metric}{{{labels}}} {value}")
+
+        with self.__lock:
+            counter(
+                "requests_total",
+                "Responses received, including retried attempts.",
+                self.__requests,
+                ("method", "route", "status", "api_key"),
+            )
+            counter(
+                "retries_total",
+                "Attempts retried after a 5xx status.",
+                self.__retries,
+                ("method", "route"),
+            )
+            counter(
+                "rate_limited_total",
+                "Attempts which received a 429 status.",
+                self.__rate_limits,
+                ("method", "route", "api_key"),
+            )
+            counter(
+                "request_bytes_total",
+                "Bytes sent in request bodies.",
+                self.__request_bytes,
+                ("method", "route"),
+            )
+            counter(
+                "response_bytes_total",
+                "Bytes received in response bodies.",
+                self.__response_bytes,
+                ("method", "route"),
+            )
+
+            metric = f"{name}_request_duration_seconds"
+            lines.append(
+                f"# HELP {metric} Seconds from sending a request to \
+receiving the whole response."
+            )
+            lines.append(f"# TYPE {metric} histogram")
+            for (method, route), counts in sorted(
+                self.__latency_counts.items()
+            ):
+                labels = _labels(("method", "route"), (method, route))
+                total = 0
+
+                for bucket, count in zip(
+                    (*self.latency_buckets, "+Inf"), counts
+                ):
+                    total += count
+                    lines.append(
+                        f'{metric}_bucket{{{labels},le="{bucket}"}} {total}'
+                    )
+
+                latency = self.__latency_sums[(method, route)]
+                lines.append(f"{metric}_sum{{{labels}}} {latency}")
+                lines.append(f"{metric}_count{{{labels}}} {total}")
+
+        return "\n".join(lines) + "\n"
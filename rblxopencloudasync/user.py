@@ -24,10 +24,9 @@ import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Literal, Optional, Union
 
-from dateutil import parser
-
 from .creator import Creator
-from .http import Operation, iterate_request, send_request
+from .http import Client, Operation, iterate_request, send_request
+from .utils import _LazyAttribute, _parse_datetime
 
 if TYPE_CHECKING:
     from .group import GroupMember
@@ -251,6 +250,8 @@ class InventoryItem:
         id (int): The ID of the inventory item.
     """
 
+    __slots__ = ("id",)
+
     def __init__(self, id) -> None:
         self.id: int = id
 
@@ -276,14 +277,23 @@ class InventoryAsset(InventoryItem):
         ready for sale or in hold.
     """
 
+    __slots__ = (
+        "_asset_type",
+        "_collectable_state",
+        "instance_id",
+        "collectable_item_id",
+        "collectable_instance_id",
+        "serial_number",
+        "_lazy_type",
+        "_lazy_collectable_state",
+    )
+
     def __init__(self, data: dict) -> None:
         super().__init__(data["assetId"])
-        self._data: dict = data
-        self.type: InventoryAssetType = InventoryAssetType(
-            ASSET_TYPE_STRINGS.get(
-                data["inventoryItemAssetType"], InventoryAssetType.Unknown
-            )
-        )
+        self._asset_type: str = data["inventoryItemAssetType"]
+        self._collectable_state: Optional[str] = data.get(
+            "collectibleDetails", {}
+        ).get("instanceState", None)
         self.instance_id: int = data["instanceId"]
         self.collectable_item_id: Optional[str] = data.get(
             "collectibleDetails", {}
@@ -295,16 +305,24 @@ class InventoryAsset(InventoryItem):
             "collectibleDetails", {}
         ).get("serialNumber", None)
 
-        collectable_state = data.get("collectibleDetails", {}).get(
-            "instanceState", None
+    @_LazyAttribute
+    def type(self) -> InventoryAssetType:
+        return InventoryAssetType(
+            ASSET_TYPE_STRINGS.get(
+                self._asset_type,
+                InventoryAssetType.Unknown,
+            )
         )
-        self.collectable_state: Optional[InventoryItemState] = (
+
+    @_LazyAttribute
+    def collectable_state(self) -> Optional[InventoryItemState]:
+        return (
             InventoryItemState(
                 STATE_TYPE_STRINGS.get(
-                    collectable_state, InventoryItemState.Unknown
+                    self._collectable_state, InventoryItemState.Unknown
                 )
             )
-            if collectable_state
+            if self._collectable_state
             else None
         )
 
@@ -320,6 +338,8 @@ class InventoryBadge(InventoryItem):
         id (int): The ID of the badge.
     """
 
+    __slots__ = ()
+
     def __init__(self, data) -> None:
         super().__init__(data["badgeId"])
 
@@ -335,6 +355,8 @@ class InventoryGamePass(InventoryItem):
         id (int): The ID of the game pass.
     """
 
+    __slots__ = ()
+
     def __init__(self, data) -> None:
         super().__init__(data["gamePassId"])
 
@@ -350,6 +372,8 @@ class InventoryPrivateServer(InventoryItem):
         id (int): The ID of the game pass.
     """
 
+    __slots__ = ()
+
     def __init__(self, data) -> None:
         super().__init__(data["privateServerId"])
 
@@ -445,9 +469,13 @@ class User(Creator):
         api_key (str): Your API key created from \
         [Creator Dashboard](https://create.roblox.com/credentials) with \
         access to this user.
+        client (Optional[Client]): The [`Client`][rblxopencloud.Client] to \
+        send requests using this API key with. Defaults to the shared client.
     """
 
-    def __init__(self, id: int, api_key: str) -> None:
+    def __init__(
+        self, id: int, api_key: str, client: Optional[Client] = None
+    ) -> None:
         self._data: Optional[dict] = getattr(self, "_data", None)  # certain Group classes inherit this
         self.username: Optional[str] = None
         self.id: int = id
@@ -463,7 +491,10 @@ class User(Creator):
 
         self.__api_key = api_key
 
-        super().__init__(id, api_key, "User")
+        # requests and objects created from this one are sent with the client
+        self.__client: Optional[Client] = client
+
+        super().__init__(id, api_key, "User", client)
 
     def __repr__(self) -> str:
         return f"<rblxopencloud.User id={self.id}>"
@@ -480,13 +511,14 @@ class User(Creator):
             "GET",
             f"/users/{self.id}",
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
         self._data = data
         self.username = data["name"]
         self.display_name = data["displayName"]
-        self.created_at = parser.parse(data["createTime"])
+        self.created_at = _parse_datetime(data["createTime"])
         self.about = data["about"]
         self.locale = data["locale"]
         self.premium = data.get("premium")
@@ -535,6 +567,7 @@ class User(Creator):
                 "format": format.upper(),
             },
             authorization=self.__api_key,
+            client=self.__client,
             expected_status=[200],
         )
 
@@ -543,6 +576,7 @@ class User(Creator):
             self.__api_key,
             lambda response: response["imageUri"],
             cached_response=data.get("response"),
+            self_client=self.__client,
         )
 
     async def list_groups(
@@ -567,6 +601,7 @@ class User(Creator):
             "GET",
             "/groups/-/memberships",
             authorization=self.__api_key,
+            client=self.__client,
             params={
                 "maxPageSize": limit if limit and limit <= 99 else 99,
                 "filter": f"user == 'users/{self.id}'",
@@ -575,7 +610,7 @@ class User(Creator):
             cursor_key="nextPageToken",
             expected_status=[200],
         ):
-            yield GroupMember(entry, self.__api_key)
+            yield GroupMember(entry, self.__api_key, client=self.__client)
 
     async def list_inventory(
         self,
@@ -671,6 +706,7 @@ class User(Creator):
                 "filter": ";".join([f"{k}={v}" for k, v in filter.items()]),
             },
             authorization=self.__api_key,
+            client=self.__client,
             data_key="inventoryItems",
             cursor_key="pageToken",
             expected_status=[200],
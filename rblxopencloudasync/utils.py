@@ -0,0 +1,92 @@
+# MIT License
+
+# Copyright (c) 2022-2025 treeben77
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import datetime
+import re
+from typing import Any, Callable, Optional
+
+__all__ = ()
+
+_RFC3339 = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?"
+    r"([Zz]|[+-]\d{2}:?\d{2})?$"
+)
+_timezones: dict[str, datetime.timezone] = {
+    "Z": datetime.timezone.utc,
+    "z": datetime.timezone.utc,
+}
+
+
+def _parse_datetime(timestamp: str) -> datetime.datetime:
+    match = _RFC3339.match(timestamp)
+    if match is None:
+        from dateutil import parser
+
+        return parser.parse(timestamp)
+
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+
+    tzinfo = None
+    if offset:
+        tzinfo = _timezones.get(offset)
+        if tzinfo is None:
+            minutes = int(offset[1:3]) * 60 + int(offset[-2:])
+            tzinfo = datetime.timezone(
+                datetime.timedelta(
+                    minutes=-minutes if offset[0] == "-" else minutes
+                )
+            )
+            _timezones[offset] = tzinfo
+
+    return datetime.datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        int(fraction[:6].ljust(6, "0")) if fraction else 0,
+        tzinfo,
+    )
+
+
+class _LazyAttribute:
+    def __init__(self, decode: Callable[[Any], Any]) -> None:
+        self.decode = decode
+        self.__doc__ = decode.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attribute = f"_lazy_{name}"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.attribute)
+        except AttributeError:
+            value = self.decode(instance)
+            setattr(instance, self.attribute, value)
+            return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        setattr(instance, self.attribute, value)
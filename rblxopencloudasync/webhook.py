@@ -23,16 +23,15 @@
 import base64
 import hashlib
 import hmac
-import json
 import time
 from datetime import datetime
 from typing import Callable, Optional, Union
 
-from dateutil import parser
-
 from .exceptions import UnhandledEventType, UnknownEventType
 from .experience import Experience
+from .http import Client, _json_loads
 from .user import User
+from .utils import _parse_datetime
 
 __all__ = (
     "Webhook",
@@ -58,17 +57,21 @@ class Webhook:
         api_key (str): Your API key created from \
         [Creator Dashboard](https://create.roblox.com/credentials) with \
         access to all objects that are generated in events.
+        client (Optional[Client]): The [`Client`][rblxopencloud.Client] \
+        used by objects generated in events. Defaults to the shared client.
     """
 
     def __init__(
         self,
         secret: Optional[Union[str, bytes]] = None,
         api_key: Optional[str] = None,
+        client: Optional[Client] = None,
     ) -> None:
         self.secret: Optional[bytes] = (
             secret.encode() if type(secret) == str else secret
         )
         self.__api_key: Optional[str] = api_key
+        self.__client: Optional[Client] = client
         self.__events: list[Callable] = {}
         self.__on_error: Optional[Callable] = None
 
@@ -125,9 +128,9 @@ class Webhook:
                 if 0 < time.time() - int(split_header[0].split("=")[1]) > 600:
                     return "Invalid signature", 401
 
-        body = json.loads(body)
+        body = _json_loads(body)
 
-        notification = Notification(body, self, self.__api_key)
+        notification = Notification(body, self, self.__api_key, self.__client)
 
         try:
             event_type = EVENT_TYPES.get(body["EventType"])
@@ -137,10 +140,12 @@ class Webhook:
                 )
 
             if event_type == "on_test":
-                notification = TestNotification(body, self, self.__api_key)
+                notification = TestNotification(
+                    body, self, self.__api_key, self.__client
+                )
             elif event_type == "on_right_to_erasure_request":
                 notification = RightToErasureRequestNotification(
-                    body, self, self.__api_key
+                    body, self, self.__api_key, self.__client
                 )
 
             function = self.__events.get(event_type)
@@ -187,9 +192,9 @@ class Notification:
     Represents a recieved webhook event.
     """
 
-    def __init__(self, body, webhook, api_key):
+    def __init__(self, body, webhook, api_key, client=None):
         self.notification_id: str = body["NotificationId"]
-        self.timestamp: datetime = parser.parse(body["EventTime"])
+        self.timestamp: datetime = _parse_datetime(body["EventTime"])
         self.webhook: Webhook = webhook
 
     def __repr__(self) -> str:
@@ -206,11 +211,11 @@ class TestNotification(Notification):
         user (User): The user who triggered the test.
     """
 
-    def __init__(self, body, webhook, api_key):
-        super().__init__(body, webhook, api_key)
+    def __init__(self, body, webhook, api_key, client=None):
+        super().__init__(body, webhook, api_key, client)
         event = body["EventPayload"]
 
-        self.user: User = User(event["UserId"], api_key)
+        self.user: User = User(event["UserId"], api_key, client)
 
     def __repr__(self) -> str:
         return f'<rblxopencloud.TestNotification \
@@ -223,13 +228,13 @@ class RightToErasureRequestNotification(Notification):
     to erase all their user data.
     """
 
-    def __init__(self, body, webhook, api_key):
-        super().__init__(body, webhook, api_key)
+    def __init__(self, body, webhook, api_key, client=None):
+        super().__init__(body, webhook, api_key, client)
         event = body["EventPayload"]
 
         self.user_id: int = event["UserId"]
         self.experiences: list[Experience] = [
-            Experience(id, api_key) for id in event["GameIds"]
+            Experience(id, api_key, client) for id in event["GameIds"]
         ]
 
     def __repr__(self) -> str:
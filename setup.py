@@ -30,4 +30,5 @@ setup(
         "python-dateutil",
         "PyNaCl",
     ],
+    extras_require={"speedups": ["orjson"]},
 )
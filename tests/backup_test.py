@@ -0,0 +1,288 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from fake_server import FakeDataStoreTestCase
+
+import rblxopencloud
+
+ENTRY_PATH = "datastores/v1/universes/0/standard-datastores/datastore/entries\
+/entry"
+
+
+class exporter(FakeDataStoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+
+        for index in range(5):
+            self.store.entries[("global", str(index))] = ({"n": index}, 1)
+        self.store.entries[("players", "1")] = ("player", 2)
+
+    def tearDown(self):
+        super().tearDown()
+        self.directory.cleanup()
+
+    def exporter(self, name):
+        return rblxopencloud.DataStoreExporter(
+            self.experience,
+            os.path.join(self.directory.name, name),
+            datastores=["store"],
+            concurrency=2,
+            page_size=2,
+        )
+
+    def test_exports_all_scopes_to_jsonl(self):
+        exporter = self.exporter("backup.jsonl")
+
+        self.assertEqual(exporter.run(), 6)
+
+        with open(exporter.path) as file:
+            records = [json.loads(line) for line in file]
+
+        self.assertEqual(len(records), 6)
+        self.assertIn(
+            {
+                "datastore": "store",
+                "scope": "players",
+                "key": "1",
+                "value": "player",
+                "version": "2",
+                "created": "2024-01-01T00:00:00+00:00",
+                "updated": "2024-01-01T00:00:00+00:00",
+                "users": [],
+                "metadata": {},
+            },
+            records,
+        )
+
+        # a finished export clears its checkpoint, so a rerun is complete
+        self.assertEqual(exporter.run(), 6)
+
+    def test_rerun_replaces_jsonl_export(self):
+        exporter = self.exporter("backup.jsonl")
+        exporter.run()
+        exporter.run()
+
+        with open(exporter.path) as file:
+            self.assertEqual(len(file.readlines()), 6)
+
+        exporter.run(resume=False)
+
+        with open(exporter.path) as file:
+            self.assertEqual(len(file.readlines()), 6)
+
+    def test_rerun_replaces_sqlite_export(self):
+        exporter = self.exporter("backup.db")
+        exporter.run()
+        del self.store.entries[("global", "0")]
+        exporter.run()
+
+        connection = sqlite3.connect(exporter.path)
+        rows = connection.execute("SELECT scope, key FROM entries").fetchall()
+        connection.close()
+
+        self.assertEqual(len(rows), 5)
+        self.assertNotIn(("global", "0"), rows)
+
+    def test_resumes_sqlite_export_from_checkpoint(self):
+        exporter = self.exporter("backup.db")
+        handler, calls = self.server.handlers[ENTRY_PATH], []
+
+        def flaky(method, params, body):
+            calls.append(params)
+            if len(calls) == 5:
+                return 403, {}, {}
+            return handler(method, params, body)
+
+        self.server.handlers[ENTRY_PATH] = flaky
+
+        with self.assertRaises(rblxopencloud.Forbidden):
+            exporter.run()
+
+        self.server.handlers[ENTRY_PATH] = handler
+
+        self.assertEqual(exporter.run(), 2)
+
+        connection = sqlite3.connect(exporter.path)
+        rows = connection.execute(
+            "SELECT scope, key, value FROM entries ORDER BY scope, key"
+        ).fetchall()
+        connection.close()
+
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[-1], ("players", "1", '"player"'))
+        self.assertEqual(exporter.run(), 6)
+
+
+class importer(FakeDataStoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "backup.jsonl")
+
+        with open(self.path, "w") as file:
+            for index in range(5):
+                record = {
+                    "datastore": "store",
+                    "scope": "global",
+                    "key": str(index),
+                    "value": index,
+                    "version": "1",
+                    "created": "2024-01-01T00:00:00+00:00",
+                    "updated": "2024-01-01T00:00:00+00:00",
+                    "users": [],
+                    "metadata": {},
+                }
+                file.write(json.dumps(record) + "\n")
+
+    def tearDown(self):
+        super().tearDown()
+        self.directory.cleanup()
+
+    def test_resumes_after_retryable_error(self):
+        handler, limited = self.server.handlers[ENTRY_PATH], [True]
+
+        def flaky(method, params, body):
+            if params["entryKey"] == "2" and limited[0]:
+                return 429, {"Retry-After": "0"}, {}
+            return handler(method, params, body)
+
+        self.server.handlers[ENTRY_PATH] = flaky
+        importer = rblxopencloud.DataStoreImporter(
+            self.experience, self.path, concurrency=1
+        )
+
+        with self.assertRaises(rblxopencloud.RateLimited):
+            importer.run()
+
+        self.assertEqual(
+            sorted(self.store.entries), [("global", "0"), ("global", "1")]
+        )
+
+        limited[0] = False
+        result = importer.run()
+
+        self.assertEqual(
+            sorted(result.succeeded),
+            ["store/global/2", "store/global/3", "store/global/4"],
+        )
+        self.assertEqual(len(self.store.entries), 5)
+        self.assertEqual(len(importer.run().succeeded), 0)
+
+    def test_resume_skips_records_written_concurrently(self):
+        handler, limited = self.server.handlers[ENTRY_PATH], [True]
+
+        def flaky(method, params, body):
+            if params["entryKey"] == "2" and limited[0]:
+                return 429, {"Retry-After": "0"}, {}
+            return handler(method, params, body)
+
+        self.server.handlers[ENTRY_PATH] = flaky
+        for index in range(5):
+            self.store.entries[("global", str(index))] = ("old", 1)
+
+        importer = rblxopencloud.DataStoreImporter(
+            self.experience, self.path, mode="match_version", concurrency=5
+        )
+
+        with self.assertRaises(rblxopencloud.RateLimited):
+            importer.run()
+
+        limited[0] = False
+        result = importer.run()
+
+        self.assertEqual(list(result.succeeded), ["store/global/2"])
+        self.assertEqual(result.conflicts, {})
+        self.assertEqual(
+            [value for value, _ in self.store.entries.values()],
+            [0, 1, 2, 3, 4],
+        )
+
+    def test_exclusive_create_reports_conflicts(self):
+        self.store.entries[("global", "0")] = ("existing", 3)
+
+        result = rblxopencloud.DataStoreImporter(
+            self.experience, self.path, mode="exclusive_create"
+        ).run()
+
+        self.assertEqual(list(result.conflicts), ["store/global/0"])
+        self.assertEqual(len(result.succeeded), 4)
+        self.assertEqual(self.store.entries[("global", "0")], ("existing", 3))
+
+
+class mirror(FakeDataStoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.datastore = self.experience.get_datastore("store", scope=None)
+        self.directory = tempfile.TemporaryDirectory()
+        self.mirror = rblxopencloud.DataStoreMirror(
+            self.datastore, os.path.join(self.directory.name, "mirror.db")
+        )
+
+        for index in range(5):
+            self.store.entries[("global", str(index))] = (index, 1)
+
+    def tearDown(self):
+        self.mirror.close()
+        super().tearDown()
+        self.directory.cleanup()
+
+    def entry_reads(self):
+        return [
+            path
+            for method, path, _ in self.server.requests
+            if method == "GET" and path == ENTRY_PATH
+        ]
+
+    def test_only_records_changed_entries(self):
+        self.assertEqual(self.mirror.sync(), 5)
+        self.assertEqual(len(self.entry_reads()), 5)
+
+        self.store.entries[("global", "1")] = ("changed", 2)
+        self.store.entries[("players", "9")] = ("new", 1)
+        self.server.requests.clear()
+
+        # one listing page, a version probe per known key, and a read of
+        # only the changed and new keys
+        self.assertEqual(self.mirror.sync(), 2)
+        self.assertEqual(len(self.entry_reads()), 2)
+        self.assertEqual(len(self.server.requests), 8)
+
+        self.server.requests.clear()
+        self.assertEqual(self.mirror.sync(keys=["global/1"]), 0)
+        self.assertEqual(self.entry_reads(), [])
+        self.assertEqual(len(self.server.requests), 1)
+
+        changes = list(self.mirror.changes(after=5))
+        self.assertEqual(
+            sorted(
+                (change.scope, change.key, change.value) for change in changes
+            ),
+            [("global", "1", "changed"), ("players", "9", "new")],
+        )
+        self.assertEqual(self.mirror.sync(), 0)
+
+    def test_records_removed_entries(self):
+        self.mirror.sync()
+        self.datastore.remove_entry("global/2")
+        self.datastore.remove_entry("global/3")
+
+        self.assertEqual(self.mirror.sync(keys=["global/2"]), 1)
+        self.assertEqual(self.mirror.sync(), 1)
+
+        changes = list(self.mirror.changes(after=5))
+        self.assertEqual([change.key for change in changes], ["2", "3"])
+        self.assertTrue(all(change.removed for change in changes))
+
+        self.mirror.prune_changes(changes[0].sequence)
+        self.assertEqual(len(list(self.mirror.changes())), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,535 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import os
+import subprocess
+import sys
+import time
+import unittest
+
+from fake_server import (
+    AsyncFakeDataStoreTestCase,
+    FakeDataStoreTestCase,
+)
+
+import rblxopencloud
+import rblxopencloudasync
+
+
+class get_entries(FakeDataStoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.datastore = self.experience.get_datastore("store")
+
+        for index in range(20):
+            self.store.entries[("global", str(index))] = (index, 1)
+
+    def test_preserves_order(self):
+        keys = [str(index) for index in range(20)]
+
+        results = list(self.datastore.get_entries(keys, concurrency=4))
+
+        self.assertEqual([key for key, _ in results], keys)
+        for key, (value, info) in results:
+            self.assertEqual(value, int(key))
+            self.assertIsInstance(info, rblxopencloud.EntryInfo)
+
+    def test_failures_do_not_abort_batch(self):
+        results = dict(
+            self.datastore.get_entries(
+                ["1", "missing", "2"], concurrency=2, ordered=False
+            )
+        )
+
+        self.assertIsInstance(results["missing"], rblxopencloud.NotFound)
+        self.assertEqual(results["1"][0], 1)
+        self.assertEqual(results["2"][0], 2)
+
+
+class bulk_writes(FakeDataStoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.datastore = self.experience.get_datastore("store")
+
+    def test_set_entries_reports_conflicts(self):
+        self.store.entries[("global", "taken")] = ("old", 1)
+
+        result = self.datastore.set_entries(
+            {"taken": "new", "free": "new"}, exclusive_create=True
+        )
+
+        self.assertEqual(list(result.succeeded), ["free"])
+        self.assertIsInstance(
+            result.succeeded["free"], rblxopencloud.EntryVersion
+        )
+        self.assertEqual(result.conflicts["taken"].value, "old")
+        self.assertEqual(self.store.entries[("global", "taken")][0], "old")
+
+    def test_set_entries_reports_retryable_failures(self):
+        handler = self.server.handlers.pop(
+            "datastores/v1/universes/0/standard-datastores/datastore/entries"
+            "/entry"
+        )
+        self.server.handlers[
+            "datastores/v1/universes/0/standard-datastores/datastore/entries"
+            "/entry"
+        ] = lambda method, params, body: (
+            (503, {}, {})
+            if params["entryKey"] == "broken"
+            else handler(method, params, body)
+        )
+
+        result = self.datastore.set_entries(
+            {"broken": 1, "fine": 2}, concurrency=1
+        )
+
+        self.assertEqual(list(result.succeeded), ["fine"])
+        self.assertIsInstance(
+            result.retryable["broken"], rblxopencloud.HttpException
+        )
+
+    def test_remove_entries(self):
+        self.store.entries[("global", "1")] = (1, 1)
+        self.store.entries[("global", "2")] = (2, 1)
+
+        result = self.datastore.remove_entries(["1", "2"])
+
+        self.assertEqual(result.succeeded, {"1": None, "2": None})
+        self.assertEqual(self.store.entries, {})
+
+
+class entry_cache(FakeDataStoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = rblxopencloud.LRUEntryCache(max_size=2, ttl_seconds=60)
+        self.datastore = self.experience.get_datastore(
+            "store", cache=self.cache
+        )
+
+        for index in range(3):
+            self.store.entries[("global", str(index))] = ({"coins": index}, 1)
+
+    def test_reads_are_served_from_cache(self):
+        value, _ = self.datastore.get_entry("1")
+        value["coins"] = 100
+        value, info = self.datastore.get_entry("1")
+
+        self.assertEqual(value, {"coins": 1})
+        self.assertIsInstance(info, rblxopencloud.EntryInfo)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_returned_info_is_a_copy(self):
+        _, info = self.datastore.get_entry("1")
+        info.metadata["edited"] = True
+        info.users.append(1)
+        _, info = self.datastore.get_entry("1")
+
+        self.assertEqual((info.metadata, info.users), ({}, []))
+
+    def test_counts_concurrent_reads(self):
+        self.datastore.get_entry("1")
+
+        with ThreadPoolExecutor(8) as executor:
+            for _ in range(800):
+                executor.submit(self.datastore.get_entry, "1")
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (800, 1))
+
+    def test_incomplete_subclass_can_not_be_created(self):
+        class GetOnlyCache(rblxopencloud.EntryCache):
+            def get(self, key):
+                return None
+
+        with self.assertRaises(TypeError):
+            GetOnlyCache()
+
+    def test_writes_invalidate_cache(self):
+        self.datastore.get_entry("1")
+        self.datastore.set_entry("1", {"coins": 5})
+
+        self.assertEqual(self.datastore.get_entry("1")[0], {"coins": 5})
+
+        self.datastore.remove_entry("1")
+
+        with self.assertRaises(rblxopencloud.NotFound):
+            self.datastore.get_entry("1")
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_write_during_fetch_is_not_overwritten(self):
+        writes = []
+
+        def transport(method, url, headers, **kwargs):
+            response = self.client.request(method, url, headers, **kwargs)
+
+            # the write lands after the read was answered with the old value
+            if method == "GET" and not writes:
+                writes.append(self.datastore.set_entry("1", {"coins": 5}))
+
+            return response
+
+        self.client.transport = transport
+
+        self.assertEqual(self.datastore.get_entry("1")[0], {"coins": 1})
+        self.assertEqual(self.datastore.get_entry("1")[0], {"coins": 5})
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_evicts_least_recently_used(self):
+        self.datastore.get_entry("0")
+        self.datastore.get_entry("1")
+        self.datastore.get_entry("0")
+        self.datastore.get_entry("2")
+        self.datastore.get_entry("0")
+        self.datastore.get_entry("1")
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 4))
+
+    def test_expired_entries_are_fetched(self):
+        self.cache.ttl_seconds = 0
+        self.datastore.get_entry("1")
+        self.datastore.get_entry("1")
+
+        self.assertEqual(self.cache.misses, 2)
+
+
+class update_entry(FakeDataStoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.datastore = self.experience.get_datastore("store")
+
+    def test_creates_missing_entry(self):
+        value, version = self.datastore.update_entry(
+            "1", lambda value, info: (value or 0) + 1
+        )
+
+        self.assertEqual(value, 1)
+        self.assertEqual(version.version, "1")
+        self.assertEqual(self.store.entries[("global", "1")], (1, 1))
+
+    def test_conflict_reuses_current_value(self):
+        self.store.entries[("global", "1")] = (10, 1)
+        seen = []
+
+        def transform(value, info):
+            seen.append((value, info.version))
+            if len(seen) == 1:
+                self.store.entries[("global", "1")] = (20, 2)
+            return value + 1
+
+        value, _ = self.datastore.update_entry(
+            "1", transform, retry_interval_seconds=0.2
+        )
+
+        self.assertEqual(seen, [(10, "1"), (20, "2")])
+        self.assertEqual(value, 21)
+        self.assertEqual(self.store.entries[("global", "1")], (21, 3))
+        self.assertEqual(
+            [method for method, _, _ in self.server.requests],
+            ["GET", "POST", "POST"],
+        )
+
+        # the first retry is backed off too, by at least half the interval
+        self.assertGreaterEqual(
+            self.server.requests[2][2] - self.server.requests[1][2], 0.1
+        )
+
+    def test_gives_up_after_max_attempts(self):
+        self.store.entries[("global", "1")] = (0, 1)
+
+        def transform(value, info):
+            self.store.entries[("global", "1")] = (0, int(info.version) + 1)
+            return value + 1
+
+        with self.assertRaises(rblxopencloud.PreconditionFailed):
+            self.datastore.update_entry(
+                "1", transform, max_attempts=3, retry_interval_seconds=0
+            )
+
+        self.assertEqual(len(self.server.requests), 4)
+
+
+class increment_buffer(FakeDataStoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.datastore = self.experience.get_datastore("store")
+
+    def test_coalesces_increments_per_key(self):
+        with rblxopencloud.IncrementBuffer(
+            self.datastore, flush_interval_seconds=60
+        ) as buffer:
+            futures = [buffer.increment("visits", 1) for _ in range(50)]
+            other = buffer.increment("other", -2)
+
+        self.assertEqual({future.result() for future in futures}, {50})
+        self.assertEqual(other.result(), -2)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_flushes_on_interval_and_size(self):
+        buffer = rblxopencloud.IncrementBuffer(
+            self.datastore, flush_interval_seconds=0.1, max_pending_keys=60
+        )
+
+        self.assertEqual(buffer.increment("visits", 3).result(timeout=5), 3)
+
+        buffer.flush_interval_seconds = 60
+        time.sleep(0.2)
+        futures = [buffer.increment(str(index), 1) for index in range(60)]
+
+        self.assertEqual(futures[-1].result(timeout=5), 1)
+        buffer.close()
+
+    def test_failed_flush_keeps_deltas(self):
+        failures = [ConnectionError("connection reset")]
+
+        def transport(method, url, headers, **kwargs):
+            if failures:
+                raise failures.pop()
+            return self.client.request(method, url, headers, **kwargs)
+
+        self.client.transport = transport
+
+        with rblxopencloud.IncrementBuffer(
+            self.datastore, flush_interval_seconds=60
+        ) as buffer:
+            first = buffer.increment("visits", 2)
+            buffer.flush()
+
+            self.assertFalse(first.done())
+
+            second = buffer.increment("visits", 3)
+
+        self.assertEqual((first.result(), second.result()), (5, 5))
+        self.assertEqual(self.store.entries[("global", "visits")][0], 5)
+
+    def test_zero_totals_are_not_sent(self):
+        with rblxopencloud.IncrementBuffer(
+            self.datastore, flush_interval_seconds=60
+        ) as buffer:
+            future = buffer.increment("visits", 4)
+            buffer.increment("visits", -4)
+
+        self.assertIsNone(future.result())
+        self.assertEqual(self.server.requests, [])
+
+    def test_requeues_are_capped(self):
+        def transport(method, url, headers, **kwargs):
+            raise ConnectionError("connection reset")
+
+        self.client.transport = transport
+
+        with rblxopencloud.IncrementBuffer(
+            self.datastore, flush_interval_seconds=60, max_attempts=2
+        ) as buffer:
+            future = buffer.increment("visits", 2)
+            buffer.flush()
+
+            self.assertFalse(future.done())
+
+            buffer.flush()
+
+            self.assertIsInstance(future.exception(), ConnectionError)
+
+    def test_flushes_when_interpreter_exits(self):
+        script = f"""
+import rblxopencloud
+
+client = rblxopencloud.Client(base_url={self.server.base_url!r})
+datastore = rblxopencloud.Experience(0, "key", client=client).get_datastore(
+    "store"
+)
+buffer = rblxopencloud.IncrementBuffer(datastore, flush_interval_seconds=60)
+buffer.increment("visits", 3)
+buffer.increment("other", 1)
+"""
+
+        subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            timeout=30,
+            env={**os.environ, "PYTHONPATH": os.path.abspath("..")},
+        )
+
+        self.assertEqual(self.store.entries[("global", "visits")], (3, 1))
+        self.assertEqual(self.store.entries[("global", "other")], (1, 1))
+
+
+class list_keys_parallel(FakeDataStoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.datastore = self.experience.get_datastore("store")
+
+        self.keys = [str(index) for index in range(300)]
+        for key in self.keys:
+            self.store.entries[("global", key)] = (0, 1)
+
+    def test_lists_prefix_shards(self):
+        keys = [
+            entry.key
+            for entry in self.datastore.list_keys_parallel(
+                prefixes=["1", "2"], concurrency=2, page_size=25
+            )
+        ]
+
+        self.assertEqual(
+            sorted(keys), sorted(key for key in self.keys if key[0] in "12")
+        )
+
+    def test_splits_hot_shards(self):
+        keys = [
+            entry.key
+            for entry in self.datastore.list_keys_parallel(
+                alphabet="0123456789", concurrency=4, page_size=10
+            )
+        ]
+
+        self.assertEqual(sorted(keys), sorted(self.keys))
+        self.assertGreater(len(self.server.requests), 10)
+
+    def test_split_keeps_first_page(self):
+        # sorts onto the first page of the "1" shard, but no shard split from
+        # it covers "-"
+        self.store.entries[("global", "1-special")] = (0, 1)
+
+        keys = [
+            entry.key
+            for entry in self.datastore.list_keys_parallel(
+                alphabet="0123456789", concurrency=4, page_size=10
+            )
+        ]
+
+        self.assertEqual(sorted(keys), sorted(self.keys + ["1-special"]))
+
+    def test_alphabet_requires_scope(self):
+        datastore = self.datastore.experience.get_datastore(
+            "store", scope=None
+        )
+
+        with self.assertRaises(ValueError):
+            next(iter(datastore.list_keys_parallel(alphabet="0123456789")))
+
+
+class columns(FakeDataStoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        for index in range(120):
+            self.store.entries[("global", f"key-{index:03}")] = (0, 1)
+
+    def test_list_keys_columns(self):
+        columns = self.experience.get_datastore("store").list_keys_columns(
+            limit=110
+        )
+
+        self.assertEqual(len(columns), 110)
+        self.assertEqual(columns.keys[-1], "key-109")
+        self.assertIs(columns.scopes[0], columns.scopes[-1])
+        self.assertIsNone(columns.values)
+
+    def test_sort_keys_columns_sink(self):
+        self.server.responses[
+            "ordered-data-stores/v1/universes/0/orderedDataStores/board/scopes"
+            "/global/entries"
+        ] = [
+            (
+                200,
+                {},
+                {
+                    "entries": [
+                        {"id": "a", "value": "30"},
+                        {"id": "b", "value": 20},
+                    ],
+                    "nextPageToken": "1",
+                },
+            ),
+            (200, {}, {"entries": [{"id": "c", "value": 10}]}),
+        ]
+        pages = []
+
+        result = self.experience.get_ordered_datastore(
+            "board"
+        ).sort_keys_columns(sink=pages.append)
+
+        self.assertIsNone(result)
+        self.assertEqual([len(page) for page in pages], [2, 1])
+
+        columns = rblxopencloud.EntryColumns()
+        for page in pages:
+            columns.extend(page)
+
+        self.assertEqual(columns.keys, ["a", "b", "c"])
+        self.assertEqual(list(columns.values), [30, 20, 10])
+
+
+class async_get_entries(AsyncFakeDataStoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.datastore = self.experience.get_datastore("store")
+
+        for index in range(20):
+            self.store.entries[("global", str(index))] = (index, 1)
+
+    async def test_preserves_order(self):
+        keys = [str(index) for index in range(20)] + ["missing"]
+
+        results = [
+            result
+            async for result in self.datastore.get_entries(keys, concurrency=4)
+        ]
+
+        self.assertEqual([key for key, _ in results], keys)
+        self.assertEqual(results[5][1][0], 5)
+        self.assertIsInstance(results[-1][1], rblxopencloudasync.NotFound)
+
+
+class async_increment_buffer(AsyncFakeDataStoreTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.datastore = self.experience.get_datastore("store")
+
+    async def test_requeues_are_capped(self):
+        async def transport(method, url, headers, **kwargs):
+            raise ConnectionError("connection reset")
+
+        self.client.transport = transport
+
+        async with rblxopencloudasync.IncrementBuffer(
+            self.datastore, flush_interval_seconds=60, max_attempts=2
+        ) as buffer:
+            future = buffer.increment("visits", 2)
+            await buffer.flush()
+
+            self.assertFalse(future.done())
+
+            await buffer.flush()
+
+            self.assertIsInstance(future.exception(), ConnectionError)
+
+    def test_flushes_when_event_loop_stops(self):
+        async def increment():
+            client = rblxopencloudasync.Client(base_url=self.server.base_url)
+            buffer = rblxopencloudasync.IncrementBuffer(
+                rblxopencloudasync.Experience(
+                    0, "key", client=client
+                ).get_datastore("store"),
+                flush_interval_seconds=60,
+            )
+            return client, buffer.increment("visits", 3)
+
+        client, future = asyncio.run(increment())
+        asyncio.run(client.close())
+
+        self.assertEqual(future.result(), 3)
+        self.assertEqual(self.store.entries[("global", "visits")], (3, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
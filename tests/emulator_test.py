@@ -0,0 +1,157 @@
+import asyncio
+import unittest
+
+import rblxopencloud
+import rblxopencloudasync
+
+PATH = "datastores/v1/universes/0/standard-datastores/datastore/entries"
+
+
+class emulator(unittest.TestCase):
+
+    def setUp(self):
+        self.emulator = rblxopencloud.Emulator()
+        self.client = rblxopencloud.Client(base_url=self.emulator.base_url)
+        self.experience = rblxopencloud.Experience(
+            0, "key", client=self.client
+        )
+
+    def tearDown(self):
+        self.emulator.close()
+        self.client.close()
+
+    def test_datastore_entries(self):
+        datastore = self.experience.get_datastore("players")
+
+        version = datastore.set_entry("1", {"coins": 10}, users=[1])
+        value, info = datastore.get_entry("1")
+
+        self.assertEqual(value, {"coins": 10})
+        self.assertEqual(info.version, version.version)
+        self.assertEqual(info.users, [1])
+        self.assertEqual(datastore.increment_entry("2", 5)[0], 5)
+        self.assertEqual(
+            [entry.key for entry in datastore.list_keys()], ["1", "2"]
+        )
+
+        with self.assertRaises(rblxopencloud.PreconditionFailed):
+            datastore.set_entry("1", {}, exclusive_create=True)
+
+        datastore.remove_entry("1")
+
+        with self.assertRaises(rblxopencloud.NotFound):
+            datastore.get_entry("1")
+        self.assertEqual(len(list(datastore.list_versions("1"))), 2)
+
+    def test_ordered_datastore(self):
+        datastore = self.experience.get_ordered_datastore("points")
+
+        datastore.set_entry("a", 5)
+        datastore.set_entry("b", 9)
+        datastore.increment_entry("a", 10)
+
+        self.assertEqual(
+            [(entry.key, entry.value) for entry in datastore.sort_keys()],
+            [("a", 15), ("b", 9)],
+        )
+        self.assertEqual(
+            [entry.key for entry in datastore.sort_keys(max=10)], ["b"]
+        )
+
+    def test_memory_store(self):
+        sorted_map = self.experience.get_sorted_map("matches")
+        sorted_map.set_key("a", 1, 60, sort_key=2)
+        sorted_map.set_key("b", 2, 60, sort_key=1)
+
+        self.assertEqual(
+            [entry.key for entry in sorted_map.list_keys()], ["b", "a"]
+        )
+
+        with self.assertRaises(rblxopencloud.PreconditionFailed):
+            sorted_map.set_key("a", 3, 60, exclusive_create=True)
+
+        queue = self.experience.get_memory_store_queue("jobs")
+        queue.add_item("low", 60)
+        queue.add_item("high", 60, priority=1)
+
+        values, read_id = queue.read_items(count=2)
+        self.assertEqual(values, ["high", "low"])
+
+        queue.remove_items(read_id)
+        self.assertEqual(queue.read_items(), ([], None))
+
+        self.assertTrue(self.experience.flush_memory_store().wait())
+        self.assertEqual(list(sorted_map.list_keys()), [])
+
+    def test_messaging(self):
+        self.experience.publish_message("announcements", "hello")
+
+        self.assertEqual(
+            self.emulator.messages, [(0, "announcements", "hello")]
+        )
+
+    def test_secrets(self):
+        self.experience.create_secret("token", "value")
+        secret = self.experience.update_secret(
+            "token", "new value", domain="*.example.com"
+        )
+
+        self.assertEqual(secret.domain, "*.example.com")
+        self.assertEqual(
+            [secret.id for secret in self.experience.list_secrets()],
+            ["token"],
+        )
+
+        self.experience.delete_secret("token")
+        self.assertEqual(list(self.experience.list_secrets()), [])
+
+    def test_rate_limit(self):
+        self.emulator.rate_limit = 2
+
+        statuses = [
+            self.client.session.get(
+                f"{self.emulator.base_url}{PATH}",
+                params={"datastoreName": "players"},
+                headers={"x-api-key": "key"},
+            )
+            for _ in range(3)
+        ]
+
+        self.assertEqual([r.status_code for r in statuses], [200, 200, 429])
+        self.assertEqual(statuses[0].headers["x-ratelimit-remaining"], "1")
+        self.assertIn("Retry-After", statuses[2].headers)
+
+    def test_error_rate(self):
+        self.emulator.error_rate = 1
+
+        with self.assertRaises(rblxopencloud.HttpException) as context:
+            rblxopencloud.send_request(
+                "GET",
+                PATH,
+                "key",
+                expected_status=[200],
+                retry_max_attempts=0,
+                client=self.client,
+            )
+
+        self.assertEqual(context.exception.status_code, 503)
+
+    def test_async_client(self):
+        async def run():
+            async with rblxopencloudasync.Client(
+                base_url=self.emulator.base_url
+            ) as client:
+                experience = rblxopencloudasync.Experience(
+                    0, "key", client=client
+                )
+                datastore = experience.get_datastore("players")
+
+                await datastore.set_entry("1", 10)
+                return await datastore.get_entry("1")
+
+        value, _ = asyncio.run(run())
+        self.assertEqual(value, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,223 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from typing import Any, Callable
+import unittest
+import urllib.parse
+
+import rblxopencloud
+import rblxopencloudasync
+
+
+class FakeServer:
+    """
+    A loopback HTTP server which replies to each path with queued responses, \
+    or by calling a handler registered for the path with the query params \
+    and JSON body. Falls back to `200 {}` once a path's queue is empty.
+    """
+
+    def __init__(self) -> None:
+        self.responses: dict[str, list[tuple[int, dict, dict]]] = {}
+        self.handlers: dict[str, Callable[[str, dict, Any], tuple]] = {}
+        self.requests: list[tuple[str, str, float]] = []
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                url = urllib.parse.urlparse(self.path)
+                path = url.path.lstrip("/")
+                server.requests.append((self.command, path, time.monotonic()))
+
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = self.rfile.read(length) if length else b""
+
+                queued = server.responses.get(path)
+                if queued:
+                    status, headers, body = queued.pop(0)
+                elif path in server.handlers:
+                    status, headers, body = server.handlers[path](
+                        self.command,
+                        dict(urllib.parse.parse_qsl(url.query)),
+                        json.loads(payload) if payload else None,
+                    )
+                else:
+                    status, headers, body = 200, {}, {}
+
+                content = json.dumps(body).encode() if status != 204 else b""
+                self.send_response(status)
+                if content:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                for header, value in headers.items():
+                    self.send_header(header, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_POST = do_PATCH = do_DELETE = do_GET
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_port}/"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FakeDataStore:
+    """
+    Serves the standard data store entry endpoints of a single data store \
+    from `entries`, which maps `(scope, key)` to `(value, version)`.
+    """
+
+    TIMESTAMP = "2024-01-01T00:00:00.0000000Z"
+
+    def __init__(self, server: FakeServer, universe_id: int = 0) -> None:
+        self.entries: dict[tuple[str, str], tuple[Any, int]] = {}
+        self.removed: dict[tuple[str, str], int] = {}
+        self.lock = threading.Lock()
+
+        path = f"datastores/v1/universes/{universe_id}/standard-datastores\
+/datastore/entries"
+        server.handlers[path] = self.list_keys
+        server.handlers[f"{path}/entry"] = self.entry
+        server.handlers[f"{path}/entry/increment"] = self.increment
+        server.handlers[f"{path}/versions"] = self.list_versions
+
+    def headers(self, version: int) -> dict:
+        return {
+            "roblox-entry-version": str(version),
+            "roblox-entry-created-time": self.TIMESTAMP,
+            "roblox-entry-version-created-time": self.TIMESTAMP,
+        }
+
+    def version(self, version: int) -> dict:
+        return {
+            "version": str(version),
+            "deleted": False,
+            "contentLength": 1,
+            "createdTime": self.TIMESTAMP,
+            "objectCreatedTime": self.TIMESTAMP,
+        }
+
+    def list_keys(self, method: str, params: dict, body: Any) -> tuple:
+        with self.lock:
+            keys = [
+                {"scope": scope, "key": key}
+                for scope, key in sorted(self.entries)
+                if key.startswith(params.get("prefix", ""))
+                and (
+                    params.get("AllScopes", "").lower() == "true"
+                    or scope == params.get("scope")
+                )
+            ]
+
+        start = int(params.get("cursor") or 0)
+        end = start + int(params.get("limit") or 50)
+        return (
+            200,
+            {},
+            {
+                "keys": keys[start:end],
+                "nextPageCursor": str(end) if end < len(keys) else "",
+            },
+        )
+
+    def entry(self, method: str, params: dict, body: Any) -> tuple:
+        key = (params["scope"], params["entryKey"])
+
+        with self.lock:
+            current = self.entries.get(key)
+
+            if method == "DELETE":
+                if current:
+                    self.removed[key] = current[1] + 1
+                self.entries.pop(key, None)
+                return 204, {}, None
+
+            if method == "GET":
+                if not current:
+                    return 404, {}, {"error": "NOT_FOUND"}
+                return 200, self.headers(current[1]), current[0]
+
+            if (
+                params.get("exclusiveCreate", "").lower() == "true" and current
+            ) or (
+                params.get("matchVersion")
+                and (not current or str(current[1]) != params["matchVersion"])
+            ):
+                if not current:
+                    return 412, {}, None
+                return 412, self.headers(current[1]), current[0]
+
+            version = current[1] + 1 if current else 1
+            self.entries[key] = (body, version)
+            return 200, {}, self.version(version)
+
+    def list_versions(self, method: str, params: dict, body: Any) -> tuple:
+        key = (params["scope"], params["entryKey"])
+
+        with self.lock:
+            if key in self.entries:
+                version = self.version(self.entries[key][1])
+            elif key in self.removed:
+                version = {**self.version(self.removed[key]), "deleted": True}
+            else:
+                return 200, {}, {"versions": [], "nextPageCursor": ""}
+
+        return 200, {}, {"versions": [version], "nextPageCursor": ""}
+
+    def increment(self, method: str, params: dict, body: Any) -> tuple:
+        key = (params["scope"], params["entryKey"])
+
+        with self.lock:
+            value, version = self.entries.get(key, (0, 0))
+            self.entries[key] = (
+                value + json.loads(params["incrementBy"]),
+                version + 1,
+            )
+            return 200, self.headers(version + 1), self.entries[key][0]
+
+
+class FakeDataStoreTestCase(unittest.TestCase):
+    """
+    Starts a `FakeServer` with a `FakeDataStore` for every test, and creates \
+    `experience` for universe `0` with a client sending requests to it.
+    """
+
+    def setUp(self) -> None:
+        self.server = FakeServer()
+        self.store = FakeDataStore(self.server)
+        self.client = rblxopencloud.Client(base_url=self.server.base_url)
+        self.experience = rblxopencloud.Experience(
+            0, f"{type(self).__name__}-key", client=self.client
+        )
+
+    def tearDown(self) -> None:
+        self.client.close()
+        self.server.close()
+
+
+class AsyncFakeDataStoreTestCase(unittest.IsolatedAsyncioTestCase):
+    """
+    The `rblxopencloudasync` version of `FakeDataStoreTestCase`.
+    """
+
+    def setUp(self) -> None:
+        self.server = FakeServer()
+        self.store = FakeDataStore(self.server)
+        self.client = rblxopencloudasync.Client(base_url=self.server.base_url)
+        self.experience = rblxopencloudasync.Experience(
+            0, f"{type(self).__name__}-key", client=self.client
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+
+    def tearDown(self) -> None:
+        self.server.close()
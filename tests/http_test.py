@@ -0,0 +1,932 @@
+import asyncio
+import gc
+import gzip
+import os
+import tempfile
+import time
+import unittest
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from dateutil import parser
+from fake_server import FakeDataStore, FakeServer
+
+import rblxopencloud
+import rblxopencloudasync
+from rblxopencloud.utils import _parse_datetime
+
+PATH = "datastores/v1/universes/0/standard-datastores/datastore/entries"
+
+
+class rate_limiter(unittest.TestCase):
+
+    def test_unknown_family_is_not_delayed(self):
+        limiter = rblxopencloud.RateLimiter()
+
+        for _ in range(100):
+            self.assertEqual(limiter.reserve("key", "GET", PATH), 0)
+
+    def test_paces_after_learning_limits(self):
+        limiter = rblxopencloud.RateLimiter()
+        limiter.update(
+            "key",
+            "GET",
+            PATH,
+            {
+                "x-ratelimit-limit": "10, 10;w=1",
+                "x-ratelimit-remaining": "2",
+                "x-ratelimit-reset": "1",
+            },
+        )
+
+        delays = [limiter.reserve("key", "GET", PATH) for _ in range(4)]
+
+        self.assertEqual(delays[:2], [0, 0])
+        self.assertAlmostEqual(delays[2], 0.1, places=2)
+        self.assertAlmostEqual(delays[3], 0.2, places=2)
+
+    def test_limits_are_per_key_and_family(self):
+        limiter = rblxopencloud.RateLimiter()
+        limiter.update(
+            "key",
+            "GET",
+            PATH,
+            {"x-ratelimit-limit": "1;w=60", "x-ratelimit-remaining": "0"},
+        )
+
+        self.assertGreater(limiter.reserve("key", "GET", PATH), 0)
+        self.assertEqual(limiter.reserve("other-key", "GET", PATH), 0)
+        self.assertEqual(limiter.reserve("key", "POST", PATH), 0)
+
+    def test_penalize_blocks_family(self):
+        limiter = rblxopencloud.RateLimiter()
+        limiter.penalize("key", "GET", PATH, 5)
+
+        self.assertGreater(limiter.reserve("key", "GET", PATH), 4)
+
+
+class parse_datetime(unittest.TestCase):
+
+    def test_matches_dateutil(self):
+        for timestamp in (
+            "2024-01-01T00:00:00.0000000Z",
+            "2023-05-06T07:08:09Z",
+            "2023-05-06T07:08:09.123+05:30",
+            "2023-05-06T07:08:09-08:00",
+            "2023-05-06 07:08:09",
+            "Sat, 06 May 2023 07:08:09 GMT",
+        ):
+            parsed = _parse_datetime(timestamp)
+            expected = parser.parse(timestamp)
+
+            self.assertEqual(parsed, expected)
+            self.assertEqual(parsed.utcoffset(), expected.utcoffset())
+
+
+class RecordingCodec(rblxopencloud.JSONCodec):
+
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append("dumps")
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.calls.append("loads")
+        return super().loads(data)
+
+
+class json_codecs(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeServer()
+        self.server.handlers["echo"] = lambda method, params, body: (
+            200,
+            {},
+            body,
+        )
+        self.codec = rblxopencloud.http.json_codec
+        self.async_codec = rblxopencloudasync.http.json_codec
+
+    def tearDown(self):
+        rblxopencloud.http.json_codec = self.codec
+        rblxopencloudasync.http.json_codec = self.async_codec
+        self.server.close()
+
+    def test_codec_encodes_and_decodes_bodies(self):
+        codec = RecordingCodec()
+        rblxopencloud.http.json_codec = codec
+
+        with rblxopencloud.Client(base_url=self.server.base_url) as client:
+            _, body, _ = rblxopencloud.send_request(
+                "POST", "echo", json={"value": [1, 2]}, client=client
+            )
+
+        self.assertEqual(body, {"value": [1, 2]})
+        self.assertEqual(codec.calls, ["dumps", "loads"])
+
+    @unittest.skipIf(rblxopencloud.http.orjson is None, "needs orjson")
+    def test_orjson_codec_falls_back(self):
+        codec = rblxopencloud.OrjsonCodec()
+
+        for value in ({"a": [1, 2.5, None]}, {1: "a"}, 2**70):
+            self.assertEqual(
+                rblxopencloud.JSONCodec().loads(codec.dumps(value)),
+                rblxopencloud.JSONCodec().loads(
+                    rblxopencloud.JSONCodec().dumps(value)
+                ),
+            )
+
+        self.assertEqual(codec.loads(b"[18446744073709551616]"), [2**64])
+
+    @unittest.skipIf(rblxopencloud.http.orjson is None, "needs orjson")
+    def test_metadata_headers_stay_ascii_with_orjson(self):
+        rblxopencloud.http.json_codec = rblxopencloud.OrjsonCodec()
+        rblxopencloudasync.http.json_codec = rblxopencloudasync.OrjsonCodec()
+        FakeDataStore(self.server)
+        metadata, sent = {"emoji": "\U0001f3ae", "name": "Jos\u00e9"}, []
+
+        def transport(method, url, headers, **kwargs):
+            sent.append(headers)
+            return client.request(method, url, headers, **kwargs)
+
+        async def async_transport(method, url, headers, **kwargs):
+            sent.append(headers)
+            return await async_client.request(method, url, headers, **kwargs)
+
+        client = rblxopencloud.Client(
+            base_url=self.server.base_url, transport=transport
+        )
+        datastore = rblxopencloud.Experience(
+            0, "key", client=client
+        ).get_datastore("store")
+        datastore.set_entry("1", 1, metadata=metadata)
+        datastore.increment_entry("1", 1, metadata=metadata)
+        client.unbind("key")
+        client.close()
+
+        async def run():
+            nonlocal async_client
+            async_client = rblxopencloudasync.Client(
+                base_url=self.server.base_url, transport=async_transport
+            )
+            datastore = rblxopencloudasync.Experience(
+                0, "key", client=async_client
+            ).get_datastore("store")
+            await datastore.set_entry("1", 1, metadata=metadata)
+            await datastore.increment_entry("1", 1, metadata=metadata)
+            async_client.unbind("key")
+            await async_client.close()
+
+        async_client = None
+        asyncio.run(run())
+
+        self.assertEqual(len(sent), 4)
+        for headers in sent:
+            value = headers["roblox-entry-attributes"]
+            self.assertTrue(value.isascii(), value)
+            self.assertEqual(rblxopencloud.JSONCodec().loads(value), metadata)
+
+
+class async_retries(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = FakeServer()
+        self.base_url = rblxopencloudasync.http.base_url
+        rblxopencloudasync.http.base_url = self.server.base_url
+
+    async def asyncTearDown(self):
+        rblxopencloudasync.http.base_url = self.base_url
+        await rblxopencloudasync.http.default_client.close()
+
+    def tearDown(self):
+        self.server.close()
+
+    async def test_backoff_does_not_block_event_loop(self):
+        self.server.responses["slow"] = [(503, {}, {})]
+
+        started = time.monotonic()
+        slow = asyncio.create_task(
+            rblxopencloudasync.send_request(
+                "GET", "slow", expected_status=[200], retry_interval_seconds=1
+            )
+        )
+        await asyncio.sleep(0.1)
+
+        for _ in range(5):
+            status, _, _ = await rblxopencloudasync.send_request(
+                "GET", "fast", expected_status=[200]
+            )
+            self.assertEqual(status, 200)
+
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertFalse(slow.done())
+
+        status, _, _ = await slow
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            [path for _, path, _ in self.server.requests].count("slow"), 2
+        )
+
+    async def test_retry_deadline(self):
+        self.server.responses["broken"] = [(503, {}, {})] * 3
+
+        with self.assertRaises(rblxopencloudasync.HttpException):
+            await rblxopencloudasync.send_request(
+                "GET",
+                "broken",
+                expected_status=[200],
+                retry_interval_seconds=5,
+                retry_deadline_seconds=1,
+            )
+
+        self.assertEqual(len(self.server.requests), 1)
+
+    async def test_backoff_is_cancellable(self):
+        self.server.responses["broken"] = [(503, {}, {})] * 3
+
+        task = asyncio.create_task(
+            rblxopencloudasync.send_request(
+                "GET",
+                "broken",
+                expected_status=[200],
+                retry_interval_seconds=5,
+            )
+        )
+        await asyncio.sleep(0.2)
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        self.assertEqual(len(self.server.requests), 1)
+
+    async def test_rate_limited_retry(self):
+        self.server.responses["limited"] = [(429, {"Retry-After": "0.2"}, {})]
+
+        status, _, _ = await rblxopencloudasync.send_request(
+            "GET", "limited", expected_status=[200]
+        )
+
+        self.assertEqual(status, 200)
+        self.assertGreaterEqual(
+            self.server.requests[1][2] - self.server.requests[0][2], 0.2
+        )
+
+
+class clients(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeServer()
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_bound_api_key_uses_client(self):
+        client = rblxopencloud.Client(
+            pool_size=4, base_url=self.server.base_url
+        )
+        client.bind("bound-key")
+
+        status, _, _ = rblxopencloud.send_request(
+            "GET", "bound", authorization="bound-key", expected_status=[200]
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(self.server.requests[0][1], "bound")
+
+        client.unbind("bound-key")
+        client.close()
+
+    def test_close_releases_bindings(self):
+        client = rblxopencloud.Client(base_url=self.server.base_url)
+        client.bind("closed-key")
+        client.close()
+
+        self.assertNotIn("closed-key", rblxopencloud.http._bound_clients)
+
+        rblxopencloud.Client().bind("collected-key")
+        gc.collect()
+
+        self.assertNotIn("collected-key", rblxopencloud.http._bound_clients)
+
+    def test_objects_use_their_client_without_binding(self):
+        client = rblxopencloud.Client(base_url=self.server.base_url)
+        experience = rblxopencloud.ApiKey(
+            "unbound-key", client=client
+        ).get_experience(0)
+        datastore = experience.get_datastore("store")
+
+        self.assertNotIn("unbound-key", rblxopencloud.http._bound_clients)
+
+        # the objects keep the client alive once the key object is gone
+        self.server.responses[f"{PATH}/entry"] = [(204, {}, {})]
+        del client
+        gc.collect()
+        datastore.remove_entry("key")
+
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_access_tokens_are_not_bound(self):
+        client = rblxopencloud.Client(base_url=self.server.base_url)
+        app = rblxopencloud.OAuth2App(0, "secret", "", client=client)
+        self.server.responses["oauth/v1/token/resources"] = [
+            (
+                200,
+                {},
+                {
+                    "resource_infos": [
+                        {
+                            "owner": {"id": "1", "type": "User"},
+                            "resources": {
+                                "universe": {"ids": ["2"]},
+                                "creator": {"ids": ["U"]},
+                            },
+                        }
+                    ]
+                },
+            )
+        ]
+
+        resources = rblxopencloud.PartialAccessToken(
+            app, "token"
+        ).fetch_resources()
+        self.server.responses[PATH.replace("/0/", "/2/") + "/entry"] = [
+            (204, {}, {})
+        ]
+        resources.experiences[0].get_datastore("store").remove_entry("key")
+        del resources
+        gc.collect()
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertFalse(
+            any(
+                key.startswith("Bearer ")
+                for key in rblxopencloud.http._bound_clients
+            )
+        )
+
+        with self.assertRaises(ValueError):
+            client.bind("Bearer token")
+
+        client.close()
+
+    def test_explicit_client(self):
+        with rblxopencloud.Client(base_url=self.server.base_url) as client:
+            status, _, _ = rblxopencloud.send_request(
+                "GET", "explicit", expected_status=[200], client=client
+            )
+
+        self.assertEqual(status, 200)
+        self.assertEqual(len(self.server.requests), 1)
+
+
+class transports(unittest.TestCase):
+
+    def test_transport_replaces_session(self):
+        calls = []
+
+        def transport(method, url, headers, **kwargs):
+            calls.append((method, url, kwargs))
+            return rblxopencloud.TransportResponse(
+                200, {"content-type": "application/json"}, b'{"a": 1}'
+            )
+
+        client = rblxopencloud.Client(
+            base_url="http://fake/", transport=transport
+        )
+        status, body, headers = rblxopencloud.send_request(
+            "POST",
+            "path",
+            params={"a": True, "b": None},
+            data={"grant_type": "code"},
+            expected_status=[200],
+            client=client,
+        )
+
+        self.assertEqual((status, body), (200, {"a": 1}))
+        self.assertEqual(headers["Content-Type"], "application/json")
+        self.assertEqual(calls[0][:2], ("POST", "http://fake/path"))
+        self.assertEqual(calls[0][2]["params"], {"a": True})
+        self.assertEqual(calls[0][2]["data"], b"grant_type=code")
+
+    def test_transport_can_wrap_client_request(self):
+        server = FakeServer()
+        urls = []
+
+        def transport(method, url, headers, **kwargs):
+            urls.append(url)
+            return client.request(method, url, headers, **kwargs)
+
+        client = rblxopencloud.Client(
+            base_url=server.base_url, transport=transport
+        )
+        status, _, _ = rblxopencloud.send_request(
+            "GET", "wrapped", expected_status=[200], client=client
+        )
+
+        self.assertEqual(status, 200)
+        self.assertEqual(urls, [f"{server.base_url}wrapped"])
+        self.assertEqual(server.requests[0][1], "wrapped")
+
+        client.close()
+        server.close()
+
+    def test_async_transport(self):
+        async def transport(method, url, headers, **kwargs):
+            return rblxopencloudasync.TransportResponse(
+                503 if not attempts else 200, {}, b"ok"
+            )
+
+        attempts = []
+
+        async def run():
+            client = rblxopencloudasync.Client(transport=transport)
+            status, body, _ = await rblxopencloudasync.send_request(
+                "GET",
+                "path",
+                expected_status=[200],
+                retry_max_attempts=0,
+                client=client,
+            )
+            return status, body
+
+        with self.assertRaises(rblxopencloudasync.HttpException):
+            asyncio.run(run())
+
+        attempts.append(1)
+        self.assertEqual(asyncio.run(run()), (200, "ok"))
+
+
+class cassettes(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "traffic.jsonl.gz")
+
+        emulator = rblxopencloud.Emulator()
+        client = rblxopencloud.Client(base_url=emulator.base_url)
+
+        with rblxopencloud.Cassette(self.path, record=True) as cassette:
+            client.transport = cassette
+            datastore = rblxopencloud.Experience(
+                0, "secret-key", client=client
+            ).get_datastore("players")
+
+            for index in range(5):
+                datastore.set_entry(f"key-{index}", index)
+            self.keys = [
+                entry.key for entry in datastore.list_keys(limit=None)
+            ]
+
+        client.close()
+        emulator.close()
+
+    def test_records_compact_redacted_file(self):
+        with open(self.path, "rb") as file:
+            content = file.read()
+
+        self.assertEqual(content[:2], b"\x1f\x8b")
+        self.assertNotIn(b"secret-key", content)
+
+        interactions = rblxopencloud.Cassette(self.path).interactions
+        self.assertEqual(len(interactions), 6)
+        self.assertEqual(
+            interactions[0]["api_key"],
+            rblxopencloud.http._key_fingerprint("secret-key"),
+        )
+
+    def test_redacts_token_exchange(self):
+        tokens = {
+            "access_token": "access-secret",
+            "refresh_token": "refresh-secret",
+            "id_token": "id-secret",
+            "token_type": "Bearer",
+            "expires_in": 899,
+        }
+        responses = [
+            rblxopencloud.TransportResponse(
+                200,
+                {"content-type": "application/json"},
+                rblxopencloud.JSONCodec().dumps(tokens).encode(),
+            ),
+            rblxopencloud.TransportResponse(
+                200,
+                {"content-type": "application/x-www-form-urlencoded"},
+                urllib.parse.urlencode(tokens).encode(),
+            ),
+        ]
+
+        with rblxopencloud.Cassette(
+            self.path,
+            record=True,
+            transport=lambda *args, **kwargs: responses.pop(0),
+        ) as cassette:
+            client = rblxopencloud.Client(transport=cassette)
+
+            bodies = [
+                rblxopencloud.send_request(
+                    "POST",
+                    "oauth/v1/token",
+                    data={
+                        "client_secret": "client-secret",
+                        "grant_type": "authorization_code",
+                        "code": "code-secret",
+                    },
+                    expected_status=[200],
+                    client=client,
+                )[1]
+                for _ in range(2)
+            ]
+
+        # only the file is redacted, the caller still receives the tokens
+        self.assertEqual(bodies[0]["access_token"], "access-secret")
+
+        with gzip.open(self.path, "rb") as file:
+            content = file.read()
+
+        self.assertNotIn(b"-secret", content)
+
+        replayed = rblxopencloud.Cassette(self.path).interactions
+        json_body = rblxopencloud.JSONCodec().loads(replayed[0]["body"])
+        form_body = dict(urllib.parse.parse_qsl(replayed[1]["body"]))
+
+        for body in (json_body, form_body):
+            self.assertEqual(body["refresh_token"], "REDACTED")
+            self.assertEqual(body["token_type"], "Bearer")
+            self.assertEqual(str(body["expires_in"]), "899")
+
+    def test_replays_in_order(self):
+        client = rblxopencloud.Client(
+            base_url="http://replay/",
+            transport=rblxopencloud.Cassette(self.path, latency_scale=0),
+        )
+        datastore = rblxopencloud.Experience(
+            0, "other-key", client=client
+        ).get_datastore("players")
+
+        for index in range(5):
+            datastore.set_entry(f"key-{index}", index)
+        self.assertEqual([e.key for e in datastore.list_keys()], self.keys)
+
+        with self.assertRaises(rblxopencloud.UnmatchedRequest):
+            datastore.set_entry("key-0", 0)
+
+    def test_replays_gaps_between_requests(self):
+        response = rblxopencloud.TransportResponse(200, {}, b"{}")
+
+        with rblxopencloud.Cassette(
+            self.path, record=True, transport=lambda *args, **kwargs: response
+        ) as cassette:
+            client = rblxopencloud.Client(transport=cassette)
+            rblxopencloud.send_request("GET", "first", client=client)
+            time.sleep(0.3)
+            rblxopencloud.send_request("GET", "second", client=client)
+
+        client = rblxopencloud.Client(
+            transport=rblxopencloud.Cassette(self.path)
+        )
+        started = time.monotonic()
+        rblxopencloud.send_request("GET", "first", client=client)
+        rblxopencloud.send_request("GET", "second", client=client)
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.3)
+
+    def test_async_replay(self):
+        async def run():
+            client = rblxopencloudasync.Client(
+                transport=rblxopencloudasync.Cassette(
+                    self.path, latency_scale=0
+                )
+            )
+            datastore = rblxopencloudasync.Experience(
+                0, "other-key", client=client
+            ).get_datastore("players")
+
+            for index in range(5):
+                await datastore.set_entry(f"key-{index}", index)
+            return [entry.key async for entry in datastore.list_keys()]
+
+        self.assertEqual(asyncio.run(run()), self.keys)
+
+
+class coalescing(unittest.TestCase):
+
+    def setUp(self):
+        self.emulator = rblxopencloud.Emulator()
+        with rblxopencloud.Client(base_url=self.emulator.base_url) as client:
+            rblxopencloud.Experience(0, "key", client=client).get_datastore(
+                "players"
+            ).set_entry("1", {"coins": 10})
+
+        self.emulator.latency_seconds = 0.2
+        self.emulator.requests = 0
+
+    def tearDown(self):
+        self.emulator.close()
+
+    def test_identical_gets_share_a_request(self):
+        client = rblxopencloud.Client(
+            base_url=self.emulator.base_url, coalesce_requests=True
+        )
+        datastore = rblxopencloud.Experience(
+            0, "key", client=client
+        ).get_datastore("players")
+
+        with ThreadPoolExecutor(5) as executor:
+            results = list(
+                executor.map(lambda _: datastore.get_entry("1"), range(5))
+            )
+
+        self.assertEqual(self.emulator.requests, 1)
+        self.assertTrue(all(value == {"coins": 10} for value, _ in results))
+        self.assertEqual(len({id(value) for value, _ in results}), 5)
+
+        datastore.get_entry("1")
+        self.assertEqual(self.emulator.requests, 2)
+        client.close()
+
+    def test_waiters_get_their_own_headers_and_exceptions(self):
+        client = rblxopencloud.Client(
+            base_url=self.emulator.base_url, coalesce_requests=True
+        )
+
+        def get(key):
+            try:
+                return rblxopencloud.send_request(
+                    "GET",
+                    f"{PATH}/entry",
+                    authorization="key",
+                    params={"datastoreName": "players", "entryKey": key},
+                    expected_status=[200],
+                    client=client,
+                )
+            except rblxopencloud.NotFound as error:
+                return error
+
+        with ThreadPoolExecutor(5) as executor:
+            found = list(executor.map(get, ["1"] * 5))
+        with ThreadPoolExecutor(5) as executor:
+            missing = list(executor.map(get, ["2"] * 5))
+
+        self.assertEqual(self.emulator.requests, 2)
+        self.assertEqual(len({id(headers) for _, _, headers in found}), 5)
+        self.assertTrue(
+            all(isinstance(error, rblxopencloud.NotFound) for error in missing)
+        )
+        self.assertEqual(len({id(error) for error in missing}), 5)
+        self.assertEqual(
+            {(error.status_code, str(error)) for error in missing},
+            {(404, str(missing[0]))},
+        )
+        client.close()
+
+    def test_async_identical_gets_share_a_request(self):
+        async def run():
+            async with rblxopencloudasync.Client(
+                base_url=self.emulator.base_url, coalesce_requests=True
+            ) as client:
+                datastore = rblxopencloudasync.Experience(
+                    0, "key", client=client
+                ).get_datastore("players")
+
+                return await asyncio.gather(
+                    *(datastore.get_entry("1") for _ in range(5)),
+                    datastore.get_entry("2"),
+                    return_exceptions=True,
+                )
+
+        results = asyncio.run(run())
+
+        self.assertEqual(self.emulator.requests, 2)
+        self.assertEqual(
+            [value for value, _ in results[:5]], [{"coins": 10}] * 5
+        )
+        self.assertIsInstance(results[5], rblxopencloudasync.NotFound)
+
+
+class RecordingHook(rblxopencloud.RequestHook):
+
+    def __init__(self):
+        self.events = []
+
+    def pre_request(self, event):
+        self.events.append(("pre_request", event.attempt, event.status))
+
+    def post_response(self, event):
+        self.events.append(("post_response", event.attempt, event.status))
+
+    def retry(self, event):
+        self.events.append(("retry", event.attempt, event.status))
+
+    def rate_limited(self, event):
+        self.events.append(("rate_limited", event.attempt, event.status))
+
+
+class hooks(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeServer()
+        self.hook = RecordingHook()
+        self.metrics = rblxopencloud.MetricsCollector(latency_buckets=[60])
+        self.client = rblxopencloud.Client(
+            base_url=self.server.base_url,
+            rate_limiter=None,
+            hooks=[self.hook, self.metrics],
+        )
+
+    def tearDown(self):
+        self.client.close()
+        self.server.close()
+
+    def test_hooks_receive_each_attempt(self):
+        path = "cloud/v2/universes/1/places/2"
+        self.server.responses[path] = [
+            (503, {}, {}),
+            (429, {"Retry-After": "0"}, {}),
+        ]
+
+        rblxopencloud.send_request(
+            "GET",
+            path,
+            authorization="key",
+            expected_status=[200],
+            retry_interval_seconds=0,
+            client=self.client,
+        )
+
+        self.assertEqual(
+            self.hook.events,
+            [
+                ("pre_request", 0, None),
+                ("post_response", 0, 503),
+                ("retry", 0, 503),
+                ("pre_request", 1, None),
+                ("post_response", 1, 429),
+                ("rate_limited", 1, 429),
+                ("pre_request", 2, None),
+                ("post_response", 2, 200),
+            ],
+        )
+
+    def test_hook_exceptions_are_logged(self):
+        class BrokenHook(rblxopencloud.RequestHook):
+            def pre_request(self, event):
+                raise ValueError("broken")
+
+        self.client.hooks.insert(0, BrokenHook())
+
+        with self.assertLogs("rblxopencloud.http", "ERROR") as logs:
+            status, _, _ = rblxopencloud.send_request(
+                "GET", "path", expected_status=[200], client=self.client
+            )
+
+        self.assertEqual(status, 200)
+        self.assertIn("ValueError: broken", logs.output[0])
+        self.assertEqual(self.hook.events[0], ("pre_request", 0, None))
+
+        async def transport(method, url, headers, **kwargs):
+            return rblxopencloudasync.TransportResponse(200, {}, b"ok")
+
+        async def run():
+            client = rblxopencloudasync.Client(
+                transport=transport, hooks=[BrokenHook()]
+            )
+            status, _, _ = await rblxopencloudasync.send_request(
+                "GET", "path", expected_status=[200], client=client
+            )
+            return status
+
+        with self.assertLogs("rblxopencloudasync.http", "ERROR"):
+            self.assertEqual(asyncio.run(run()), 200)
+
+    def test_metrics_render_prometheus(self):
+        self.server.responses["cloud/v2/universes/1"] = [(503, {}, {})]
+
+        for path in ("cloud/v2/universes/1", "cloud/v2/universes/2"):
+            rblxopencloud.send_request(
+                "POST",
+                path,
+                json={"a": 1},
+                retry_interval_seconds=0,
+                expected_status=[200],
+                client=self.client,
+            )
+
+        labels = 'method="POST",route="cloud/v2/universes/{id}"'
+        body_size = len(rblxopencloud.http.json_codec.dumps({"a": 1}))
+        metrics = self.metrics.render_prometheus().splitlines()
+
+        for metric in (
+            f'requests_total{{{labels},status="200",api_key=""}} 2',
+            f"retries_total{{{labels}}} 1",
+            f"request_bytes_total{{{labels}}} {body_size * 3}",
+            f'request_duration_seconds_bucket{{{labels},le="60"}} 3',
+            f"request_duration_seconds_count{{{labels}}} 3",
+        ):
+            self.assertIn(f"rblxopencloud_{metric}", metrics)
+
+
+def queue_pages(server, path, pages):
+    server.responses[path] = [
+        (
+            200,
+            {},
+            {
+                "entries": page,
+                "nextPageCursor": (
+                    str(index + 1) if index + 1 < len(pages) else ""
+                ),
+            },
+        )
+        for index, page in enumerate(pages)
+    ]
+
+
+class pagination(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeServer()
+        self.client = rblxopencloud.Client(base_url=self.server.base_url)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.close()
+
+    def iterate(self, **kwargs):
+        return rblxopencloud.iterate_request(
+            "GET",
+            "pages",
+            expected_status=[200],
+            client=self.client,
+            data_key="entries",
+            cursor_key="cursor",
+            **kwargs,
+        )
+
+    def test_prefetch_yields_every_entry_in_order(self):
+        queue_pages(self.server, "pages", [[1, 2], [3, 4], [5]])
+
+        self.assertEqual(list(self.iterate(prefetch_pages=2)), [1, 2, 3, 4, 5])
+
+    def test_prefetch_fetches_ahead_of_consumer(self):
+        queue_pages(self.server, "pages", [[1], [2], [3], [4], [5]])
+
+        entries = self.iterate(prefetch_pages=2)
+        next(entries)
+        time.sleep(0.3)
+
+        self.assertEqual(len(self.server.requests), 4)
+        entries.close()
+
+    def test_prefetch_respects_max_yields(self):
+        queue_pages(self.server, "pages", [[1, 2], [3, 4], [5, 6]])
+
+        self.assertEqual(
+            list(self.iterate(prefetch_pages=1, max_yields=3)), [1, 2, 3]
+        )
+
+    def test_prefetch_raises_errors(self):
+        self.server.responses["pages"] = [
+            (200, {}, {"entries": [1], "nextPageCursor": "1"}),
+            (403, {}, {}),
+        ]
+
+        with self.assertRaises(rblxopencloud.Forbidden):
+            list(self.iterate(prefetch_pages=2))
+
+
+class async_pagination(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = FakeServer()
+        self.client = rblxopencloudasync.Client(base_url=self.server.base_url)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+    def tearDown(self):
+        self.server.close()
+
+    async def test_prefetch_yields_every_entry_in_order(self):
+        queue_pages(self.server, "pages", [[1, 2], [3, 4], [5]])
+
+        entries = [
+            entry
+            async for entry in rblxopencloudasync.iterate_request(
+                "GET",
+                "pages",
+                expected_status=[200],
+                client=self.client,
+                data_key="entries",
+                cursor_key="cursor",
+                prefetch_pages=2,
+            )
+        ]
+
+        self.assertEqual(entries, [1, 2, 3, 4, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
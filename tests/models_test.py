@@ -0,0 +1,151 @@
+import datetime
+import unittest
+import weakref
+
+import rblxopencloud
+import rblxopencloudasync
+
+TIMESTAMP = "2024-01-01T00:00:00.0000000Z"
+PARSED = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class Response(dict):
+    pass
+
+
+class lazy_attributes(unittest.TestCase):
+
+    def test_decodes_on_access(self):
+        for package in (rblxopencloud, rblxopencloudasync):
+            version = package.EntryVersion(
+                "1", False, 1, TIMESTAMP, None, None, "key", "global"
+            )
+            entry = package.SortedMapEntry(
+                {"id": "key", "value": 1, "etag": "", "expireTime": TIMESTAMP}
+            )
+            member = package.GroupMember(
+                {
+                    "user": "users/1",
+                    "role": "groups/2/roles/3",
+                    "createTime": TIMESTAMP,
+                    "updateTime": TIMESTAMP,
+                },
+                "key",
+            )
+            asset = package.InventoryAsset(
+                {
+                    "assetId": 1,
+                    "instanceId": 2,
+                    "inventoryItemAssetType": "HAT",
+                    "collectibleDetails": {"instanceState": "AVAILABLE"},
+                }
+            )
+            restriction = package.UserRestriction(
+                {
+                    "path": "universes/1/places/2/user-restrictions/3",
+                    "user": "users/3",
+                    "gameJoinRestriction": {
+                        "active": True,
+                        "displayReason": "",
+                        "privateReason": "",
+                        "excludeAltAccounts": False,
+                        "startTime": TIMESTAMP,
+                    },
+                },
+                "key",
+            )
+
+            self.assertEqual(version.created, PARSED)
+            self.assertIsNone(version.key_created)
+            self.assertEqual(entry.expires_at, PARSED)
+            self.assertEqual(member.group.id, 2)
+            self.assertEqual(member.joined_at, PARSED)
+            self.assertEqual(asset.type, package.InventoryAssetType.Hat)
+            self.assertEqual(
+                asset.collectable_state, package.InventoryItemState.Available
+            )
+            self.assertEqual(restriction.place.id, 2)
+            self.assertEqual(restriction.user.id, 3)
+            self.assertIsNone(restriction.issuer_user_id)
+            self.assertEqual(restriction.start_timestamp, PARSED)
+
+    def test_does_not_keep_response(self):
+        for package in (rblxopencloud, rblxopencloudasync):
+            responses = [
+                Response(id="key", value=1, etag="", expireTime=TIMESTAMP),
+                Response(
+                    user="users/1",
+                    role="groups/2/roles/3",
+                    createTime=TIMESTAMP,
+                    updateTime=TIMESTAMP,
+                ),
+                Response(
+                    assetId=1,
+                    instanceId=2,
+                    inventoryItemAssetType="HAT",
+                    collectibleDetails={"instanceState": "AVAILABLE"},
+                ),
+                Response(
+                    user="users/3",
+                    place="universes/1/places/2",
+                    moderator={"robloxUser": "users/4"},
+                    active=True,
+                    displayReason="",
+                    privateReason="",
+                    excludeAltAccounts=False,
+                    startTime=TIMESTAMP,
+                ),
+            ]
+            models = [
+                package.SortedMapEntry(responses[0]),
+                package.GroupMember(responses[1], "key"),
+                package.InventoryAsset(responses[2]),
+                package.UserRestriction(responses[3], "key"),
+            ]
+            references = [weakref.ref(response) for response in responses]
+            del responses
+
+            self.assertEqual(
+                [reference() for reference in references], [None] * 4
+            )
+
+            entry, member, asset, restriction = models
+            self.assertEqual(entry.expires_at, PARSED)
+            self.assertEqual(member.updated_at, PARSED)
+            self.assertEqual(asset.type, package.InventoryAssetType.Hat)
+            self.assertEqual(restriction.place.id, 2)
+            self.assertEqual(restriction.issuer_user_id, 4)
+            self.assertEqual(restriction.start_timestamp, PARSED)
+
+    def test_assignment_replaces_value(self):
+        version = rblxopencloud.EntryVersion(
+            "1", False, 1, TIMESTAMP, None, None, "key", "global"
+        )
+        version.created = None
+
+        self.assertIsNone(version.created)
+
+
+class slots(unittest.TestCase):
+
+    def test_models_have_no_instance_dict(self):
+        for package in (rblxopencloud, rblxopencloudasync):
+            for model in (
+                package.ListedEntry("key", "global"),
+                package.SortedEntry("key", 1),
+                package.EntryInfo("1", TIMESTAMP, TIMESTAMP, [], {}),
+                package.EntryVersion(
+                    "1", False, 1, TIMESTAMP, None, None, "key", "global"
+                ),
+                package.SortedMapEntry({"id": "key", "value": 1, "etag": ""}),
+                package.InventoryBadge({"badgeId": 1}),
+                package.Money("USD", 1.0),
+            ):
+                self.assertFalse(hasattr(model, "__dict__"), model)
+
+                with self.assertRaises(AttributeError):
+                    model.unknown_attribute = None
+
+
+if __name__ == "__main__":
+    unittest.main()